@@ -1,3 +1,11 @@
-from .agent import root_agent
+__all__ = ["root_agent"]
 
-__all__ = ["root_agent"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the agent graph lazily so that importing lightweight modules such
+    # as `multi_agent.models` or `multi_agent.score_cache` does not pull in ADK.
+    if name == "root_agent":
+        from .agent import root_agent
+
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,33 +1,72 @@
 import asyncio
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, AsyncIterator
 
 from google.adk.agents import LlmAgent
-from google.adk.tools import AgentTool, FunctionTool, ToolContext
+from google.adk.tools import AgentTool, BaseTool, FunctionTool, ToolContext
 from pydantic import BaseModel, Field
 
-from .sub_agents.berkus_analyst.agent import BerkusAnalystAgent
-from .sub_agents.bill_payne_analyst.agent import PayneAnalystAgent
+from .sub_agents.berkus_analyst.agent import BerkusAnalystAgent, BerkusModelAnalyst
+from .sub_agents.bill_payne_analyst.agent import PayneAnalystAgent, BillPayneModelAnalyst
 from .sub_agents.berkus_analyst.agent import StartupData as StartupDataBerkus
 from .sub_agents.bill_payne_analyst.agent import StartupDataPayne
 
-# Instantiate specialist agents
+ROOT_INSTRUCTION = """
+You are a manager agent responsible for delegating startup valuation requests.
+- If the user asks for a "full", "comprehensive", or "combined" valuation, or mentions both "Berkus" and "Bill Payne", use the `run_full_valuation` tool.
+- If the user requests only a Berkus model valuation, use the `berkus_analyst` tool.
+- If the user requests only a Bill Payne style valuation, use the `bill_payne_analyst` tool.
+"""
+
+
+# The agents are built on first use, so importing this module for
+# `value_startup` or `stream_valuation` does not construct the ADK agent graph.
 # NOTE: The specialist agents will inherit credentials from the root_agent at runtime.
-berkus_agent = BerkusAnalystAgent()
-payne_agent = PayneAnalystAgent()
+@lru_cache(maxsize=None)
+def get_berkus_agent() -> BerkusAnalystAgent:
+    return BerkusAnalystAgent()
 
-# Create a dictionary of tools for easy lookup by name.
-agent_tools = {
-    "berkus_analyst": AgentTool(agent=berkus_agent),
-    "bill_payne_analyst": AgentTool(agent=payne_agent),
+
+@lru_cache(maxsize=None)
+def get_payne_agent() -> PayneAnalystAgent:
+    return PayneAnalystAgent()
+
+
+@lru_cache(maxsize=None)
+def get_agent_tools() -> dict[str, BaseTool]:
+    """The root agent's tools by name."""
+    return {
+        "berkus_analyst": AgentTool(agent=get_berkus_agent()),
+        "bill_payne_analyst": AgentTool(agent=get_payne_agent()),
+        "run_full_valuation": FunctionTool(func=run_full_valuation),
+    }
+
+
+@lru_cache(maxsize=None)
+def get_root_agent() -> LlmAgent:
+    return LlmAgent(
+        name="multi_agent",
+        model="gemini-2.5-pro",
+        description="Manager agent that routes valuation requests to specialist agents (Berkus and Bill Payne).",
+        instruction=ROOT_INSTRUCTION,
+        # The LlmAgent expects a list of tools.
+        tools=list(get_agent_tools().values()),
+    )
+
+
+_LAZY_ATTRIBUTES = {
+    "root_agent": get_root_agent,
+    "agent_tools": get_agent_tools,
+    "berkus_agent": get_berkus_agent,
+    "payne_agent": get_payne_agent,
 }
 
-root_agent = LlmAgent(
-    name="multi_agent",
-    model="gemini-2.5-pro",
-    description="Manager agent that routes valuation requests to specialist agents (Berkus and Bill Payne).",
-    # The LlmAgent expects a list of tools.
-    tools=list(agent_tools.values()),
-)
+
+def __getattr__(name):
+    # Keeps `from multi_agent.agent import root_agent` (used by ADK) working.
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class FullStartupData(BaseModel):
@@ -43,10 +82,8 @@ class FullStartupData(BaseModel):
     avg_valuation: Annotated[int, Field(description="Average pre-money valuation for similar startups.")]
 
 
-async def run_full_valuation(startup_data: FullStartupData, tool_context: ToolContext) -> dict:
-    """
-    Performs a comprehensive startup valuation by running both the Berkus and Bill Payne models in parallel.
-    """
+def split_startup_data(startup_data: FullStartupData) -> tuple[StartupDataBerkus, StartupDataPayne]:
+    """Maps the combined startup data onto the inputs of the Berkus and Bill Payne models."""
     berkus_input = StartupDataBerkus(
         idea=startup_data.idea,
         prototype=startup_data.prototype,
@@ -65,18 +102,11 @@ async def run_full_valuation(startup_data: FullStartupData, tool_context: ToolCo
         avg_valuation=startup_data.avg_valuation
     )
 
-    # Run both analyses concurrently
-    # We need to call the specific tool within each agent, not the AgentTool wrapper.
-    # The tool within BerkusAnalystAgent is likely named 'berkus_analysis_tool'.
-    # The tool within PayneAnalystAgent is named 'payne_analysis_tool'.
-    berkus_tool = berkus_agent.tools[0] # Assuming it's the first and only tool
-    payne_tool = payne_agent.tools[0]   # Assuming it's the first and only tool
-
-    berkus_task = berkus_tool.run_async(args={"startup_data": berkus_input}, tool_context=tool_context)
-    payne_task = payne_tool.run_async(args={"startup_data": payne_input}, tool_context=tool_context)
+    return berkus_input, payne_input
 
-    berkus_result, payne_result = await asyncio.gather(berkus_task, payne_task)
 
+def combine_valuations(berkus_result: dict, payne_result: dict) -> dict:
+    """Combines the Berkus and Bill Payne results into a single report and score summary."""
     # Combine the reports
     combined_report = (
         f"# Comprehensive Startup Valuation Analysis\n\n"
@@ -100,14 +130,99 @@ async def run_full_valuation(startup_data: FullStartupData, tool_context: ToolCo
     return {"report": combined_report, "scores": scores_json}
 
 
-# Add the new combined tool to the root agent's tools
-agent_tools["run_full_valuation"] = FunctionTool(func=run_full_valuation)
-root_agent.tools = list(agent_tools.values())
+async def value_startup(
+    startup_data: FullStartupData, berkus: BerkusModelAnalyst, payne: BillPayneModelAnalyst
+) -> dict:
+    """Runs both models directly on the given analysts and returns the same shape as `run_full_valuation`."""
+    berkus_input, payne_input = split_startup_data(startup_data)
+    berkus_result, payne_result = await asyncio.gather(
+        asyncio.to_thread(berkus.analyze_startup, **berkus_input.model_dump()),
+        payne.analyze_startup_async(**payne_input.model_dump()),
+    )
+    return combine_valuations(berkus_result, payne_result)
 
-# Update the root agent's instruction to use the new tool
-root_agent.instruction = """
-You are a manager agent responsible for delegating startup valuation requests.
-- If the user asks for a "full", "comprehensive", or "combined" valuation, or mentions both "Berkus" and "Bill Payne", use the `run_full_valuation` tool.
-- If the user requests only a Berkus model valuation, use the `berkus_analyst` tool.
-- If the user requests only a Bill Payne style valuation, use the `bill_payne_analyst` tool.
-"""
+
+async def stream_valuation(
+    startup_data: FullStartupData, berkus: BerkusModelAnalyst, payne: BillPayneModelAnalyst
+) -> AsyncIterator[dict]:
+    """
+    Runs both models like `value_startup`, but yields an event for each factor
+    score as soon as it resolves, followed by a final "complete" event whose
+    "result" has the same shape as `run_full_valuation`.
+
+    Berkus factors are scored together (one batched call), so they arrive at
+    once; Bill Payne factors arrive individually.
+    """
+    berkus_input, payne_input = split_startup_data(startup_data)
+    berkus_evidence = berkus.factor_evidence(**berkus_input.model_dump())
+    payne_inputs = payne_input.model_dump()
+    avg_valuation = payne_inputs.pop("avg_valuation")
+    payne_evidence = payne.factor_evidence(**payne_inputs)
+
+    scored: asyncio.Queue = asyncio.Queue()
+
+    async def forward(model: str, scores: AsyncIterator[tuple[str, int]]):
+        try:
+            async for factor, score in scores:
+                scored.put_nowait((model, factor, score))
+        except Exception as e:
+            scored.put_nowait(e)
+
+    producers = [
+        asyncio.ensure_future(forward("berkus_model", berkus.score_factors(berkus_evidence))),
+        asyncio.ensure_future(forward("bill_payne_model", payne.score_factors(payne_evidence))),
+    ]
+
+    berkus_scores: dict[str, int] = {}
+    payne_ratings: dict[str, int] = {}
+    factors_total = len(berkus_evidence) + len(payne_evidence)
+    try:
+        while len(berkus_scores) + len(payne_ratings) < factors_total:
+            item = await scored.get()
+            if isinstance(item, Exception):
+                raise item
+            model, factor, score = item
+            if model == "berkus_model":
+                berkus_scores[factor] = score
+                partial_total = sum(berkus_scores.values())
+            else:
+                payne_ratings[factor] = score
+                partial_total = round(sum(payne.factors[f]["weight"] * s for f, s in payne_ratings.items()), 2)
+            yield {
+                "type": "factor_score",
+                "model": model,
+                "factor": factor,
+                "score": score,
+                "partial_total": partial_total,
+                "factors_done": len(berkus_scores) + len(payne_ratings),
+                "factors_total": factors_total,
+            }
+    finally:
+        # Stop outstanding LLM calls if the consumer goes away early.
+        for producer in producers:
+            producer.cancel()
+
+    result = combine_valuations(berkus.build_result(berkus_scores), payne.build_result(payne_ratings, avg_valuation))
+    yield {"type": "complete", "result": result}
+
+
+async def run_full_valuation(startup_data: FullStartupData, tool_context: ToolContext) -> dict:
+    """
+    Performs a comprehensive startup valuation by running both the Berkus and Bill Payne models in parallel.
+    """
+    berkus_input, payne_input = split_startup_data(startup_data)
+
+    # Run both analyses concurrently
+    # We need to call the specific tool within each agent, not the AgentTool wrapper.
+    # The tool within BerkusAnalystAgent is likely named 'berkus_analysis_tool'.
+    # The tool within PayneAnalystAgent is named 'payne_analysis_tool'.
+    berkus_tool = get_berkus_agent().tools[0] # Assuming it's the first and only tool
+    payne_tool = get_payne_agent().tools[0]   # Assuming it's the first and only tool
+
+    # The Berkus tool is synchronous; run it in a worker thread like `value_startup` does.
+    berkus_task = asyncio.to_thread(berkus_tool.func, startup_data=berkus_input)
+    payne_task = payne_tool.run_async(args={"startup_data": payne_input}, tool_context=tool_context)
+
+    berkus_result, payne_result = await asyncio.gather(berkus_task, payne_task)
+
+    return combine_valuations(berkus_result, payne_result)
@@ -0,0 +1,215 @@
+"""
+Batch valuation of many startups at once.
+
+Runs the Berkus and Bill Payne models directly (without the root LLM agent)
+over a JSONL file or an iterable of `FullStartupData` records, and streams one
+JSON line per record to the output file as soon as it finishes. Records that
+already have a result in the output file are skipped, so a crashed run can be
+resumed by running the same command again.
+
+Usage:
+    python -m multi_agent.batch startups.jsonl -o valuations.jsonl --concurrency 8 --rpm 120
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .agent import FullStartupData, value_startup
+from .score_cache import model_cache_name, score_cache
+from .sub_agents.berkus_analyst.agent import BerkusModelAnalyst, berkus_analyst
+from .sub_agents.bill_payne_analyst.agent import BillPayneModelAnalyst, payne_analyst
+
+
+class RateLimiter:
+    """
+    Spaces out calls so that at most `requests_per_minute` are started per minute.
+    Safe to share between threads and coroutines.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        self.interval = 60.0 / requests_per_minute
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def _reserve(self) -> float:
+        """Reserves the next free slot and returns how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+
+    def wait(self):
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimitedModel:
+    """Wraps a generative model so every generation call goes through a `RateLimiter`."""
+
+    def __init__(self, model, limiter: RateLimiter):
+        self.model = model
+        self.limiter = limiter
+
+    def __getattr__(self, name):
+        return getattr(self.model, name)
+
+    def generate_content(self, *args, **kwargs):
+        self.limiter.wait()
+        return self.model.generate_content(*args, **kwargs)
+
+    async def generate_content_async(self, *args, **kwargs):
+        await self.limiter.wait_async()
+        return await self.model.generate_content_async(*args, **kwargs)
+
+
+def iter_jsonl_records(path: str | Path) -> Iterator[dict]:
+    """Yields one record per non-empty line of a JSONL file."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_completed_ids(output_path: str | Path) -> set[str]:
+    """Returns the ids of records that already have a result in the output file."""
+    completed = set()
+    path = Path(output_path)
+    if not path.exists():
+        return completed
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A partially written last line from a crashed run.
+                continue
+            if "result" in entry:
+                completed.add(str(entry["id"]))
+    return completed
+
+
+def _record_id(record: FullStartupData | dict, index: int) -> str:
+    if isinstance(record, dict) and record.get("id") is not None:
+        return str(record["id"])
+    return str(index)
+
+
+def _build_analysts(requests_per_minute: float | None) -> tuple[BerkusModelAnalyst, BillPayneModelAnalyst]:
+    """Creates analysts whose models share one rate limiter per underlying model name."""
+    limiters: dict[str, RateLimiter] = {}
+
+    def limited(model):
+        if not requests_per_minute:
+            return model
+        name = model_cache_name(model)
+        if name not in limiters:
+            limiters[name] = RateLimiter(requests_per_minute)
+        return RateLimitedModel(model, limiters[name])
+
+    berkus = BerkusModelAnalyst(model=limited(berkus_analyst.model), score_cache=score_cache)
+    payne = BillPayneModelAnalyst(model=limited(payne_analyst.model), score_cache=score_cache)
+    return berkus, payne
+
+
+async def run_batch_valuation(
+    records: Iterable[FullStartupData | dict],
+    output_path: str | Path,
+    concurrency: int = 8,
+    requests_per_minute: float | None = None,
+    resume: bool = True,
+    latencies: list[float] | None = None,
+) -> dict[str, int]:
+    """
+    Values every record and appends one JSON line per record to `output_path`
+    as soon as it finishes: `{"id": ..., "result": {...}}` on success or
+    `{"id": ..., "error": "..."}` on failure.
+
+    At most `concurrency` startups are valued at once, and each underlying
+    model is limited to `requests_per_minute` LLM calls. With `resume`, records
+    whose id already has a result in the output file are skipped; failed
+    records are retried. If `latencies` is given, the time taken to value each
+    record (successful or not) is appended to it, in seconds.
+    """
+    completed = load_completed_ids(output_path) if resume else set()
+    berkus, payne = _build_analysts(requests_per_minute)
+    summary = {"succeeded": 0, "failed": 0, "skipped": 0}
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    with open(output_path, "a" if resume else "w", encoding="utf-8") as out:
+
+        def write(entry: dict):
+            out.write(json.dumps(entry) + "\n")
+            out.flush()
+
+        async def worker():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                record_id, record = item
+                started = time.perf_counter()
+                try:
+                    startup_data = record if isinstance(record, FullStartupData) else FullStartupData(**record)
+                    result = await value_startup(startup_data, berkus, payne)
+                    write({"id": record_id, "result": result})
+                    summary["succeeded"] += 1
+                except Exception as e:
+                    print(f"Error valuing record '{record_id}': {e}")
+                    write({"id": record_id, "error": str(e)})
+                    summary["failed"] += 1
+                if latencies is not None:
+                    latencies.append(time.perf_counter() - started)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            for index, record in enumerate(records):
+                record_id = _record_id(record, index)
+                if record_id in completed:
+                    summary["skipped"] += 1
+                    continue
+                await queue.put((record_id, record))
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+    return summary
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Run Berkus and Bill Payne valuations over a JSONL file of startups.")
+    parser.add_argument("input", help="JSONL file with one FullStartupData record (plus an optional 'id') per line.")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file to append results to.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum number of startups valued at once.")
+    parser.add_argument("--rpm", type=float, default=None, help="Maximum LLM requests per minute per model.")
+    parser.add_argument("--no-resume", action="store_true", help="Overwrite the output instead of resuming.")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(
+        run_batch_valuation(
+            iter_jsonl_records(args.input),
+            args.output,
+            concurrency=args.concurrency,
+            requests_per_minute=args.rpm,
+            resume=not args.no_resume,
+        )
+    )
+    print(json.dumps(summary))
+
+
+if __name__ == "__main__":
+    main()
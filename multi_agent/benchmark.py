@@ -0,0 +1,176 @@
+"""
+Offline benchmark for the valuation pipeline.
+
+Runs single-model, full (both models) and batch valuations against
+`FakeGenerativeModel` at several concurrency levels and reports p50/p95/p99
+latency and throughput. Since the fake model's latency is fixed, differences
+between runs reflect the orchestration code rather than the network.
+
+Usage:
+    python -m multi_agent.benchmark --latency 0.05 --jitter 0.02 --requests 50 --concurrency 1 4 16
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import tempfile
+import time
+import uuid
+
+from .agent import FullStartupData, value_startup
+from .batch import run_batch_valuation
+from .fake_llm import FakeGenerativeModel
+from .models import model_registry
+from .sub_agents.berkus_analyst.agent import BerkusModelAnalyst
+from .sub_agents.bill_payne_analyst.agent import BillPayneModelAnalyst
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `values`."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def sample_startup() -> FullStartupData:
+    """A startup whose evidence is unique per call, so the score cache never short-circuits a run."""
+    tag = uuid.uuid4().hex
+    return FullStartupData(
+        idea=f"AI-driven underwriting for small business loans ({tag})",
+        prototype=f"Working beta used by 12 lenders ({tag})",
+        team=f"Two repeat founders with fintech exits ({tag})",
+        relationships=f"Pilot agreements with two regional banks ({tag})",
+        sales_plan=f"Direct sales to credit unions, then channel partners ({tag})",
+        opportunity=f"$40B small business lending market ({tag})",
+        competition=f"Incumbent bureaus and two funded startups ({tag})",
+        funding_needs=f"One more round expected before profitability ({tag})",
+        avg_valuation=2_000_000,
+    )
+
+
+def summarize(name: str, concurrency: int, latencies: list[float], wall_time: float, operations: int) -> dict:
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "operations": operations,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "throughput_per_s": round(operations / wall_time, 2) if wall_time else 0.0,
+    }
+
+
+async def _measure(operation, requests: int, concurrency: int) -> tuple[list[float], float]:
+    """Runs `operation` `requests` times with at most `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def timed():
+        async with semaphore:
+            started = time.perf_counter()
+            await operation()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(requests)))
+    return latencies, time.perf_counter() - started
+
+
+async def run_benchmarks(
+    latency: float = 0.05,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    requests: int = 50,
+    concurrency_levels: tuple[int, ...] = (1, 4, 16),
+    batch_size: int = 20,
+    seed: int | None = 0,
+) -> list[dict]:
+    model = FakeGenerativeModel(latency=latency, jitter=jitter, error_rate=error_rate, seed=seed)
+    model_registry.set_factory(lambda name: model)
+    try:
+        # Cache-less analysts so every valuation pays its full (simulated) LLM cost.
+        berkus = BerkusModelAnalyst(model=model)
+        payne = BillPayneModelAnalyst(model=model)
+
+        async def berkus_only():
+            data = sample_startup()
+            await asyncio.to_thread(
+                berkus.analyze_startup, data.idea, data.prototype, data.team, data.relationships, data.sales_plan
+            )
+
+        async def payne_only():
+            data = sample_startup()
+            await payne.analyze_startup_async(
+                data.team, data.opportunity, data.prototype, data.competition,
+                data.sales_plan, data.funding_needs, data.avg_valuation,
+            )
+
+        async def full():
+            await value_startup(sample_startup(), berkus, payne)
+
+        results = []
+        for concurrency in concurrency_levels:
+            for name, operation in (("single_berkus", berkus_only), ("single_payne", payne_only), ("full", full)):
+                latencies, wall_time = await _measure(operation, requests, concurrency)
+                results.append(summarize(name, concurrency, latencies, wall_time, requests))
+
+            # One batch run of `batch_size` startups; latencies are per startup and
+            # throughput is in startups per second.
+            with tempfile.TemporaryDirectory() as tmp:
+                output_path = os.path.join(tmp, "valuations.jsonl")
+                records = [sample_startup() for _ in range(batch_size)]
+                latencies = []
+                started = time.perf_counter()
+                await run_batch_valuation(
+                    records, output_path, concurrency=concurrency, resume=False, latencies=latencies
+                )
+                wall_time = time.perf_counter() - started
+            results.append(summarize("batch", concurrency, latencies, wall_time, batch_size))
+
+        return results
+    finally:
+        model_registry.reset()
+
+
+def format_table(results: list[dict]) -> str:
+    header = f"{'scenario':<14} {'conc':>5} {'ops':>5} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'ops/s':>10}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['scenario']:<14} {r['concurrency']:>5} {r['operations']:>5} "
+            f"{r['p50_ms']:>10.2f} {r['p95_ms']:>10.2f} {r['p99_ms']:>10.2f} {r['throughput_per_s']:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Benchmark the valuation pipeline against a fake LLM backend.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per LLM call.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random seconds per LLM call (uniform).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of LLM calls returning malformed output.")
+    parser.add_argument("--requests", type=int, default=50, help="Valuations per single/full scenario and level.")
+    parser.add_argument("--batch-size", type=int, default=20, help="Startups per batch run.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="Concurrency levels to test.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for jitter and error injection.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table.")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(
+        run_benchmarks(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            requests=args.requests,
+            concurrency_levels=tuple(args.concurrency),
+            batch_size=args.batch_size,
+            seed=args.seed,
+        )
+    )
+    print(json.dumps(results, indent=2) if args.json else format_table(results))
+
+
+if __name__ == "__main__":
+    main()
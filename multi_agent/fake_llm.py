@@ -0,0 +1,96 @@
+"""
+Offline stand-in for `vertexai.generative_models.GenerativeModel`.
+
+`FakeGenerativeModel` answers the Berkus and Bill Payne scoring prompts with
+deterministic JSON scores, after a configurable simulated latency. It can be
+injected through the model registry to run the valuation pipeline (tests,
+benchmarks, local development) without network access or Gemini quota:
+
+    from multi_agent.fake_llm import FakeGenerativeModel
+    from multi_agent.models import model_registry
+
+    model_registry.set_factory(lambda name: FakeGenerativeModel(name, latency=0.2))
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+
+_SINGLE_FACTOR_PATTERN = re.compile(r'Factor to evaluate: "([^"]+)"')
+_BATCH_FACTOR_PATTERN = re.compile(r'Factor: "([^"]+)"')
+_SCORE_RANGE_PATTERN = re.compile(r"from 0 to (\d+)")
+
+
+class FakeResponse:
+    """Mimics the `.text` attribute of a Vertex AI generation response."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGenerativeModel:
+    """
+    A deterministic fake generative model.
+
+    Each factor's score is derived from a hash of the prompt, so the same
+    prompt always gets the same score. Every call sleeps for `latency` seconds
+    plus a uniform random jitter of up to `jitter` seconds, and with
+    probability `error_rate` returns a malformed (non-JSON) response instead.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "fake-gemini",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+    ):
+        self._model_name = model_name
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def _next_delay_and_error(self) -> tuple[float, bool]:
+        with self._lock:
+            self.calls += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+        return max(delay, 0.0), failed
+
+    @staticmethod
+    def _score(prompt: str, factor: str, max_score: int) -> int:
+        digest = hashlib.sha256(f"{factor}\x1f{prompt}".encode("utf-8")).digest()
+        return int.from_bytes(digest[:4], "big") % (max_score + 1)
+
+    def _respond(self, prompt: str, failed: bool) -> FakeResponse:
+        if failed:
+            return FakeResponse("This is not JSON.")
+
+        match = _SCORE_RANGE_PATTERN.search(prompt)
+        max_score = int(match.group(1)) if match else 100
+
+        single = _SINGLE_FACTOR_PATTERN.search(prompt)
+        if single:
+            return FakeResponse(json.dumps({"score": self._score(prompt, single.group(1), max_score)}))
+
+        factors = _BATCH_FACTOR_PATTERN.findall(prompt)
+        return FakeResponse(json.dumps({factor: self._score(prompt, factor, max_score) for factor in factors}))
+
+    def generate_content(self, contents, generation_config=None, **kwargs) -> FakeResponse:
+        delay, failed = self._next_delay_and_error()
+        if delay:
+            time.sleep(delay)
+        return self._respond(str(contents), failed)
+
+    async def generate_content_async(self, contents, generation_config=None, **kwargs) -> FakeResponse:
+        delay, failed = self._next_delay_and_error()
+        if delay:
+            await asyncio.sleep(delay)
+        return self._respond(str(contents), failed)
@@ -0,0 +1,61 @@
+"""
+Process-wide registry of generative models.
+
+Vertex AI is initialized and each `GenerativeModel` is built only the first
+time it is requested, and then shared by every analyst in the process. Tests
+and offline benchmarks can swap in fake models with `set_factory` or
+`register` before (or instead of) touching Vertex AI.
+"""
+import threading
+from typing import Callable
+
+DEFAULT_MODEL_NAME = "gemini-2.5-pro"
+
+_vertex_initialized = False
+
+
+def _vertex_model_factory(name: str):
+    global _vertex_initialized
+    import vertexai
+    from vertexai.generative_models import GenerativeModel
+
+    if not _vertex_initialized:
+        vertexai.init()
+        _vertex_initialized = True
+    return GenerativeModel(name)
+
+
+class ModelRegistry:
+    """Builds each model once per process, on first use."""
+
+    def __init__(self, factory: Callable[[str], object] | None = None):
+        self._factory = factory or _vertex_model_factory
+        self._models: dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str = DEFAULT_MODEL_NAME):
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        with self._lock:
+            if name not in self._models:
+                self._models[name] = self._factory(name)
+            return self._models[name]
+
+    def register(self, name: str, model):
+        """Uses `model` for `name` instead of building one with the factory."""
+        with self._lock:
+            self._models[name] = model
+
+    def set_factory(self, factory: Callable[[str], object]):
+        """Replaces the model factory and drops every model built so far."""
+        with self._lock:
+            self._factory = factory
+            self._models.clear()
+
+    def reset(self):
+        """Restores the Vertex AI factory and drops every model built so far."""
+        self.set_factory(_vertex_model_factory)
+
+
+model_registry = ModelRegistry()
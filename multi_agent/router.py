@@ -0,0 +1,128 @@
+"""
+Deterministic fast-path routing for valuation requests.
+
+Explicit method selectors and requests that clearly match the rules in
+`root_agent.instruction` are dispatched straight to the right tool without a
+round-trip to the manager model. Only ambiguous free-text requests fall back
+to the LLM router (`root_agent`).
+"""
+import asyncio
+import re
+import time
+import uuid
+
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from .agent import FullStartupData, get_root_agent, split_startup_data, value_startup
+from .sub_agents.berkus_analyst.agent import berkus_analyst
+from .sub_agents.bill_payne_analyst.agent import payne_analyst
+
+FULL_VALUATION = "run_full_valuation"
+BERKUS_ONLY = "berkus_analyst"
+PAYNE_ONLY = "bill_payne_analyst"
+
+# Explicit method selectors accepted in addition to the tool names themselves.
+METHOD_ALIASES = {
+    "full": FULL_VALUATION,
+    "comprehensive": FULL_VALUATION,
+    "combined": FULL_VALUATION,
+    "berkus": BERKUS_ONLY,
+    "payne": PAYNE_ONLY,
+    "bill_payne": PAYNE_ONLY,
+    FULL_VALUATION: FULL_VALUATION,
+    BERKUS_ONLY: BERKUS_ONLY,
+    PAYNE_ONLY: PAYNE_ONLY,
+}
+
+# The same rules the manager model follows in `root_agent.instruction`.
+_FULL_PATTERN = re.compile(r"\b(full|comprehensive|combined)\b", re.IGNORECASE)
+_BERKUS_PATTERN = re.compile(r"\bberkus\b", re.IGNORECASE)
+_PAYNE_PATTERN = re.compile(r"\b(bill[\s_-]*)?payne\b", re.IGNORECASE)
+
+
+def route_request(request: str | None = None, method: str | None = None) -> tuple[str | None, str]:
+    """
+    Picks the tool for a valuation request without calling the manager model.
+
+    Returns `(tool_name, reason)`. `tool_name` is None when the request is
+    ambiguous and has to go through the LLM router. With neither a method nor
+    a request, a full valuation is assumed.
+    """
+    if method:
+        tool_name = METHOD_ALIASES.get(method.strip().lower())
+        if tool_name is None:
+            raise ValueError(f"Unknown valuation method '{method}'. Expected one of: {', '.join(sorted(METHOD_ALIASES))}")
+        return tool_name, "explicit_method"
+
+    if not request:
+        return FULL_VALUATION, "default"
+
+    mentions_berkus = bool(_BERKUS_PATTERN.search(request))
+    mentions_payne = bool(_PAYNE_PATTERN.search(request))
+
+    if _FULL_PATTERN.search(request) or (mentions_berkus and mentions_payne):
+        return FULL_VALUATION, "keyword"
+    if mentions_berkus:
+        return BERKUS_ONLY, "keyword"
+    if mentions_payne:
+        return PAYNE_ONLY, "keyword"
+    return None, "ambiguous"
+
+
+async def _run_tool(tool_name: str, startup_data: FullStartupData) -> dict:
+    if tool_name == FULL_VALUATION:
+        return await value_startup(startup_data, berkus_analyst, payne_analyst)
+
+    berkus_input, payne_input = split_startup_data(startup_data)
+    if tool_name == BERKUS_ONLY:
+        return await asyncio.to_thread(berkus_analyst.analyze_startup, **berkus_input.model_dump())
+    return await payne_analyst.analyze_startup_async(**payne_input.model_dump())
+
+
+async def _run_llm_router(request: str, startup_data: FullStartupData) -> dict:
+    """Lets the manager model pick and call a tool, and returns its final answer as the report."""
+    root_agent = get_root_agent()
+    runner = InMemoryRunner(agent=root_agent, app_name=root_agent.name)
+    user_id = "valuation_router"
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id=user_id)
+    message = types.Content(
+        role="user",
+        parts=[types.Part(text=f"{request}\n\nStartup data:\n{startup_data.model_dump_json(indent=2)}")],
+    )
+
+    report = ""
+    async for event in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+        if event.is_final_response() and event.content and event.content.parts:
+            report = "".join(part.text or "" for part in event.content.parts)
+    return {"report": report}
+
+
+async def dispatch_valuation(
+    startup_data: FullStartupData, request: str | None = None, method: str | None = None
+) -> dict:
+    """
+    Runs a valuation, taking the fast path whenever the target tool can be
+    determined from `method` or from keywords in `request`.
+
+    The returned dictionary is the tool's result plus a `trace` entry recording
+    which path was taken, which tool ran and how long it took.
+    """
+    started = time.perf_counter()
+    tool_name, reason = route_request(request, method)
+
+    if tool_name is not None:
+        result = await _run_tool(tool_name, startup_data)
+        path = "fast_path"
+    else:
+        result = await _run_llm_router(request, startup_data)
+        path = "llm_router"
+
+    result["trace"] = {
+        "request_id": uuid.uuid4().hex,
+        "path": path,
+        "tool": tool_name,
+        "reason": reason,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+    return result
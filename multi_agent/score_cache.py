@@ -0,0 +1,176 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def model_cache_name(model) -> str:
+    """Returns a stable name for a generative model, used as part of the cache key."""
+    name = getattr(model, "_model_name", None) or getattr(model, "model_name", None)
+    return str(name) if name else type(model).__name__
+
+
+def normalize_evidence(evidence: str) -> str:
+    """Collapses whitespace so cosmetic edits to the evidence don't change the cache key."""
+    return " ".join(evidence.split())
+
+
+class ScoreCache:
+    """
+    A content-addressed cache for LLM factor scores.
+
+    Scores are keyed on a hash of the model name, prompt template version,
+    factor name and normalized evidence. Lookups go to an in-process LRU tier
+    first and then to an optional on-disk SQLite tier. Both tiers expire
+    entries after `ttl_seconds` and evict the least recently used entries once
+    they grow past their size limit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_seconds: float | None = 7 * 24 * 3600,
+        sqlite_path: str | None = None,
+        sqlite_max_entries: int = 100_000,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.sqlite_max_entries = sqlite_max_entries
+
+        self._memory: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0, "evictions": 0}
+
+        self._db = None
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS factor_scores ("
+                "key TEXT PRIMARY KEY, score INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_factor_scores_accessed ON factor_scores (accessed_at)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(model_name: str, prompt_version: str, factor_name: str, evidence: str) -> str:
+        payload = "\x1f".join([model_name, prompt_version, factor_name, normalize_evidence(evidence)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, score: int, created_at: float):
+        self._memory[key] = (score, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def get(self, key: str) -> int | None:
+        """Returns the cached score for `key`, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                score, created_at = entry
+                if not self._is_expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self._stats["hits"] += 1
+                    self._stats["memory_hits"] += 1
+                    return score
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT score, created_at FROM factor_scores WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    score, created_at = row
+                    if not self._is_expired(created_at, now):
+                        self._db.execute("UPDATE factor_scores SET accessed_at = ? WHERE key = ?", (now, key))
+                        self._db.commit()
+                        self._remember(key, score, created_at)
+                        self._stats["hits"] += 1
+                        self._stats["disk_hits"] += 1
+                        return score
+                    self._db.execute("DELETE FROM factor_scores WHERE key = ?", (key,))
+                    self._db.commit()
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: str, score: int):
+        """Stores a score in every configured tier."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, score, now)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO factor_scores (key, score, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, score, now, now),
+                )
+                self._evict_disk(now)
+                self._db.commit()
+
+    def _evict_disk(self, now: float):
+        if self.ttl_seconds is not None:
+            self._db.execute("DELETE FROM factor_scores WHERE created_at < ?", (now - self.ttl_seconds,))
+        (count,) = self._db.execute("SELECT COUNT(*) FROM factor_scores").fetchone()
+        overflow = count - self.sqlite_max_entries
+        if overflow > 0:
+            self._db.execute(
+                "DELETE FROM factor_scores WHERE key IN "
+                "(SELECT key FROM factor_scores ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            self._stats["evictions"] += overflow
+
+    def stats(self) -> dict[str, int]:
+        """Returns hit/miss counters and the current size of the in-process tier."""
+        with self._lock:
+            return {**self._stats, "memory_entries": len(self._memory)}
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM factor_scores")
+                self._db.commit()
+
+
+class CachedFactorScoring:
+    """
+    Score-cache helpers shared by the Berkus and Bill Payne analysts.
+
+    Subclasses provide `model`, `score_cache` (a ScoreCache or None) and a
+    `PROMPT_VERSION` that is bumped whenever their scoring prompts change.
+    """
+
+    PROMPT_VERSION = "1"
+    score_cache: ScoreCache | None = None
+
+    @staticmethod
+    def _has_evidence(evidence: str) -> bool:
+        return bool(evidence and evidence.strip() and evidence != "{}")
+
+    def _cache_key(self, factor_name: str, evidence: str) -> str:
+        return ScoreCache.make_key(model_cache_name(self.model), self.PROMPT_VERSION, factor_name, evidence)
+
+    def _get_cached_score(self, factor_name: str, evidence: str) -> int | None:
+        if self.score_cache is None:
+            return None
+        return self.score_cache.get(self._cache_key(factor_name, evidence))
+
+    def _cache_score(self, factor_name: str, evidence: str, score: int):
+        if self.score_cache is not None:
+            self.score_cache.set(self._cache_key(factor_name, evidence), score)
+
+
+# Shared by the Berkus and Bill Payne analysts. Set SCORE_CACHE_DB to a file
+# path to also persist scores on disk across restarts.
+score_cache = ScoreCache(sqlite_path=os.getenv("SCORE_CACHE_DB"))
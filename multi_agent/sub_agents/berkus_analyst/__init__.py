@@ -1,6 +1,16 @@
-from .agent import BerkusAnalystAgent
-
 # The ADK framework looks for an object named `root_agent` in a package's
 # __init__.py. By defining it here, this agent could be run directly,
 # but in our new structure, the top-level __init__.py is the main entry point.
-root_agent = BerkusAnalystAgent()
+# It is created on first access rather than at import time.
+_root_agent = None
+
+
+def __getattr__(name):
+    global _root_agent
+    if name == "root_agent":
+        if _root_agent is None:
+            from .agent import BerkusAnalystAgent
+
+            _root_agent = BerkusAnalystAgent()
+        return _root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,39 @@
+import asyncio
 import textwrap
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 from pydantic import BaseModel, Field
 from google.adk.agents import LlmAgent
 from google.adk.tools import FunctionTool
-import vertexai
 from vertexai.generative_models import GenerativeModel, GenerationConfig
 import json
 
-class BerkusModelAnalyst:
+from ...models import DEFAULT_MODEL_NAME, model_registry
+from ...score_cache import CachedFactorScoring, ScoreCache, score_cache
+
+class BerkusModelAnalyst(CachedFactorScoring):
     """
     This class encapsulates the core logic for performing a Berkus Model analysis.
     It is designed to be independent of any specific agent framework.
     """
 
-    def __init__(self, model: GenerativeModel):
-        self.model = model
+    # Bump whenever the scoring prompts change so cached scores are not reused.
+    PROMPT_VERSION = "1"
+
+    def __init__(
+        self,
+        model: GenerativeModel | None = None,
+        batch_scoring: bool = True,
+        score_cache: ScoreCache | None = None,
+        model_name: str = DEFAULT_MODEL_NAME,
+    ):
+        # Without an explicit model, `model_name` is looked up in the shared
+        # model registry the first time the model is needed.
+        self._model = model
+        self.model_name = model_name
+        self.score_cache = score_cache
+        # When enabled, all factors are scored with a single LLM call and only
+        # missing or invalid scores fall back to per-factor calls.
+        self.batch_scoring = batch_scoring
 
         # Define the five key factors of the Berkus Model and their max values
         self.factors = [
@@ -27,14 +46,26 @@ class BerkusModelAnalyst:
         self.max_score_per_factor = 20
         self.max_total_score = 100
 
+    @property
+    def model(self) -> GenerativeModel:
+        return self._model if self._model is not None else model_registry.get(self.model_name)
+
     def _evaluate_factor(self, factor_name: str, evidence: str) -> int:
         """
         Analyzes a single Berkus Model factor and assigns a score (0-100)
         based strictly on the provided data.
         """
-        if not evidence or not evidence.strip() or evidence == "{}":
+        if not self._has_evidence(evidence):
             return 0
 
+        cached = self._get_cached_score(factor_name, evidence)
+        if cached is not None:
+            return cached
+
+        return self._request_factor_score(factor_name, evidence)
+
+    def _request_factor_score(self, factor_name: str, evidence: str) -> int:
+        """Asks the LLM to score a single factor and caches the result."""
         prompt = f"""
         You are an expert venture capital analyst. Your task is to evaluate a startup based on one of the five factors of the Berkus Model.
 
@@ -59,25 +90,133 @@ class BerkusModelAnalyst:
                 generation_config=GenerationConfig(temperature=0.0, response_mime_type="application/json")
             )
             result = json.loads(response.text)
-            return int(result.get("score", 0))
+            score = int(result.get("score", 0))
         except (ValueError, json.JSONDecodeError, AttributeError) as e:
             print(f"Error evaluating factor '{factor_name}': {e}")
             return 0
 
+        self._cache_score(factor_name, evidence, score)
+        return score
+
+    def _parse_score(self, value) -> int | None:
+        """Returns the value as a factor score, or None if it is missing or out of range."""
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            return None
+        try:
+            score = float(value)
+        except ValueError:
+            return None
+        if not score.is_integer() or not 0 <= score <= self.max_score_per_factor:
+            return None
+        return int(score)
+
+    def _evaluate_factors_batched(self, evidence_by_factor: dict[str, str]) -> dict[str, int]:
+        """
+        Scores every factor that has evidence in a single LLM call.
+        Factors whose score is missing or invalid in the response are left out
+        of the returned dictionary so the caller can fall back to per-factor calls.
+        """
+        sections = "\n\n".join(
+            f'Factor: "{factor}"\n---\n{evidence}\n---'
+            for factor, evidence in evidence_by_factor.items()
+        )
+        example = json.dumps({factor: self.max_score_per_factor // 2 for factor in evidence_by_factor})
+
+        prompt = f"""
+        You are an expert venture capital analyst. Your task is to evaluate a startup based on the factors of the Berkus Model listed below.
+
+        Maximum possible score for each factor: {self.max_score_per_factor}
+
+        Evidence provided by the startup for each factor:
+
+        {sections}
+
+        Score each factor independently, based only on its own evidence, from 0 to {self.max_score_per_factor}.
+        A score of 0 means the evidence is non-existent, irrelevant, or extremely weak.
+        A score of {self.max_score_per_factor} means the evidence is exceptionally strong and convincing.
+
+        Respond with ONLY a JSON object mapping each factor name exactly as written above to your integer score. For example: {example}
+        """
+
+        try:
+            response = self.model.generate_content(
+                prompt,
+                generation_config=GenerationConfig(temperature=0.0, response_mime_type="application/json")
+            )
+            result = json.loads(response.text)
+        except (ValueError, json.JSONDecodeError, AttributeError) as e:
+            print(f"Error evaluating factors in batch: {e}")
+            return {}
+
+        if not isinstance(result, dict):
+            print(f"Error evaluating factors in batch: expected a JSON object, got {type(result).__name__}")
+            return {}
+
+        scores = {}
+        for factor in evidence_by_factor:
+            score = self._parse_score(result.get(factor))
+            if score is not None:
+                scores[factor] = score
+        return scores
+
+    def _evaluate_factors(self, evidence_by_factor: dict[str, str]) -> dict[str, int]:
+        """Scores all factors, batching the LLM calls when batch scoring is enabled."""
+        scores = {factor: 0 for factor in evidence_by_factor}
+        pending = {
+            factor: evidence
+            for factor, evidence in evidence_by_factor.items()
+            if self._has_evidence(evidence)
+        }
+
+        for factor, evidence in list(pending.items()):
+            cached = self._get_cached_score(factor, evidence)
+            if cached is not None:
+                scores[factor] = cached
+                del pending[factor]
+
+        if self.batch_scoring and len(pending) > 1:
+            batched = self._evaluate_factors_batched(pending)
+            for factor, score in batched.items():
+                self._cache_score(factor, pending[factor], score)
+            scores.update(batched)
+            pending = {factor: evidence for factor, evidence in pending.items() if factor not in batched}
+
+        for factor, evidence in pending.items():
+            scores[factor] = self._request_factor_score(factor, evidence)
+        return scores
+
+    async def score_factors(self, evidence_by_factor: dict[str, str]) -> AsyncIterator[tuple[str, int]]:
+        """
+        Yields `(factor, score)` for every factor. The factors are scored in a
+        worker thread (in one batched call when batch scoring is enabled), so
+        all scores arrive together.
+        """
+        scores = await asyncio.to_thread(self._evaluate_factors, evidence_by_factor)
+        for factor in evidence_by_factor:
+            yield factor, scores[factor]
+
+    @staticmethod
+    def factor_evidence(idea: str, prototype: str, team: str, relationships: str, sales_plan: str) -> dict[str, str]:
+        """Maps the startup inputs onto the Berkus factors they are evidence for."""
+        return {
+            "Sound Idea": idea,
+            "Prototype": prototype,
+            "Quality Management Team": team,
+            "Strategic Relationships": relationships,
+            "Product Rollout or Sales": sales_plan,
+        }
+
     def analyze_startup(
         self, idea: str, prototype: str, team: str, relationships: str, sales_plan: str
     ) -> dict[str, str | int]:
         """
         Calculates the Berkus Model score and generates the final report.
         """
-        scores = {
-            "Sound Idea": self._evaluate_factor("Sound Idea", idea),
-            "Prototype": self._evaluate_factor("Prototype", prototype),
-            "Quality Management Team": self._evaluate_factor("Quality Management Team", team),
-            "Strategic Relationships": self._evaluate_factor("Strategic Relationships", relationships),
-            "Product Rollout or Sales": self._evaluate_factor("Product Rollout or Sales", sales_plan),
-        }
+        scores = self._evaluate_factors(self.factor_evidence(idea, prototype, team, relationships, sales_plan))
+        return self.build_result(scores)
 
+    def build_result(self, scores: dict[str, int]) -> dict[str, str | int]:
+        """Totals the factor scores and formats the report."""
         total_score = sum(scores.values())
 
         # Format the Final Report
@@ -122,9 +261,8 @@ class StartupData(BaseModel):
     relationships: Annotated[str, Field(description="Strategic relationships the startup has.")]
     sales_plan: Annotated[str, Field(description="The product rollout or sales plan.")]
 
-vertexai.init()
-evaluation_llm = GenerativeModel("gemini-2.5-pro")
-berkus_analyst = BerkusModelAnalyst(model=evaluation_llm)
+# The evaluation model is resolved from the shared registry on first use.
+berkus_analyst = BerkusModelAnalyst(score_cache=score_cache)
 
 def run_berkus_analysis(startup_data: StartupData) -> dict[str, str | int | dict]:
     """
@@ -1,5 +1,15 @@
-from .agent import PayneAnalystAgent
-
 # The ADK framework looks for an object named `root_agent` in your package's
-# __init__.py to know which agent to run.
-root_agent = PayneAnalystAgent()
+# __init__.py to know which agent to run. It is created on first access rather
+# than at import time.
+_root_agent = None
+
+
+def __getattr__(name):
+    global _root_agent
+    if name == "root_agent":
+        if _root_agent is None:
+            from .agent import PayneAnalystAgent
+
+            _root_agent = PayneAnalystAgent()
+        return _root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
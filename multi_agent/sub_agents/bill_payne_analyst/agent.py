@@ -1,20 +1,41 @@
+import asyncio
 import textwrap
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 from pydantic import BaseModel, Field
 from google.adk.agents import LlmAgent
 from google.adk.tools import FunctionTool
-import vertexai
 from vertexai.generative_models import GenerativeModel, GenerationConfig
 import json
 
-class BillPayneModelAnalyst:
+from ...models import DEFAULT_MODEL_NAME, model_registry
+from ...score_cache import CachedFactorScoring, ScoreCache, score_cache
+
+class BillPayneModelAnalyst(CachedFactorScoring):
     """
     This class encapsulates the core logic for performing a Bill Payne Model analysis.
     It is designed to be independent of any specific agent framework.
     """
 
-    def __init__(self, model: GenerativeModel):
-        self.model = model
+    # Bump whenever the scoring prompt changes so cached scores are not reused.
+    PROMPT_VERSION = "1"
+
+    def __init__(
+        self,
+        model: GenerativeModel | None = None,
+        max_concurrency: int = 6,
+        factor_timeout: float | None = 60.0,
+        score_cache: ScoreCache | None = None,
+        model_name: str = DEFAULT_MODEL_NAME,
+    ):
+        # Without an explicit model, `model_name` is looked up in the shared
+        # model registry the first time the model is needed.
+        self._model = model
+        self.model_name = model_name
+        self.score_cache = score_cache
+        # Limits for the async analysis path: how many factor evaluations may be
+        # in flight at once, and how long (in seconds) each one may take.
+        self.max_concurrency = max_concurrency
+        self.factor_timeout = factor_timeout
 
         # Define the key factors and weights of the Bill Payne Model
         self.factors = {
@@ -46,15 +67,15 @@ class BillPayneModelAnalyst:
         self.max_total_weight = sum(f["weight"] for f in self.factors.values())
         self.max_score_per_factor = 100
 
-    def _evaluate_factor(self, factor_name: str, evidence: str) -> int:
-        """Uses an LLM to evaluate the evidence and assign a score (0 to 100)."""
-        if not evidence or not evidence.strip() or evidence == "{}":
-            return 0
+    @property
+    def model(self) -> GenerativeModel:
+        return self._model if self._model is not None else model_registry.get(self.model_name)
 
+    def _build_prompt(self, factor_name: str, evidence: str) -> str:
         factor_info = self.factors[factor_name]
         description = factor_info["description"]
 
-        prompt = f"""
+        return f"""
         You are an expert venture capital analyst using the Bill Payne valuation method.
         Your task is to compare a startup's provided evidence for a specific factor against a hypothetical 'average' startup in the same pre-revenue stage.
 
@@ -76,30 +97,124 @@ class BillPayneModelAnalyst:
         Respond with ONLY a JSON object containing the key "score" and your integer score as the value. For example: {{"score": 75}}
         """
 
+    def _score_from_response(self, factor_name: str, evidence: str, response) -> int:
+        """
+        Reads the score from an LLM response and caches it. A malformed or blocked
+        response scores 0 and is not cached, so the factor is retried next time.
+        """
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=GenerationConfig(temperature=0.0, response_mime_type="application/json"),
-            )
             result = json.loads(response.text)
-            return int(result.get("score", 0))
+            score = int(result.get("score", 0))
         except (ValueError, json.JSONDecodeError, AttributeError) as e:
             print(f"Error evaluating factor '{factor_name}': {e}")
             return 0
 
+        self._cache_score(factor_name, evidence, score)
+        return score
+
+    def _evaluate_factor(self, factor_name: str, evidence: str) -> int:
+        """Uses an LLM to evaluate the evidence and assign a score (0 to 100)."""
+        if not self._has_evidence(evidence):
+            return 0
+
+        cached = self._get_cached_score(factor_name, evidence)
+        if cached is not None:
+            return cached
+
+        response = self.model.generate_content(
+            self._build_prompt(factor_name, evidence),
+            generation_config=GenerationConfig(temperature=0.0, response_mime_type="application/json"),
+        )
+        return self._score_from_response(factor_name, evidence, response)
+
+    async def _evaluate_factor_async(self, factor_name: str, evidence: str, semaphore: asyncio.Semaphore) -> int:
+        """Async counterpart of `_evaluate_factor`, bounded by `semaphore` and `factor_timeout`."""
+        if not self._has_evidence(evidence):
+            return 0
+
+        cached = self._get_cached_score(factor_name, evidence)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            try:
+                response = await asyncio.wait_for(
+                    self.model.generate_content_async(
+                        self._build_prompt(factor_name, evidence),
+                        generation_config=GenerationConfig(temperature=0.0, response_mime_type="application/json"),
+                    ),
+                    timeout=self.factor_timeout,
+                )
+            except asyncio.TimeoutError:
+                print(f"Timed out evaluating factor '{factor_name}' after {self.factor_timeout}s")
+                return 0
+
+        return self._score_from_response(factor_name, evidence, response)
+
+    async def score_factors(self, evidence_by_factor: dict[str, str]) -> AsyncIterator[tuple[str, int]]:
+        """
+        Evaluates the factors concurrently like `analyze_startup_async` and yields
+        `(factor, score)` as each score resolves. Evaluations still outstanding
+        are cancelled when the iterator is closed early.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def evaluate(factor: str, evidence: str) -> tuple[str, int]:
+            return factor, await self._evaluate_factor_async(factor, evidence, semaphore)
+
+        tasks = [asyncio.ensure_future(evaluate(factor, evidence)) for factor, evidence in evidence_by_factor.items()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def factor_evidence(team, opportunity, product, competition, marketing, funding_needs) -> dict[str, str]:
+        """Maps the startup inputs onto the Bill Payne factors they are evidence for."""
+        return {
+            "Management Team": team,
+            "Size of Opportunity": opportunity,
+            "Product or Technology": product,
+            "Competitive Environment": competition,
+            "Marketing and Sales": marketing,
+            "Need for Additional Investment": funding_needs,
+        }
+
     def analyze_startup(self, team, opportunity, product, competition, marketing, funding_needs, avg_valuation):
         """
         Analyzes the startup based on the Bill Payne factors and generates a report.
+        Factors are evaluated concurrently through `analyze_startup_async`, unless
+        this thread is already running an event loop; then they are evaluated one
+        at a time (await `analyze_startup_async` instead from async code).
         """
-        ratings = {
-            "Management Team": self._evaluate_factor("Management Team", team),
-            "Size of Opportunity": self._evaluate_factor("Size of Opportunity", opportunity),
-            "Product or Technology": self._evaluate_factor("Product or Technology", product),
-            "Competitive Environment": self._evaluate_factor("Competitive Environment", competition),
-            "Marketing and Sales": self._evaluate_factor("Marketing and Sales", marketing),
-            "Need for Additional Investment": self._evaluate_factor("Need for Additional Investment", funding_needs),
-        }
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.analyze_startup_async(
+                team, opportunity, product, competition, marketing, funding_needs, avg_valuation
+            ))
+
+        evidence = self.factor_evidence(team, opportunity, product, competition, marketing, funding_needs)
+        ratings = {factor: self._evaluate_factor(factor, text) for factor, text in evidence.items()}
+        return self.build_result(ratings, avg_valuation)
+
+    async def analyze_startup_async(self, team, opportunity, product, competition, marketing, funding_needs, avg_valuation):
+        """
+        Same as `analyze_startup`, but evaluates all factors concurrently
+        (at most `max_concurrency` LLM calls in flight at once).
+        """
+        evidence = self.factor_evidence(team, opportunity, product, competition, marketing, funding_needs)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        scores = await asyncio.gather(
+            *(self._evaluate_factor_async(factor, text, semaphore) for factor, text in evidence.items())
+        )
+        ratings = dict(zip(evidence, scores))
+        return self.build_result(ratings, avg_valuation)
 
+    def build_result(self, ratings: dict[str, int], avg_valuation) -> dict[str, str | float]:
+        """Computes the weighted score and valuation from factor ratings and formats the report."""
         # The total max weighted score is 100 (max_score_per_factor) * 1.0 (total_weight) = 100
         total_weighted_score = 0
         for factor, score in ratings.items():
@@ -154,16 +269,15 @@ class StartupDataPayne(BaseModel):
     funding_needs: Annotated[str, Field(description="The likelihood of needing more funding in the future.")]
     avg_valuation: Annotated[int, Field(description="The average pre-money valuation for similar pre-revenue startups in the same region and industry.")]
 
-vertexai.init()
-evaluation_llm = GenerativeModel("gemini-2.5-pro")
-payne_analyst = BillPayneModelAnalyst(model=evaluation_llm)
+# The evaluation model is resolved from the shared registry on first use.
+payne_analyst = BillPayneModelAnalyst(score_cache=score_cache)
 
-def run_payne_analysis(startup_data: StartupDataPayne) -> dict[str, str | int | float]:
+async def run_payne_analysis(startup_data: StartupDataPayne) -> dict[str, str | int | float]:
     """
     Performs a Bill Payne Model valuation analysis on pre-revenue startup data
     and returns a dictionary with the markdown report and the calculated valuation.
     """
-    return payne_analyst.analyze_startup(
+    return await payne_analyst.analyze_startup_async(
         team=startup_data.team,
         opportunity=startup_data.opportunity,
         product=startup_data.product,
@@ -6,6 +6,10 @@ import json
 
 BASE_URL = "http://localhost:8000"
 
+# VC routes require a bearer token from /api/auth/login
+login = requests.post(f"{BASE_URL}/api/auth/login", json={"username": "admin", "password": "auth"})
+HEADERS = {"Authorization": f"Bearer {login.json()['token']}"}
+
 # Test startups from deal flow
 test_startups = ["s8", "s2", "s5", "s1", "s3", "s4", "s6", "s7"]
 
@@ -19,7 +23,7 @@ for startup_id in test_startups:
     print(f"{'=' * 40}")
     
     try:
-        response = requests.get(f"{BASE_URL}/api/vc/dealflow/startup/{startup_id}")
+        response = requests.get(f"{BASE_URL}/api/vc/dealflow/startup/{startup_id}", headers=HEADERS)
         data = response.json()
         
         if "error" in data:
@@ -1,14 +1,25 @@
 """
 API routes aggregation
 """
-from fastapi import APIRouter
-from app.api.routes import auth, vc, founder, categories
+from fastapi import APIRouter, Depends
+from app.api.deps import get_current_user
+from app.api.routes import auth, vc, founder, categories, valuation, jobs
 
 
 api_router = APIRouter()
 
 # Include all route modules
 api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
-api_router.include_router(vc.router, prefix="/vc", tags=["VC Dashboard"])
-api_router.include_router(founder.router, prefix="/founder", tags=["Founder Dashboard"])
+api_router.include_router(
+    vc.router, prefix="/vc", tags=["VC Dashboard"], dependencies=[Depends(get_current_user)]
+)
+api_router.include_router(
+    founder.router, prefix="/founder", tags=["Founder Dashboard"], dependencies=[Depends(get_current_user)]
+)
+api_router.include_router(
+    jobs.router, prefix="/jobs", tags=["Jobs"], dependencies=[Depends(get_current_user)]
+)
 api_router.include_router(categories.router, prefix="/categories", tags=["Categories"])
+api_router.include_router(
+    valuation.router, prefix="/valuation", tags=["Valuation"], dependencies=[Depends(get_current_user)]
+)
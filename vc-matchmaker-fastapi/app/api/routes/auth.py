@@ -10,22 +10,22 @@ router = APIRouter()
 
 
 @router.post("/login")
-async def login(credentials: LoginRequest):
+def login(credentials: LoginRequest):
     """Login endpoint"""
     user = auth_service.authenticate_user(credentials.username, credentials.password)
     
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    # In production, generate a real JWT token here
     return {
-        "token": f"demo-token-{user['uid']}",
+        "token": auth_service.create_access_token(user),
+        "token_type": "bearer",
         "user": user
     }
 
 
 @router.get("/user/{username}")
-async def get_user(username: str):
+def get_user(username: str):
     """Get user by username"""
     user = auth_service.get_user_by_username(username)
     
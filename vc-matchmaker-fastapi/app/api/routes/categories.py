@@ -1,35 +1,37 @@
 """
 Categories routes
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from app.services.data_service import data_service
+from app.services.response_cache import cached_json_response, response_cache
 
 
 router = APIRouter()
 
 
 @router.get("/all")
-async def get_all_categories():
-    """Get all categories"""
-    return data_service.get_categories()
+def get_all_categories(request: Request):
+    """Get all categories (cached per data version, supports If-None-Match)"""
+    cached = response_cache.get("categories", data_service.data_version, data_service.get_categories)
+    return cached_json_response(request, cached)
 
 
 @router.get("/industries")
-async def get_industries():
+def get_industries():
     """Get list of industries"""
     data = data_service.get_categories()
     return data.get("industries", [])
 
 
 @router.get("/stages")
-async def get_stages():
+def get_stages():
     """Get list of funding stages"""
     data = data_service.get_categories()
     return data.get("stages", [])
 
 
 @router.get("/regions")
-async def get_regions():
+def get_regions():
     """Get list of regions"""
     data = data_service.get_categories()
     return data.get("regions", [])
@@ -1,28 +1,56 @@
 """
 Founder dashboard routes
 """
-from fastapi import APIRouter
+from typing import Any, Dict
+from fastapi import APIRouter, Depends, Query, Request
+from app.api.deps import get_current_user
 from app.services.data_service import data_service
+from app.services.response_cache import cached_json_response, user_response_cache
 
 
 router = APIRouter()
 
 
+def _founder_profile(username: str) -> Dict[str, Any]:
+    """Matching profile for a user: their profile in users.json, else the sample profile"""
+    user = data_service.get_user_by_username(username) or {}
+    return user.get("profile") or data_service.get_founder_dashboard_data().get("completedProfileSample", {})
+
+
+def _build_founder_dashboard(username: str) -> Dict[str, Any]:
+    data = data_service.get_founder_dashboard_data()
+    matches = data_service.get_vc_matcher().rank(_founder_profile(username), k=len(data.get("recommendedVCs", [])))
+    return {**data, "recommendedVCs": matches}
+
+
 @router.get("/dashboard")
-async def get_founder_dashboard():
-    """Get complete founder dashboard data"""
-    return data_service.get_founder_dashboard_data()
+def get_founder_dashboard(request: Request, user: Dict[str, Any] = Depends(get_current_user)):
+    """
+    Get complete founder dashboard data, with recommendedVCs ranked for the signed-in
+    founder (cached per user and data version, supports If-None-Match)
+    """
+    username = user.get("username")
+    cached = user_response_cache.get(
+        ("founder_dashboard", username), data_service.data_version, lambda: _build_founder_dashboard(username)
+    )
+    return cached_json_response(request, cached)
+
+
+@router.post("/matches")
+def match_vcs(profile: dict, k: int = Query(10, ge=1, le=100)):
+    """Top-k VCs for a founder profile (industry, stage, location, fundingSought, description...)"""
+    return {"matches": data_service.get_vc_matcher().rank(profile, k=k)}
 
 
 @router.get("/profile/sample")
-async def get_completed_profile_sample():
+def get_completed_profile_sample():
     """Get completed profile sample"""
     data = data_service.get_founder_dashboard_data()
     return data.get("completedProfileSample", {})
 
 
 @router.get("/profile/form-steps")
-async def get_form_steps():
+def get_form_steps():
     """Get profile form steps"""
     data = data_service.get_founder_dashboard_data()
     return data.get("formSteps", [])
@@ -36,7 +64,7 @@ async def save_profile(profile_data: dict):
 
 
 @router.get("/profile/{user_id}")
-async def get_founder_profile(user_id: str):
+def get_founder_profile(user_id: str):
     """Get founder profile by user ID"""
     # In production, this would fetch from database
     # For demo, return the sample profile
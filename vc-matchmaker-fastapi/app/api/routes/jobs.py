@@ -0,0 +1,17 @@
+"""
+Background job routes
+"""
+from fastapi import APIRouter, HTTPException
+from app.services.job_queue import job_queue
+
+
+router = APIRouter()
+
+
+@router.get("/{job_id}")
+def get_job(job_id: str):
+    """Status of a background job, with its result once it has succeeded"""
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
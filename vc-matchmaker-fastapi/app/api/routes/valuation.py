@@ -0,0 +1,21 @@
+"""
+Startup valuation routes
+"""
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from app.models.valuation import ValuationRequest
+from app.services.valuation_service import valuation_service
+
+
+router = APIRouter()
+
+
+@router.post("/stream")
+async def stream_valuation(request: ValuationRequest):
+    """Run a full Berkus + Bill Payne valuation, streaming factor scores over SSE"""
+    startup_data = request.model_dump(exclude={"startup_id"})
+    return StreamingResponse(
+        valuation_service.stream_valuation_events(startup_data, startup_id=request.startup_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
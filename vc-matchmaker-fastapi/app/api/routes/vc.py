@@ -1,118 +1,224 @@
 """
 VC dashboard routes
 """
-from fastapi import APIRouter
+import asyncio
+import hashlib
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from app.core.config import settings
+from app.services.composite_valuation import normalize_scores
 from app.services.data_service import data_service
+from app.services.ingestion import UploadTooLarge, document_ingestor
+from app.services.job_queue import JobQueueFull, job_queue
+from app.services.query import RecordIndex, parse_fields, project
+from app.services.red_flags import RedFlagReport, generate_red_flags, red_flag_service
+from app.services.response_cache import cached_json_response, response_cache
 
 
 router = APIRouter()
 
 
+def _query_page(
+    index: RecordIndex,
+    stage: Optional[str],
+    industry: Optional[str],
+    location: Optional[str],
+    cursor: Optional[str],
+    limit: Optional[int],
+    fields: Optional[str]
+) -> dict:
+    """Filter, paginate and project an indexed card list"""
+    try:
+        return index.query(
+            {"stage": stage, "industry": industry, "location": location},
+            cursor=cursor,
+            limit=limit,
+            fields=parse_fields(fields)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _section_response(request: Request, section: str, default):
+    """Serve one section of vc_dashboard.json from the pre-serialized response cache"""
+    cached = response_cache.get(
+        ("vc_section", section),
+        data_service.data_version,
+        lambda: data_service.get_vc_dashboard_data().get(section, default)
+    )
+    return cached_json_response(request, cached)
+
+
 @router.get("/dashboard")
-async def get_vc_dashboard():
-    """Get complete VC dashboard data"""
-    return data_service.get_vc_dashboard_data()
+def get_vc_dashboard(
+    request: Request,
+    sections: Optional[str] = Query(None, description="Comma-separated top-level sections to include"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to keep on startup and deal cards")
+):
+    """Get complete VC dashboard data (cached per data version, supports If-None-Match)"""
+    version = (
+        data_service.data_version,
+        data_service.get_dealflow_revision(),
+        data_service.get_holdings_revision(),
+        data_service.get_settings_revision()
+    )
+    cached = response_cache.get(
+        ("vc_dashboard", sections, fields), version, lambda: _build_vc_dashboard(sections, fields)
+    )
+    return cached_json_response(request, cached)
+
+
+def _build_vc_dashboard(sections: Optional[str], fields: Optional[str]) -> dict:
+    vc_data = data_service.get_vc_dashboard_data()
+    portfolio = data_service.get_portfolio()
+    data = {
+        **vc_data,
+        "portfolioSummary": portfolio.summary(vc_data.get("portfolioSummary", {})),
+        "holdingsData": portfolio.holdings(),
+        "defaultInvestmentThesis": data_service.get_investment_thesis(),
+        "defaultModelWeights": data_service.get_model_weights(),
+        "dealflowStages": data_service.get_dealflow_stages()
+    }
+    
+    wanted_sections = parse_fields(sections)
+    if wanted_sections:
+        data = {key: value for key, value in data.items() if key in wanted_sections}
+    
+    card_fields = parse_fields(fields)
+    if card_fields:
+        if "startupsToWatch" in data:
+            data["startupsToWatch"] = [project(s, card_fields) for s in data["startupsToWatch"]]
+        if "dealflowStages" in data:
+            data["dealflowStages"] = [
+                {**stage, "deals": [project(d, card_fields) for d in stage.get("deals", [])]}
+                for stage in data["dealflowStages"]
+            ]
+    
+    return data
 
 
 @router.get("/metrics")
-async def get_vc_metrics():
+def get_vc_metrics(request: Request):
     """Get VC key metrics"""
-    data = data_service.get_vc_dashboard_data()
-    return data.get("keyMetrics", {})
+    return _section_response(request, "keyMetrics", {})
+
+
+def _portfolio_response(request: Request, key: str, build):
+    """Serve a view of the portfolio engine, cached until the data or a price changes"""
+    version = (data_service.data_version, data_service.get_holdings_revision())
+    cached = response_cache.get(key, version, build)
+    return cached_json_response(request, cached)
 
 
 @router.get("/portfolio")
-async def get_portfolio_summary():
-    """Get portfolio summary"""
-    data = data_service.get_vc_dashboard_data()
-    return data.get("portfolioSummary", {})
+def get_portfolio_summary(request: Request):
+    """Get portfolio summary (invested, unrealized and TVPI computed from holdings)"""
+    return _portfolio_response(
+        request,
+        "vc_portfolio_summary",
+        lambda: data_service.get_portfolio().summary(data_service.get_vc_dashboard_data().get("portfolioSummary", {}))
+    )
 
 
 @router.get("/portfolio/holdings")
-async def get_portfolio_holdings():
+def get_portfolio_holdings(request: Request):
     """Get portfolio holdings"""
-    data = data_service.get_vc_dashboard_data()
-    return data.get("portfolioHoldings", [])
+    return _section_response(request, "portfolioHoldings", [])
 
 
 @router.get("/portfolio/holdings-data")
-async def get_holdings_data():
-    """Get detailed holdings data with P&L"""
-    data = data_service.get_vc_dashboard_data()
-    return data.get("holdingsData", [])
+def get_holdings_data(request: Request):
+    """Get detailed holdings data with P&L and weights computed from qty, avgCost and price"""
+    return _portfolio_response(request, "vc_holdings_data", lambda: data_service.get_portfolio().holdings())
+
+
+@router.post("/portfolio/holdings/{name}/price")
+def update_holding_price(name: str, price_data: dict):
+    """Record a price tick for a holding"""
+    price = price_data.get("price")
+    if isinstance(price, bool) or not isinstance(price, (int, float)) or price < 0:
+        return {"error": "price must be a non-negative number"}
+    
+    if not data_service.update_holding_price(name, float(price)):
+        return {"error": f"Holding not found: {name}"}
+    
+    portfolio = data_service.get_portfolio()
+    return {
+        "success": True,
+        "holding": portfolio.holding(name),
+        "summary": portfolio.summary(data_service.get_vc_dashboard_data().get("portfolioSummary", {}))
+    }
 
 
 @router.get("/models")
-async def get_weighted_models():
+def get_weighted_models(request: Request):
     """Get weighted models"""
-    data = data_service.get_vc_dashboard_data()
-    return data.get("weightedModels", [])
+    return _section_response(request, "weightedModels", [])
 
 
 @router.get("/scores")
-async def get_score_gauges():
+def get_score_gauges(request: Request):
     """Get score gauges"""
-    data = data_service.get_vc_dashboard_data()
-    return data.get("scoreGauges", [])
+    return _section_response(request, "scoreGauges", [])
 
 
 @router.get("/alerts")
-async def get_recent_alerts():
+def get_recent_alerts(request: Request):
     """Get recent alerts"""
-    data = data_service.get_vc_dashboard_data()
-    return data.get("recentAlerts", [])
+    return _section_response(request, "recentAlerts", [])
 
 
 @router.get("/startups-to-watch")
-async def get_startups_to_watch():
-    """Get startups to watch"""
-    data = data_service.get_vc_dashboard_data()
-    return data.get("startupsToWatch", [])
+def get_startups_to_watch(
+    request: Request,
+    stage: Optional[str] = Query(None, description="Funding stage, e.g. Series A"),
+    industry: Optional[str] = None,
+    location: Optional[str] = Query(None, description="City, region or country"),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    fields: Optional[str] = Query(None, description="Comma-separated fields, e.g. id,name,stage,match")
+):
+    """
+    Get startups to watch. With any filter, pagination or projection parameter,
+    returns a page: {"items": [...], "next_cursor": ..., "total": ...}
+    """
+    if not any([stage, industry, location, cursor, limit, fields]):
+        return _section_response(request, "startupsToWatch", [])
+    
+    return _query_page(data_service.get_startups_to_watch_index(), stage, industry, location, cursor, limit, fields)
 
 
 @router.get("/dealflow")
-async def get_dealflow_stages():
-    """Get dealflow stages with deals (combines static + sourced startups)"""
-    data = data_service.get_vc_dashboard_data()
-    dealflow_stages = data.get("dealflowStages", [])
-    
-    # Get sourced startups from in-memory storage
-    sourced_startups = data_service.get_sourced_startups()
-    
-    # Add sourced startups to the SOURCED stage
-    if sourced_startups:
-        # Find or create SOURCED stage
-        sourced_stage = next((stage for stage in dealflow_stages if stage.get("name") == "SOURCED"), None)
-        if not sourced_stage:
-            sourced_stage = {"name": "SOURCED", "count": 0, "deals": []}
-            dealflow_stages.insert(0, sourced_stage)
-        
-        # Convert sourced startups to deal format
-        for startup in sourced_startups:
-            deal = {
-                "id": startup.get("id"),
-                "title": startup.get("name"),
-                "company": startup.get("name"),
-                "stage": startup.get("stage"),
-                "industry": startup.get("industry"),
-                "match": startup.get("match"),
-                "timestamp": startup.get("timestamp"),
-                "fit": 8,  # Default scores
-                "team": 8,
-                "market": 7,
-                "full_data": startup  # Include full startup data
-            }
-            # Add to deals if not already there
-            if not any(d.get("id") == deal["id"] for d in sourced_stage.get("deals", [])):
-                sourced_stage.setdefault("deals", []).append(deal)
-        
-        sourced_stage["count"] = len(sourced_stage.get("deals", []))
+def get_dealflow_stages(
+    request: Request,
+    stage: Optional[str] = Query(None, description="Dealflow stage, e.g. SOURCED"),
+    industry: Optional[str] = None,
+    location: Optional[str] = Query(None, description="City, region or country"),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    fields: Optional[str] = Query(None, description="Comma-separated fields, e.g. id,title,dealflow_stage")
+):
+    """
+    Get dealflow stages with deals (combines static + sourced startups).
+    With any filter, pagination or projection parameter, returns a flat page of
+    deals instead: {"items": [...], "next_cursor": ..., "total": ...}
+    """
+    if not any([stage, industry, location, cursor, limit, fields]):
+        cached = response_cache.get(
+            "vc_dealflow",
+            (data_service.data_version, data_service.get_dealflow_revision()),
+            data_service.get_dealflow_stages
+        )
+        return cached_json_response(request, cached)
     
-    return dealflow_stages
+    return _query_page(data_service.get_dealflow_deal_index(), stage, industry, location, cursor, limit, fields)
 
 
 @router.post("/dealflow/source")
-async def source_startup_to_dealflow(startup_data: dict):
+def source_startup_to_dealflow(startup_data: dict):
     """Source a startup to deal flow"""
     startup_id = startup_data.get("id")
     startup_name = startup_data.get("name")
@@ -129,8 +235,29 @@ async def source_startup_to_dealflow(startup_data: dict):
     }
 
 
+@router.post("/dealflow/startup/{startup_id}/move")
+def move_dealflow_startup(startup_id: str, move_data: dict):
+    """Move a startup to another dealflow stage"""
+    startup = data_service.get_startup_by_id(startup_id)
+    if not startup:
+        return {"error": "Startup not found"}
+    
+    stage = move_data.get("stage")
+    if stage not in [s.get("name") for s in data_service.get_dealflow_stages()]:
+        return {"error": f"Unknown dealflow stage: {stage}"}
+    
+    data_service.move_deal(startup_id, stage)
+    
+    return {
+        "success": True,
+        "message": f"Moved {startup_id} to {stage}",
+        "startup_id": startup_id,
+        "deal_flow_stage": stage
+    }
+
+
 @router.get("/dealflow/startup/{startup_id}")
-async def get_dealflow_startup(startup_id: str):
+def get_dealflow_startup(startup_id: str):
     """Get detailed information about a startup in deal flow"""
     startup = data_service.get_startup_by_id(startup_id)
     if not startup:
@@ -144,21 +271,74 @@ async def get_dealflow_startup(startup_id: str):
         "startup": startup,
         "deal_notes": deal_notes,
         "ingested_documents": documents,
-        "red_flags": generate_red_flags(startup)
+        "red_flags": _red_flag_report().flags_for(startup_id) or generate_red_flags(startup)
+    }
+
+
+def _red_flag_report() -> RedFlagReport:
+    """Red flags for every startup in the pipeline, re-evaluated only when the data changes"""
+    return red_flag_service.get_report(
+        (data_service.data_version, data_service.get_dealflow_revision()),
+        data_service.get_pipeline_startups
+    )
+
+
+@router.get("/dealflow/red-flags")
+def scan_red_flags(severity: Optional[str] = Query(None, pattern="^(high|medium|low)$")):
+    """Red flags across the pipeline, optionally only startups with a flag of the given severity"""
+    report = _red_flag_report()
+    if severity is None:
+        positions = range(len(report.ids))
+    else:
+        positions = report.positions_with_severity(severity)
+    items = [
+        {
+            "id": report.ids[p],
+            "name": report.startups[p].get("name") or report.startups[p].get("title"),
+            "red_flags": report.flags_at(p)
+        }
+        for p in positions
+    ]
+    return {"items": items, "total": len(items)}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _submit_job(response: Response, kind: str, startup_id: str, payload: Dict[str, Any]) -> dict:
+    """Queue a background job for a startup and describe it for the client (202 Accepted)"""
+    try:
+        job, created = job_queue.submit(kind, startup_id, payload)
+    except JobQueueFull:
+        raise HTTPException(status_code=503, detail="Too many background jobs are waiting, try again later")
+    response.status_code = 202
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "deduplicated": not created,
+        "status_url": f"/api/jobs/{job['id']}"
     }
 
 
 @router.post("/dealflow/startup/{startup_id}/generate-notes")
-async def generate_deal_notes(startup_id: str):
-    """Generate AI deal notes for a startup"""
+def generate_deal_notes(startup_id: str, response: Response):
+    """Queue AI deal note generation for a startup; poll the returned job for the notes"""
+    if not data_service.get_startup_by_id(startup_id):
+        return {"error": "Startup not found"}
+    return _submit_job(response, "deal_notes", startup_id, {})
+
+
+def _generate_deal_notes_job(startup_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Background job: generate and save deal notes"""
     startup = data_service.get_startup_by_id(startup_id)
     if not startup:
-        return {"error": "Startup not found"}
+        raise ValueError("Startup not found")
     
     # Simulate AI-generated deal notes
     notes = {
         "startup_id": startup_id,
-        "generated_at": "2025-11-02T16:45:00Z",
+        "generated_at": _utc_now(),
         "summary": f"AI-Generated Analysis for {startup.get('name')}",
         "investment_thesis": f"{startup.get('name')} operates in the {startup.get('industry')} space with strong market positioning. Their {startup.get('pitch', '')}",
         "strengths": [
@@ -193,26 +373,80 @@ async def generate_deal_notes(startup_id: str):
 
 
 @router.post("/dealflow/startup/{startup_id}/ingest-documents")
-async def ingest_documents(startup_id: str, document_data: dict):
-    """Ingest documents (call transcripts, emails) for a startup"""
-    startup = data_service.get_startup_by_id(startup_id)
-    if not startup:
+def ingest_documents(startup_id: str, document_data: dict, response: Response):
+    """
+    Queue ingestion of a document (call transcript, email thread) for a startup;
+    `content` is analysed if given (use /documents/upload for large documents)
+    """
+    if not data_service.get_startup_by_id(startup_id):
         return {"error": "Startup not found"}
+    return _submit_job(response, "ingest_document", startup_id, document_data)
+
+
+@router.post("/dealflow/startup/{startup_id}/documents/upload")
+async def upload_document(
+    startup_id: str,
+    request: Request,
+    response: Response,
+    type: str = Query("call_transcript", max_length=64),
+    filename: Optional[str] = Query(None, max_length=255)
+):
+    """
+    Upload a document as the raw request body (chunked transfer encoding works);
+    it is streamed to disk, never held in memory, and analysed by a background job.
+    Content that was already ingested for the startup is skipped.
+    """
+    if not await asyncio.to_thread(data_service.get_startup_by_id, startup_id):
+        return {"error": "Startup not found"}
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > settings.INGEST_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"Uploads are limited to {settings.INGEST_MAX_BYTES} bytes")
     
-    # Simulate document ingestion
-    document_type = document_data.get("type", "call_transcript")
+    try:
+        upload = await document_ingestor.spool(request.stream(), startup_id, settings.INGEST_MAX_BYTES)
+    except UploadTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    existing = await asyncio.to_thread(data_service.find_ingested_document, startup_id, upload.content_hash)
+    if existing is not None:
+        await asyncio.to_thread(upload.path.unlink, missing_ok=True)
+        return {"success": True, "skipped": True, "message": "Document was already ingested", "document": existing}
     
+    return await asyncio.to_thread(_submit_job, response, "ingest_upload", startup_id, {
+        "path": str(upload.path),
+        "content_hash": upload.content_hash,
+        "size_bytes": upload.size_bytes,
+        "type": type,
+        "filename": filename
+    })
+
+
+async def _ingest_content(
+    startup_id: str, blocks, document_type: str, content_hash: str, size_bytes: int, filename: Optional[str] = None
+) -> Dict[str, Any]:
+    """Chunk and analyse a document, then save it with its map-reduce summary"""
+    startup = await asyncio.to_thread(data_service.get_startup_by_id, startup_id)
+    if not startup:
+        raise ValueError("Startup not found")
+    existing = await asyncio.to_thread(data_service.find_ingested_document, startup_id, content_hash)
+    if existing is not None:
+        return {"success": True, "skipped": True, "message": "Document was already ingested", "document": existing}
+    
+    result = await document_ingestor.ingest(blocks)
     document = {
-        "id": f"doc_{len(data_service.get_ingested_documents(startup_id)) + 1}",
+        "id": f"doc_{uuid.uuid4().hex[:12]}",
         "startup_id": startup_id,
         "type": document_type,
-        "ingested_at": "2025-11-02T16:50:00Z",
+        "filename": filename,
+        "content_hash": content_hash,
+        "size_bytes": size_bytes,
+        "chunks": result["chunks"],
+        "chunks_reused": result["chunks_reused"],
+        "ingested_at": _utc_now(),
         "status": "processed",
-        "insights": generate_document_insights(startup, document_type)
+        "insights": result["reducer"].summary(startup, document_type)
     }
-    
-    # Save document
-    data_service.add_ingested_document(startup_id, document)
+    await asyncio.to_thread(data_service.add_ingested_document, startup_id, document)
     
     return {
         "success": True,
@@ -221,145 +455,65 @@ async def ingest_documents(startup_id: str, document_data: dict):
     }
 
 
-def generate_red_flags(startup: dict) -> list:
-    """Generate red flags based on startup data"""
-    red_flags = []
-    
-    # Check burn rate
-    burn = startup.get('metrics', {}).get('burn', '')
-    if burn and '$' in burn:
-        try:
-            burn_amount = int(burn.replace('$', '').replace('K', '000').replace('/month', '').replace(',', ''))
-            if burn_amount > 200000:
-                red_flags.append({
-                    "severity": "high",
-                    "flag": "High burn rate",
-                    "detail": f"Burning {burn} may lead to runway issues"
-                })
-            elif burn_amount > 100000:
-                red_flags.append({
-                    "severity": "medium",
-                    "flag": "Elevated burn rate",
-                    "detail": f"Burn rate of {burn} requires close monitoring"
-                })
-        except:
-            pass
-    
-    # Check team size
-    team_size = startup.get('teamSize', 0)
-    if team_size > 0 and team_size < 10:
-        red_flags.append({
-            "severity": "medium",
-            "flag": "Small team size",
-            "detail": f"Team of {team_size} may face scaling challenges"
-        })
-    elif team_size == 0:
-        red_flags.append({
-            "severity": "low",
-            "flag": "Team size unknown",
-            "detail": "Limited team information available for assessment"
-        })
-    
-    # Check funding stage
-    stage = startup.get('stage', '')
-    mrr = startup.get('metrics', {}).get('mrr', '$0')
-    if stage == 'Seed' and mrr and '$' in mrr:
-        try:
-            mrr_amount = int(mrr.replace('$', '').replace('K', '000').replace(',', ''))
-            if mrr_amount < 50000:
-                red_flags.append({
-                    "severity": "medium",
-                    "flag": "Low traction for stage",
-                    "detail": f"MRR of {mrr} may be below expectations for {stage} stage"
-                })
-        except:
-            pass
-    
-    # Check location/market risks
-    location = startup.get('location', '')
-    if 'India' in location or 'Brazil' in location or 'Africa' in location:
-        red_flags.append({
-            "severity": "low",
-            "flag": "Emerging market risk",
-            "detail": "Consider regulatory, currency, and exit liquidity risks"
-        })
-    
-    # Check fit/team/market scores for deal flow cards
-    fit_score = startup.get('fit', 10)
-    team_score = startup.get('team', 10)
-    market_score = startup.get('market', 10)
-    
-    if fit_score < 7:
-        red_flags.append({
-            "severity": "high",
-            "flag": "Low thesis fit",
-            "detail": f"Fit score of {fit_score}/10 indicates misalignment with investment thesis"
-        })
-    elif fit_score < 8:
-        red_flags.append({
-            "severity": "medium",
-            "flag": "Moderate thesis fit",
-            "detail": f"Fit score of {fit_score}/10 suggests partial alignment with investment criteria"
-        })
-    
-    if team_score < 7:
-        red_flags.append({
-            "severity": "high",
-            "flag": "Team concerns",
-            "detail": f"Team score of {team_score}/10 indicates potential execution risks"
-        })
-    elif team_score < 8:
-        red_flags.append({
-            "severity": "medium",
-            "flag": "Team assessment needed",
-            "detail": f"Team score of {team_score}/10 warrants deeper founder evaluation"
-        })
-    
-    if market_score < 7:
-        red_flags.append({
-            "severity": "high",
-            "flag": "Market risk",
-            "detail": f"Market score of {market_score}/10 suggests significant market challenges"
-        })
-    elif market_score < 8:
-        red_flags.append({
-            "severity": "medium",
-            "flag": "Market dynamics unclear",
-            "detail": f"Market score of {market_score}/10 requires deeper market analysis"
-        })
+async def _ingest_upload_job(startup_id: str, upload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Background job: ingest a spooled upload, reading it from disk in blocks. The file
+    is removed once the job succeeds or fails; a cancelled job (queue shutdown) keeps
+    it for the retry.
+    """
+    path = Path(upload["path"])
+    try:
+        result = await _ingest_content(
+            startup_id,
+            document_ingestor.read_blocks(path),
+            upload["type"],
+            upload["content_hash"],
+            upload["size_bytes"],
+            upload.get("filename")
+        )
+    except Exception:
+        # Not asyncio.CancelledError (a BaseException): a cancelled job keeps its file
+        path.unlink(missing_ok=True)
+        raise
+    path.unlink(missing_ok=True)
+    return result
+
+
+async def _ingest_document_job(startup_id: str, document_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Background job: extract insights from a document and save it"""
+    document_type = document_data.get("type", "call_transcript")
+    content = document_data.get("content")
+    if isinstance(content, str) and content.strip():
+        data = content.encode()
+        return await _ingest_content(startup_id, [data], document_type, hashlib.sha256(data).hexdigest(), len(data))
     
-    # Check overall deal quality
-    if fit_score + team_score + market_score < 18:
-        red_flags.append({
-            "severity": "high",
-            "flag": "Overall low scores",
-            "detail": f"Combined score of {fit_score + team_score + market_score}/30 indicates high-risk opportunity"
-        })
+    startup = await asyncio.to_thread(data_service.get_startup_by_id, startup_id)
+    if not startup:
+        raise ValueError("Startup not found")
     
-    # Check deal title for additional context
-    title = startup.get('title', '').lower()
-    if 'referral' in title or 'cold' in title:
-        red_flags.append({
-            "severity": "low",
-            "flag": "Source quality",
-            "detail": "Deal sourced via referral - validate relationship strength and alignment"
-        })
-    if 'pilot' in title or 'awaiting' in title:
-        red_flags.append({
-            "severity": "medium",
-            "flag": "Early stage validation",
-            "detail": "Deal requires further validation before advancing"
-        })
+    # No content: simulated insights
+    document = {
+        "id": f"doc_{uuid.uuid4().hex[:12]}",
+        "startup_id": startup_id,
+        "type": document_type,
+        "ingested_at": _utc_now(),
+        "status": "processed",
+        "insights": generate_document_insights(startup, document_type)
+    }
     
-    # If no significant flags, add informational flag
-    if not red_flags:
-        red_flags.append({
-            "severity": "low",
-            "flag": "Standard due diligence required",
-            "detail": "Proceed with standard investment evaluation process"
-        })
+    # Save document
+    await asyncio.to_thread(data_service.add_ingested_document, startup_id, document)
     
-    return red_flags
+    return {
+        "success": True,
+        "message": f"Successfully ingested {document_type}",
+        "document": document
+    }
+
+
+job_queue.register("deal_notes", _generate_deal_notes_job)
+job_queue.register("ingest_document", _ingest_document_job)
+job_queue.register("ingest_upload", _ingest_upload_job)
 
 
 def generate_document_insights(startup: dict, doc_type: str) -> dict:
@@ -396,28 +550,95 @@ def generate_document_insights(startup: dict, doc_type: str) -> dict:
 
 
 @router.get("/investment-thesis")
-async def get_investment_thesis():
-    """Get default investment thesis"""
-    data = data_service.get_vc_dashboard_data()
-    return {"thesis": data.get("defaultInvestmentThesis", "")}
+def get_investment_thesis(request: Request):
+    """Get the current investment thesis"""
+    cached = response_cache.get(
+        ("vc_section", "investmentThesis"),
+        (data_service.data_version, data_service.get_settings_revision()),
+        lambda: {"thesis": data_service.get_investment_thesis()}
+    )
+    return cached_json_response(request, cached)
 
 
 @router.post("/investment-thesis")
-async def update_investment_thesis(data: dict):
-    """Update investment thesis"""
-    # In production, this would save to database
-    return {"message": "Investment thesis updated successfully"}
+def update_investment_thesis(data: dict):
+    """Update the investment thesis and re-rank the pipeline against it"""
+    thesis = data.get("thesis")
+    if not isinstance(thesis, str) or not thesis.strip():
+        return {"error": "thesis must be a non-empty string"}
+    
+    data_service.set_investment_thesis(thesis.strip())
+    scorer = data_service.get_thesis_scorer()
+    return {
+        "message": "Investment thesis updated successfully",
+        "thesis": thesis.strip(),
+        "unknown_terms": scorer.unknown_terms,
+        "top_matches": scorer.ranking(limit=10)
+    }
+
+
+@router.get("/thesis-fit")
+def get_thesis_fit(limit: Optional[int] = Query(None, ge=1, le=1000)):
+    """Pipeline startups (watchlist, dealflow and sourced) ranked by fit with the current thesis"""
+    scorer = data_service.get_thesis_scorer()
+    return {"thesis": scorer.thesis, "unknown_terms": scorer.unknown_terms, "items": scorer.ranking(limit=limit)}
 
 
 @router.get("/model-weights")
-async def get_model_weights():
-    """Get default model weights"""
-    data = data_service.get_vc_dashboard_data()
-    return data.get("defaultModelWeights", {})
+def get_model_weights(request: Request):
+    """Get the current model weights"""
+    cached = response_cache.get(
+        ("vc_section", "modelWeights"),
+        (data_service.data_version, data_service.get_settings_revision()),
+        data_service.get_model_weights
+    )
+    return cached_json_response(request, cached)
 
 
 @router.post("/model-weights")
-async def update_model_weights(weights: dict):
-    """Update model weights"""
-    # In production, this would save to database
-    return {"message": "Model weights updated successfully"}
+def update_model_weights(weights: dict):
+    """Update the model weights and re-rank the composite valuations"""
+    current = data_service.get_model_weights()
+    unknown = sorted(set(weights) - set(current))
+    if unknown:
+        return {"error": f"Unknown models: {', '.join(unknown)}"}
+    if any(isinstance(w, bool) or not isinstance(w, (int, float)) or w < 0 for w in weights.values()):
+        return {"error": "weights must be non-negative numbers"}
+    
+    updated = {**current, **{model: float(w) for model, w in weights.items()}}
+    if not sum(updated.values()):
+        return {"error": "at least one weight must be positive"}
+    
+    data_service.set_model_weights(updated)
+    return {
+        "message": "Model weights updated successfully",
+        "weights": updated,
+        "top_valuations": data_service.get_valuation_ranking(limit=10)
+    }
+
+
+@router.get("/valuations")
+def get_valuations(limit: Optional[int] = Query(None, ge=1, le=1000)):
+    """Startups with stored analyst scores, ranked by composite valuation under the current weights"""
+    return {"weights": data_service.get_model_weights(), "items": data_service.get_valuation_ranking(limit=limit)}
+
+
+@router.get("/valuations/{startup_id}")
+def get_valuation(startup_id: str):
+    """Composite and per-model valuation scores of a startup"""
+    valuation = data_service.get_composite_valuation().model_scores(startup_id)
+    if valuation is None:
+        return {"error": f"No valuation scores for startup {startup_id}"}
+    return valuation
+
+
+@router.put("/valuations/{startup_id}/scores")
+def save_valuation_scores(startup_id: str, scores: dict):
+    """Store per-factor analyst scores ({"berkus": {factor: score}, "billatyne": {...}}) for a startup"""
+    try:
+        normalized = normalize_scores(scores)
+    except ValueError as e:
+        return {"error": str(e)}
+    
+    data_service.save_valuation_scores(startup_id, normalized)
+    return {"success": True, **data_service.get_composite_valuation().model_scores(startup_id)}
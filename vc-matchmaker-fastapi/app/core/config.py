@@ -1,10 +1,15 @@
 """
 Application configuration and settings
 """
+from pathlib import Path
 from typing import List
 from pydantic_settings import BaseSettings
 
 
+# Placeholder SECRET_KEY shipped in the repo; tokens signed with it can be forged by anyone
+DEFAULT_SECRET_KEY = "your-secret-key-here-change-in-production"
+
+
 class Settings(BaseSettings):
     """Application settings"""
     
@@ -15,11 +20,45 @@ class Settings(BaseSettings):
     # CORS Settings - Allow all origins for development
     BACKEND_CORS_ORIGINS: List[str] = ["*"]
     
-    # Security
-    SECRET_KEY: str = "your-secret-key-here-change-in-production"
+    # "production" refuses to start with the placeholder SECRET_KEY
+    ENVIRONMENT: str = "development"
+    
+    # Security - set SECRET_KEY in the environment; the placeholder is only for local development
+    SECRET_KEY: str = DEFAULT_SECRET_KEY
+    # Token signing algorithm: HS256, HS384 or HS512 (anything else fails at startup)
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Storage - "sqlite" (shared across workers, survives restarts) or "memory"
+    STORAGE_BACKEND: str = "sqlite"
+    SQLITE_PATH: Path = Path(__file__).resolve().parents[2] / "Data" / "vc_matchmaker.db"
+    SQLITE_POOL_SIZE: int = 4
+    
+    # Hot reload of Data/*.json - poll interval (seconds), doubling while idle up to the max
+    DATA_RELOAD_ENABLED: bool = True
+    DATA_RELOAD_INTERVAL: float = 1.0
+    DATA_RELOAD_MAX_INTERVAL: float = 10.0
+    
+    # Background jobs (deal notes, document ingestion) - "sqlite" keeps queued jobs across restarts
+    JOBS_BACKEND: str = "sqlite"
+    JOBS_SQLITE_PATH: Path = Path(__file__).resolve().parents[2] / "Data" / "jobs.db"
+    JOBS_WORKERS: int = 4
+    JOBS_MAX_PENDING: int = 1000
+    # A running job is retried after a restart once its lease (seconds) has expired
+    JOBS_LEASE_SECONDS: float = 300.0
+    JOBS_RETENTION_SECONDS: float = 86400.0
+    
+    # Document ingestion - uploads are spooled to disk and analysed in chunks of INGEST_CHUNK_CHARS
+    INGEST_UPLOAD_DIR: Path = Path(__file__).resolve().parents[2] / "Data" / "uploads"
+    INGEST_MAX_BYTES: int = 200 * 1024 * 1024
+    INGEST_CHUNK_CHARS: int = 4000
+    INGEST_CONCURRENCY: int = 4
+    # Insights of recently seen chunks (by SHA-256), reused when a document is uploaded again or extended
+    INGEST_CHUNK_CACHE_SIZE: int = 16384
+    
+    # Valuation agents - directory that contains the `multi_agent` package
+    MULTI_AGENT_PATH: Path = Path(__file__).resolve().parents[3]
+    
     class Config:
         case_sensitive = True
 
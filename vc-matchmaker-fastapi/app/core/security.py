@@ -0,0 +1,177 @@
+"""
+Password hashing and access tokens
+"""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_HASH_ITERATIONS = 260_000
+
+# Key for hashing plaintext passwords from users.json at load time; new per process
+_PLAINTEXT_HASH_KEY = os.urandom(32)
+
+
+def hash_password(password: str, salt: Optional[bytes] = None, iterations: int = PASSWORD_HASH_ITERATIONS) -> str:
+    """Hash a password for storage as `passwordHash` ("pbkdf2_sha256$iterations$salt$hash")"""
+    salt = salt or os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+    return f"{PASSWORD_HASH_ALGORITHM}${iterations}${salt.hex()}${digest.hex()}"
+
+
+def _parse_password_hash(password_hash: str) -> Tuple[int, bytes, bytes]:
+    algorithm, iterations, salt, digest = password_hash.split("$")
+    if algorithm != PASSWORD_HASH_ALGORITHM:
+        raise ValueError(f"Unsupported password hash algorithm: {algorithm}")
+    return int(iterations), bytes.fromhex(salt), bytes.fromhex(digest)
+
+
+class PasswordVerifier:
+    """
+    Salted hash of one user's password, compared in constant time.
+
+    Users stored with a `passwordHash` are verified with PBKDF2. Legacy plaintext
+    `password` entries are salted and hashed with a fast keyed HMAC when the user
+    store is built, so the plaintext is not kept around; a slow KDF would only add
+    load time for passwords that are already readable on disk.
+    """
+
+    __slots__ = ("_iterations", "_salt", "_digest")
+
+    def __init__(self, iterations: int, salt: bytes, digest: bytes):
+        self._iterations = iterations
+        self._salt = salt
+        self._digest = digest
+
+    @classmethod
+    def from_user(cls, user: dict) -> "PasswordVerifier":
+        if user.get("passwordHash"):
+            return cls(*_parse_password_hash(user["passwordHash"]))
+        salt = os.urandom(16)
+        return cls(0, salt, cls._keyed_hash(str(user.get("password", "")), salt))
+
+    @staticmethod
+    def _keyed_hash(password: str, salt: bytes) -> bytes:
+        return hmac.new(_PLAINTEXT_HASH_KEY, salt + password.encode("utf-8"), hashlib.sha256).digest()
+
+    def verify(self, password: str) -> bool:
+        if self._iterations:
+            candidate = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), self._salt, self._iterations)
+        else:
+            candidate = self._keyed_hash(password, self._salt)
+        return hmac.compare_digest(candidate, self._digest)
+
+
+# Checked when a login names an unknown user, so both cases take about as long
+DUMMY_VERIFIER = PasswordVerifier.from_user({"password": os.urandom(16).hex()})
+
+
+class TokenError(ValueError):
+    """Raised for malformed, forged or expired access tokens"""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+# JWT algorithms tokens can be signed with (settings.ALGORITHM). Only HMAC ones:
+# asymmetric algorithms (RS256, ES256...) need key pairs this app does not manage.
+TOKEN_ALGORITHMS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+def check_token_algorithm(algorithm: str) -> str:
+    """Return `algorithm` if tokens can be signed with it; raises ValueError otherwise"""
+    if algorithm not in TOKEN_ALGORITHMS:
+        raise ValueError(
+            f"Unsupported token algorithm: {algorithm} (expected one of {', '.join(TOKEN_ALGORITHMS)})"
+        )
+    return algorithm
+
+
+def _token_header(algorithm: str) -> str:
+    return _b64encode(json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":")).encode())
+
+
+def _sign(signing_input: str, secret_key: str, algorithm: str) -> str:
+    digest = TOKEN_ALGORITHMS[algorithm]
+    return _b64encode(hmac.new(secret_key.encode("utf-8"), signing_input.encode("ascii"), digest).digest())
+
+
+def create_access_token(claims: Dict[str, Any], secret_key: str, expires_minutes: int, algorithm: str = "HS256") -> str:
+    """Create a JWT signed with `algorithm` (HS256/384/512) carrying `claims` plus `iat` and `exp`"""
+    check_token_algorithm(algorithm)
+    now = int(time.time())
+    payload = {**claims, "iat": now, "exp": now + expires_minutes * 60}
+    signing_input = _token_header(algorithm) + "." + _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    return signing_input + "." + _sign(signing_input, secret_key, algorithm)
+
+
+def decode_access_token(token: str, secret_key: str, algorithm: str = "HS256") -> Dict[str, Any]:
+    """
+    Verify a JWT signed with `algorithm` and return its payload; raises TokenError if
+    it is invalid, expired or names another algorithm in its header
+    """
+    check_token_algorithm(algorithm)
+    try:
+        header, payload, signature = token.split(".")
+        if json.loads(_b64decode(header)).get("alg") != algorithm:
+            raise TokenError("Unsupported token algorithm")
+        if not hmac.compare_digest(signature, _sign(header + "." + payload, secret_key, algorithm)):
+            raise TokenError("Invalid token signature")
+        claims = json.loads(_b64decode(payload))
+    except TokenError:
+        raise
+    except (ValueError, TypeError, AttributeError) as e:
+        raise TokenError("Malformed token") from e
+    if not isinstance(claims, dict) or not isinstance(claims.get("exp"), (int, float)):
+        raise TokenError("Malformed token")
+    if claims["exp"] <= time.time():
+        raise TokenError("Token expired")
+    return claims
+
+
+class TokenVerifier:
+    """
+    Verifies access tokens, remembering recently verified ones (LRU) so repeated
+    requests with the same token skip the signature check; expiry is still checked
+    on every use.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str = "HS256", max_entries: int = 4096):
+        self.secret_key = secret_key
+        self.algorithm = check_token_algorithm(algorithm)
+        self.max_entries = max_entries
+        self._verified: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # token -> claims
+        self._lock = threading.Lock()
+
+    def create(self, claims: Dict[str, Any], expires_minutes: int) -> str:
+        return create_access_token(claims, self.secret_key, expires_minutes, self.algorithm)
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """Claims of a valid token; raises TokenError otherwise"""
+        with self._lock:
+            claims = self._verified.get(token)
+            if claims is not None:
+                if claims["exp"] > time.time():
+                    self._verified.move_to_end(token)
+                    return claims
+                del self._verified[token]
+                raise TokenError("Token expired")
+
+        claims = decode_access_token(token, self.secret_key, self.algorithm)
+        with self._lock:
+            self._verified[token] = claims
+            while len(self._verified) > self.max_entries:
+                self._verified.popitem(last=False)
+        return claims
@@ -0,0 +1,21 @@
+"""
+Valuation data models
+"""
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ValuationRequest(BaseModel):
+    """Startup data for a combined Berkus and Bill Payne valuation"""
+    idea: str
+    prototype: str
+    team: str
+    relationships: str
+    sales_plan: str
+    opportunity: str
+    competition: str
+    funding_needs: str
+    avg_valuation: int
+    # If set, the factor scores are stored for the composite valuation of this startup
+    startup_id: Optional[str] = None
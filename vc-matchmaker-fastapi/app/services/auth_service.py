@@ -2,46 +2,44 @@
 Authentication service
 """
 from typing import Optional, Dict, Any
+from app.core.config import settings
+from app.core.security import TokenVerifier
 from app.services.data_service import data_service
 
 
 class AuthService:
     """Service for authentication operations"""
     
+    def __init__(self):
+        self._tokens = TokenVerifier(settings.SECRET_KEY, settings.ALGORITHM)
+    
     def authenticate_user(self, username_or_email: str, password: str) -> Optional[Dict[str, Any]]:
         """
         Authenticate a user with username/email and password
         Returns user data without password if successful, None otherwise
         """
-        users = data_service.get_users()
-        
-        # Find user by username or email
-        user = None
-        for u in users:
-            if u.get("username") == username_or_email or u.get("email") == username_or_email:
-                user = u
-                break
-        
-        if not user:
-            return None
-        
-        # Simple password check (in production, use hashed passwords)
-        if user["password"] != password:
-            return None
-        
-        # Return user data without password
-        user_response = user.copy()
-        del user_response["password"]
-        return user_response
+        return data_service.get_user_store().authenticate(username_or_email, password)
     
     def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user by username (without password)"""
-        user = data_service.get_user_by_username(username)
-        if user:
-            user_response = user.copy()
-            del user_response["password"]
-            return user_response
-        return None
+        record = data_service.get_user_store().get_by_username(username)
+        return record.public if record else None
+    
+    def create_access_token(self, user: Dict[str, Any]) -> str:
+        """Signed access token identifying the user"""
+        return self._tokens.create(
+            {
+                "sub": user.get("uid"),
+                "username": user.get("username"),
+                "userType": user.get("userType"),
+                "role": user.get("role")
+            },
+            settings.ACCESS_TOKEN_EXPIRE_MINUTES
+        )
+    
+    def verify_access_token(self, token: str) -> Dict[str, Any]:
+        """Claims of a valid access token; raises TokenError if it is invalid or expired"""
+        return self._tokens.verify(token)
 
 
 # Singleton instance
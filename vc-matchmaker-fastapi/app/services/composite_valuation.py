@@ -0,0 +1,158 @@
+"""
+Composite valuation: stored per-factor analyst scores combined with the model weights
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+# Factors of the multi_agent analysts (mirrored here so the API does not import the
+# agent dependencies) with the weight of each factor in its model's 0-100 total.
+# Keys match defaultModelWeights; "risk" and "vcmethod" have no analyst yet, so
+# startups have no score for them and their weight is left out of the composite.
+MODEL_FACTORS: Dict[str, Dict[str, float]] = {
+    # Berkus: five factors scored 0-20, summed
+    "berkus": {
+        "Sound Idea": 1.0,
+        "Prototype": 1.0,
+        "Quality Management Team": 1.0,
+        "Strategic Relationships": 1.0,
+        "Product Rollout or Sales": 1.0,
+    },
+    # Bill Payne: factors rated 0-100, weighted
+    "billatyne": {
+        "Management Team": 0.30,
+        "Size of Opportunity": 0.25,
+        "Product or Technology": 0.15,
+        "Competitive Environment": 0.10,
+        "Marketing and Sales": 0.10,
+        "Need for Additional Investment": 0.05,
+    },
+}
+
+MAX_FACTOR_SCORE = {"berkus": 20, "billatyne": 100}
+
+# Model names used by the analysts' results and valuation stream events
+MODEL_ALIASES = {"berkus_model": "berkus", "bill_payne_model": "billatyne"}
+
+
+def normalize_scores(scores: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """
+    Validate {model: {factor: score}} (analyst model names are accepted too);
+    raises ValueError for unknown models or factors and out-of-range scores
+    """
+    normalized: Dict[str, Dict[str, float]] = {}
+    for model, factors in scores.items():
+        model = MODEL_ALIASES.get(model, model)
+        if model not in MODEL_FACTORS:
+            raise ValueError(f"Unknown valuation model: {model}")
+        if not isinstance(factors, dict):
+            raise ValueError(f"Scores for {model} must map factor names to scores")
+        for factor, score in factors.items():
+            if factor not in MODEL_FACTORS[model]:
+                raise ValueError(f"Unknown {model} factor: {factor}")
+            if isinstance(score, bool) or not isinstance(score, (int, float)) or not 0 <= score <= MAX_FACTOR_SCORE[model]:
+                raise ValueError(f"{model} score for {factor} must be a number from 0 to {MAX_FACTOR_SCORE[model]}")
+        normalized[model] = {factor: float(score) for factor, score in factors.items()}
+    return normalized
+
+
+class CompositeValuation:
+    """
+    Composite valuation scores for every startup with stored analyst scores.
+
+    Factor scores are kept as a matrix (startups x factors of all models) and
+    reduced once to per-model totals (startups x models). The composite is the
+    weighted mean of the totals a startup has, so changing the model weights is
+    one vectorized pass over the totals plus a sort, with no analyst calls.
+    """
+
+    def __init__(self, records: Dict[str, Dict[str, Dict[str, float]]]):
+        self._lock = threading.Lock()
+        self.models = list(MODEL_FACTORS)
+        columns = [(model, factor) for model, factors in MODEL_FACTORS.items() for factor in factors]
+        self._column = {key: i for i, key in enumerate(columns)}
+        self._model_columns = {model: [self._column[model, f] for f in factors] for model, factors in MODEL_FACTORS.items()}
+        self._factor_weights = {model: np.array(list(factors.values())) for model, factors in MODEL_FACTORS.items()}
+        width = len(columns)
+
+        self.ids: List[str] = []
+        self._position: Dict[str, int] = {}
+        self._factors = np.full((max(len(records), 16), width), np.nan)
+        self._totals = np.full((len(self._factors), len(self.models)), np.nan)
+        for startup_id, scores in records.items():
+            self._set_row(startup_id, scores)
+
+        self.weights: Optional[Dict[str, float]] = None
+        self._weight_vector = np.zeros(len(self.models))
+        self._composite = np.zeros(0)
+        self._order = np.zeros(0, dtype=np.int64)
+
+    def _set_row(self, startup_id: str, scores: Dict[str, Dict[str, float]]) -> int:
+        position = self._position.get(startup_id)
+        if position is None:
+            position = len(self.ids)
+            if position == len(self._factors):
+                self._factors = np.vstack([self._factors, np.full_like(self._factors, np.nan)])
+                self._totals = np.vstack([self._totals, np.full_like(self._totals, np.nan)])
+            self.ids.append(startup_id)
+            self._position[startup_id] = position
+
+        row = np.full(self._factors.shape[1], np.nan)
+        for model, factors in scores.items():
+            for factor, score in factors.items():
+                row[self._column[model, factor]] = score
+        self._factors[position] = row
+        # A model with any factor missing has no total (NaN)
+        for i, model in enumerate(self.models):
+            self._totals[position, i] = row[self._model_columns[model]] @ self._factor_weights[model]
+        return position
+
+    def _rescore(self):
+        totals = self._totals[:len(self.ids)]
+        present = ~np.isnan(totals)
+        weight_sum = present @ self._weight_vector
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self._composite = np.where(present, totals, 0.0) @ self._weight_vector / weight_sum
+        self._order = np.argsort(-np.nan_to_num(self._composite, nan=-np.inf), kind="stable")
+
+    def set_weights(self, weights: Dict[str, float]):
+        """Recompute every composite for new model weights (no-op if they have not changed)"""
+        with self._lock:
+            if weights == self.weights:
+                return
+            self._weight_vector = np.array([float(weights.get(model, 0.0)) for model in self.models])
+            self.weights = dict(weights)
+            self._rescore()
+
+    def set_scores(self, startup_id: str, scores: Dict[str, Dict[str, float]]):
+        """Store (or replace) one startup's factor scores and re-rank"""
+        with self._lock:
+            self._set_row(startup_id, scores)
+            self._rescore()
+
+    def model_scores(self, startup_id: str) -> Optional[Dict[str, Any]]:
+        position = self._position.get(startup_id)
+        if position is None:
+            return None
+        return self._row(position, self._composite, self._totals)
+
+    def _row(self, position: int, composite: np.ndarray, totals: np.ndarray) -> Dict[str, Any]:
+        return {
+            "id": self.ids[position],
+            "compositeScore": None if np.isnan(composite[position]) else round(float(composite[position]), 1),
+            "modelScores": {
+                model: round(float(totals[position, i]), 1)
+                for i, model in enumerate(self.models)
+                if not np.isnan(totals[position, i])
+            },
+        }
+
+    def ranking(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Startups with a composite score, best first"""
+        with self._lock:
+            order, composite, totals = self._order, self._composite, self._totals
+        ranked = order[~np.isnan(composite[order])]
+        positions = ranked if limit is None else ranked[:limit]
+        return [self._row(p, composite, totals) for p in positions]
@@ -2,28 +2,109 @@
 Data service for loading and accessing JSON data
 """
 import json
+import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from app.core.config import settings
+from app.services.data_watcher import DataFileWatcher
+from app.services.dealflow_board import DealflowBoard, sourced_startup_to_deal
+from app.services.matching import VCMatcher
+from app.services.metrics_parser import numeric_columns
+from app.services.portfolio import PortfolioEngine
+from app.services.query import RecordIndex, exact_terms, location_terms
+from app.services.composite_valuation import CompositeValuation
+from app.services.storage import StorageBackend, create_storage
+from app.services.thesis_fit import ThesisScorer
+from app.services.user_store import UserStore
+
+
+logger = logging.getLogger(__name__)
 
 
 class DataService:
     """Service for loading and accessing JSON data files"""
     
-    def __init__(self):
+    def __init__(self, storage: Optional[StorageBackend] = None):
         self.data_dir = Path(__file__).parent.parent.parent / "Data"
+        # filename -> parsed JSON; replaced as a whole (never mutated) on reload
         self._cache: Dict[str, Any] = {}
-        # In-memory storage for dynamic data
-        self._sourced_startups: List[Dict[str, Any]] = []
-        self._deal_notes: Dict[str, Dict[str, Any]] = {}  # startup_id -> notes
-        self._ingested_documents: Dict[str, List[Dict[str, Any]]] = {}  # startup_id -> documents
+        # Held while swapping data in and while building anything derived from it,
+        # so a build never mixes old data with a reset that already happened
+        self._reload_lock = threading.RLock()
+        # Bumped whenever the JSON data is reloaded; response caches key on it
+        self.data_version = 1
+        # id -> startup for the dealflow and watchlist records in vc_dashboard.json
+        self._static_startup_index: Optional[Dict[str, Dict[str, Any]]] = None
+        # Numeric columns parsed from holdingsData display strings
+        self._holdings_columns: Optional[Dict[str, Any]] = None
+        # Founder-to-VC matcher over recommendedVCs in founder_dashboard.json
+        self._vc_matcher: Optional[VCMatcher] = None
+        # users.json indexed by username and email
+        self._user_store: Optional[UserStore] = None
+        # Materialized dealflow board and the storage revision it reflects
+        self._board: Optional[DealflowBoard] = None
+        self._board_revision: Optional[int] = None
+        self._board_lock = threading.Lock()
+        # Portfolio P&L engine and the holdings revision (price updates) it reflects
+        self._portfolio: Optional[PortfolioEngine] = None
+        self._portfolio_revision: Optional[int] = None
+        self._portfolio_lock = threading.Lock()
+        # Settings changed at runtime (investment thesis) and the storage revision they reflect
+        self._runtime_settings: Optional[Dict[str, Any]] = None
+        self._runtime_settings_revision: Optional[int] = None
+        # Thesis-fit scorer over the pipeline and the dealflow revision it reflects
+        self._thesis_scorer: Optional[ThesisScorer] = None
+        self._thesis_scorer_revision: Optional[int] = None
+        self._thesis_lock = threading.Lock()
+        # Composite valuations over stored analyst scores and the valuations revision they reflect
+        self._composite_valuation: Optional[CompositeValuation] = None
+        self._composite_valuation_revision: Optional[int] = None
+        self._valuation_lock = threading.Lock()
+        # Filter indexes for paginated card views
+        self._watchlist_index: Optional[RecordIndex] = None
+        # (board snapshot, index of its deals), replaced together
+        self._deal_index: Optional[Tuple[List[Dict[str, Any]], RecordIndex]] = None
+        # Storage for dynamic data (sourced startups, deal notes, ingested documents)
+        self._storage = storage or create_storage(
+            settings.STORAGE_BACKEND, settings.SQLITE_PATH, settings.SQLITE_POOL_SIZE
+        )
+    
+    def _read_json(self, filename: str) -> Any:
+        with open(self.data_dir / filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
     
     def _load_json(self, filename: str) -> Dict[str, Any]:
         """Load JSON file with caching"""
-        if filename not in self._cache:
-            file_path = self.data_dir / filename
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self._cache[filename] = json.load(f)
-        return self._cache[filename]
+        cache = self._cache
+        if filename not in cache:
+            data = self._read_json(filename)
+            with self._reload_lock:
+                if filename not in self._cache:  # Unless a reload got there first
+                    self._cache = {**self._cache, filename: data}
+                return self._cache[filename]
+        return cache[filename]
+    
+    def reload_files(self, filenames: List[str]) -> List[str]:
+        """
+        Re-parse changed data files and swap them in, then bump `data_version`.
+        Files that fail to parse (e.g. caught mid-write) keep their previous data.
+        Returns the names of the files that were reloaded.
+        """
+        parsed: Dict[str, Any] = {}
+        for filename in filenames:
+            try:
+                parsed[filename] = self._read_json(filename)
+            except (OSError, ValueError) as e:
+                logger.warning("Keeping previous data for %s: %s", filename, e)
+        if not parsed:
+            return []
+        
+        with self._reload_lock:
+            self._cache = {**self._cache, **parsed}
+            self._reset_derived_data()
+        logger.info("Reloaded data files: %s", ", ".join(sorted(parsed)))
+        return list(parsed)
     
     def get_users(self) -> List[Dict[str, Any]]:
         """Get all users"""
@@ -33,26 +114,147 @@ class DataService:
             return data["users"]
         return data if isinstance(data, list) else []
     
+    def get_user_store(self) -> UserStore:
+        """Users indexed by username and email, built once per data version"""
+        store = self._user_store
+        if store is not None:
+            return store
+        with self._reload_lock:
+            if self._user_store is None:
+                self._user_store = UserStore(self.get_users())
+            return self._user_store
+    
     def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user by username"""
-        users = self.get_users()
-        return next((u for u in users if u["username"] == username), None)
+        record = self.get_user_store().get_by_username(username)
+        return record.user if record else None
     
     def get_vc_dashboard_data(self) -> Dict[str, Any]:
         """Get VC dashboard data"""
         return self._load_json("vc_dashboard.json")
     
+    def get_holdings_columns(self) -> Dict[str, Any]:
+        """
+        holdingsData as float arrays (qty, avgCost, price, pnl, pnlPercent, weight, weightPercent),
+        parsed once per data version and aligned with the raw rows
+        """
+        columns = self._holdings_columns
+        if columns is not None:
+            return columns
+        with self._reload_lock:
+            if self._holdings_columns is None:
+                self._holdings_columns = numeric_columns(
+                    self.get_vc_dashboard_data().get("holdingsData", []),
+                    ["qty", "avgCost", "price", "pnl", "weight"]
+                )
+            return self._holdings_columns
+    
+    def get_portfolio(self) -> PortfolioEngine:
+        """Portfolio engine over holdingsData with the latest recorded prices"""
+        revision = self._storage.get_holdings_revision()
+        engine = self._portfolio
+        if engine is None or revision != self._portfolio_revision:
+            # Prices were updated by another worker (or nothing is built yet)
+            engine = self._rebuild_portfolio()
+        return engine
+    
+    def get_holdings_revision(self) -> int:
+        """Storage revision reflected by the current portfolio engine"""
+        self.get_portfolio()
+        return self._portfolio_revision
+    
+    def update_holding_price(self, name: str, price: float) -> bool:
+        """Record a price tick for a holding; returns False if there is no such holding"""
+        if not self.get_portfolio().has_holding(name):
+            return False
+        revision = self._storage.set_holding_price(name, price)
+        with self._portfolio_lock:
+            if self._portfolio is not None and self._portfolio_revision == revision - 1:
+                self._portfolio.update_price(name, price)
+                self._portfolio_revision = revision
+            else:
+                # Missed updates from other workers; rebuild on the next read
+                self._portfolio = None
+        return True
+    
+    def _rebuild_portfolio(self) -> PortfolioEngine:
+        with self._portfolio_lock, self._reload_lock:
+            revision = self._storage.get_holdings_revision()
+            self._portfolio = PortfolioEngine(
+                self.get_vc_dashboard_data().get("holdingsData", []),
+                self.get_holdings_columns(),
+                self._storage.get_holding_prices()
+            )
+            self._portfolio_revision = revision
+            return self._portfolio
+    
     def get_founder_dashboard_data(self) -> Dict[str, Any]:
         """Get founder dashboard data"""
         return self._load_json("founder_dashboard.json")
     
+    def get_vc_matcher(self) -> VCMatcher:
+        """Matcher over the VCs founders can be matched with, built once per data version"""
+        matcher = self._vc_matcher
+        if matcher is not None:
+            return matcher
+        with self._reload_lock:
+            if self._vc_matcher is None:
+                founder_data = self.get_founder_dashboard_data()
+                self._vc_matcher = VCMatcher(
+                    founder_data.get("recommendedVCs", []), founder_data.get("stageOptions", [])
+                )
+            return self._vc_matcher
+    
     def get_categories(self) -> Dict[str, Any]:
         """Get categories data"""
         return self._load_json("categories.json")
     
+    def create_watcher(self) -> DataFileWatcher:
+        """Watcher that reloads data files in the background when they change on disk"""
+        return DataFileWatcher(
+            self.data_dir,
+            self.reload_files,
+            interval=settings.DATA_RELOAD_INTERVAL,
+            max_interval=settings.DATA_RELOAD_MAX_INTERVAL
+        )
+    
     def clear_cache(self):
         """Clear the data cache"""
-        self._cache.clear()
+        with self._reload_lock:
+            self._cache = {}
+            self._reset_derived_data()
+    
+    def _reset_derived_data(self):
+        """Drop everything built from the JSON data; the new data must already be in place"""
+        self.data_version += 1
+        self._static_startup_index = None
+        self._user_store = None
+        self._holdings_columns = None
+        self._portfolio = None
+        self._vc_matcher = None
+        self._thesis_scorer = None
+        self._board = None
+        self._watchlist_index = None
+        self._deal_index = None
+    
+    def _get_static_startup_index(self) -> Dict[str, Dict[str, Any]]:
+        """Build (once) the id index over dealflow deals and startups to watch"""
+        index = self._static_startup_index
+        if index is not None:
+            return index
+        with self._reload_lock:
+            if self._static_startup_index is not None:
+                return self._static_startup_index
+            vc_data = self.get_vc_dashboard_data()
+            index = {}
+            # Dealflow deals take precedence over startupsToWatch entries with the same id
+            for stage in vc_data.get("dealflowStages", []):
+                for deal in stage.get("deals", []):
+                    index.setdefault(deal.get("id"), deal)
+            for startup in vc_data.get("startupsToWatch", []):
+                index.setdefault(startup.get("id"), startup)
+            self._static_startup_index = index
+            return index
     
     # Deal flow management
     def add_sourced_startup(self, startup_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -64,59 +266,245 @@ class DataService:
         if "stage" not in startup_data:
             startup_data["dealflow_stage"] = "SOURCED"
         
-        # Check if already exists
-        existing = next((s for s in self._sourced_startups if s.get("id") == startup_data.get("id")), None)
-        if not existing:
-            self._sourced_startups.append(startup_data)
+        # Stored only if a startup with the same id is not already there
+        revision = self._storage.add_sourced_startup(startup_data)
+        if revision is not None:
+            self._apply_board_change(
+                revision,
+                lambda board: board.add_deal(
+                    sourced_startup_to_deal(startup_data), startup_data.get("dealflow_stage", "SOURCED")
+                )
+            )
+            self._apply_thesis_change(revision, [startup_data])
         
         return startup_data
     
-    def get_sourced_startups(self) -> List[Dict[str, Any]]:
-        """Get all sourced startups"""
-        return self._sourced_startups
+    def move_deal(self, startup_id: str, stage: str) -> None:
+        """Move a deal (static or sourced) to another dealflow stage"""
+        revision = self._storage.move_deal(startup_id, stage)
+        sourced = self._storage.get_sourced_startup(startup_id)
+        card = sourced_startup_to_deal(sourced) if sourced else None
+        self._apply_board_change(revision, lambda board: board.move_deal(startup_id, stage, card))
+        self._apply_thesis_change(revision, [])
+    
+    def get_dealflow_stages(self) -> List[Dict[str, Any]]:
+        """
+        Get the dealflow board (static stages plus sourced startups).
+        The returned snapshot is shared between requests and must not be mutated.
+        """
+        revision = self._storage.get_dealflow_revision()
+        board = self._board
+        if board is None or revision != self._board_revision:
+            # Another worker changed the dealflow (or nothing is built yet)
+            board = self._rebuild_board()
+        return board.snapshot()
+    
+    def get_startups_to_watch_index(self) -> RecordIndex:
+        """Index of startupsToWatch by funding stage, industry and location"""
+        index = self._watchlist_index
+        if index is not None:
+            return index
+        with self._reload_lock:
+            if self._watchlist_index is not None:
+                return self._watchlist_index
+            self._watchlist_index = RecordIndex(
+                self.get_vc_dashboard_data().get("startupsToWatch", []),
+                {
+                    "stage": lambda s: exact_terms(s.get("stage")),
+                    "industry": lambda s: exact_terms(s.get("industry")),
+                    "location": lambda s: location_terms(s.get("location")),
+                },
+                sort_key=lambda s: (str(s.get("id")),)
+            )
+            return self._watchlist_index
+    
+    def get_dealflow_deal_index(self) -> RecordIndex:
+        """
+        Index of all deals on the current dealflow board by dealflow stage, industry
+        and location. Each record is the deal card plus its `dealflow_stage`.
+        """
+        snapshot = self.get_dealflow_stages()
+        cached = self._deal_index
+        if cached is not None and cached[0] is snapshot:
+            return cached[1]
+        with self._reload_lock:
+            cached = self._deal_index
+            if cached is not None and cached[0] is snapshot:
+                return cached[1]
+            stage_rank = {stage.get("name"): rank for rank, stage in enumerate(snapshot)}
+            deals = [
+                {**deal, "dealflow_stage": stage.get("name")}
+                for stage in snapshot
+                for deal in stage.get("deals", [])
+            ]
+            index = RecordIndex(
+                deals,
+                {
+                    "stage": lambda d: exact_terms(d.get("dealflow_stage")),
+                    "industry": lambda d: exact_terms(d.get("industry")),
+                    "location": lambda d: location_terms(d.get("location") or d.get("full_data", {}).get("location")),
+                },
+                # Board stage order, then id: stable while deals are sourced or moved
+                sort_key=lambda d: (stage_rank[d["dealflow_stage"]], str(d.get("id")))
+            )
+            self._deal_index = (snapshot, index)
+            return index
+    
+    def get_dealflow_revision(self) -> int:
+        """Storage revision reflected by the current dealflow board"""
+        self.get_dealflow_stages()
+        return self._board_revision
+    
+    def _rebuild_board(self) -> DealflowBoard:
+        with self._board_lock, self._reload_lock:
+            revision = self._storage.get_dealflow_revision()
+            self._board = DealflowBoard(
+                self.get_vc_dashboard_data().get("dealflowStages", []),
+                self._storage.get_sourced_startups(),
+                self._storage.get_stage_overrides()
+            )
+            self._board_revision = revision
+            return self._board
+    
+    def _apply_board_change(self, revision: int, change) -> None:
+        """Apply a local change incrementally if the board was current just before it"""
+        with self._board_lock:
+            if self._board is not None and self._board_revision == revision - 1:
+                change(self._board)
+                self._board_revision = revision
+            else:
+                # Missed changes from other workers; rebuild on the next read
+                self._board = None
+    
+    # Investment thesis and thesis fit
+    def _get_runtime_settings(self) -> Dict[str, Any]:
+        revision = self._storage.get_settings_revision()
+        if self._runtime_settings is None or revision != self._runtime_settings_revision:
+            self._runtime_settings = self._storage.get_settings()
+            self._runtime_settings_revision = revision
+        return self._runtime_settings
+    
+    def get_settings_revision(self) -> int:
+        """Storage revision of settings changed at runtime (investment thesis)"""
+        return self._storage.get_settings_revision()
+    
+    def get_investment_thesis(self) -> str:
+        """The current investment thesis (defaultInvestmentThesis until one is saved)"""
+        return self._get_runtime_settings().get(
+            "investmentThesis", self.get_vc_dashboard_data().get("defaultInvestmentThesis", "")
+        )
+    
+    def set_investment_thesis(self, thesis: str) -> None:
+        self._storage.set_setting("investmentThesis", thesis)
+    
+    def get_thesis_scorer(self) -> ThesisScorer:
+        """Thesis-fit scorer over every pipeline startup, ranked against the current thesis"""
+        revision = self._storage.get_dealflow_revision()
+        with self._thesis_lock:
+            if self._thesis_scorer is None:
+                with self._reload_lock:
+                    self._thesis_scorer = ThesisScorer(
+                        self.get_pipeline_startups(),
+                        self.get_founder_dashboard_data().get("stageOptions", [])
+                    )
+                    self._thesis_scorer_revision = revision
+            elif revision != self._thesis_scorer_revision:
+                # Startups sourced by another worker
+                self._thesis_scorer.add_startups(self._storage.get_sourced_startups())
+                self._thesis_scorer_revision = revision
+            scorer = self._thesis_scorer
+        scorer.set_thesis(self.get_investment_thesis())
+        return scorer
+    
+    def _apply_thesis_change(self, revision: int, new_startups: List[Dict[str, Any]]) -> None:
+        """Score newly sourced startups incrementally if the scorer was current just before"""
+        with self._thesis_lock:
+            if self._thesis_scorer is not None and self._thesis_scorer_revision == revision - 1:
+                self._thesis_scorer.add_startups(new_startups)
+                self._thesis_scorer_revision = revision
+    
+    # Composite valuation
+    def get_model_weights(self) -> Dict[str, float]:
+        """The current model weights (defaultModelWeights until weights are saved)"""
+        return self._get_runtime_settings().get(
+            "modelWeights", self.get_vc_dashboard_data().get("defaultModelWeights", {})
+        )
+    
+    def set_model_weights(self, weights: Dict[str, float]) -> None:
+        self._storage.set_setting("modelWeights", weights)
+    
+    def get_composite_valuation(self) -> CompositeValuation:
+        """Composite valuations of every startup with stored analyst scores, under the current weights"""
+        revision = self._storage.get_valuations_revision()
+        with self._valuation_lock:
+            if self._composite_valuation is None or revision != self._composite_valuation_revision:
+                # Scores were stored by another worker (or nothing is built yet)
+                self._composite_valuation = CompositeValuation(self._storage.get_valuation_scores())
+                self._composite_valuation_revision = revision
+            valuation = self._composite_valuation
+        valuation.set_weights(self.get_model_weights())
+        return valuation
+    
+    def save_valuation_scores(self, startup_id: str, scores: Dict[str, Dict[str, float]]) -> None:
+        """Store a startup's per-factor analyst scores ({model: {factor: score}})"""
+        revision = self._storage.save_valuation_scores(startup_id, scores)
+        with self._valuation_lock:
+            if self._composite_valuation is not None and self._composite_valuation_revision == revision - 1:
+                self._composite_valuation.set_scores(startup_id, scores)
+                self._composite_valuation_revision = revision
+    
+    def get_valuation_ranking(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Startups ranked by composite valuation, with their names"""
+        ranking = self.get_composite_valuation().ranking(limit=limit)
+        for row in ranking:
+            startup = self.get_startup_by_id(row["id"]) or {}
+            row["name"] = startup.get("name") or startup.get("title")
+        return ranking
+    
+    def get_sourced_startups(self, stage: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get all sourced startups, optionally only those in the given dealflow stage"""
+        return self._storage.get_sourced_startups(stage)
+    
+    def get_pipeline_startups(self) -> List[Dict[str, Any]]:
+        """Every startup `get_startup_by_id` can return: static deals and watchlist, then sourced"""
+        startups = dict(self._get_static_startup_index())
+        for startup in self._storage.get_sourced_startups():
+            startups[startup.get("id")] = startup
+        return list(startups.values())
     
     def get_startup_by_id(self, startup_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific startup by ID (searches both sourced and static data)"""
-        # First check sourced startups
-        startup = next((s for s in self._sourced_startups if s.get("id") == startup_id), None)
+        # First check sourced startups (indexed by id in the storage backend)
+        startup = self._storage.get_sourced_startup(startup_id)
         if startup:
             return startup
         
-        # Then check static deal flow stages
-        vc_data = self.get_vc_dashboard_data()
-        for stage in vc_data.get("dealflowStages", []):
-            for deal in stage.get("deals", []):
-                if deal.get("id") == startup_id:
-                    return deal
-        
-        # Finally check startupsToWatch
-        for startup in vc_data.get("startupsToWatch", []):
-            if startup.get("id") == startup_id:
-                return startup
-        
-        return None
+        # Then check static deal flow stages and startupsToWatch
+        return self._get_static_startup_index().get(startup_id)
     
     # Deal notes management
     def save_deal_notes(self, startup_id: str, notes: Dict[str, Any]) -> Dict[str, Any]:
         """Save deal notes for a startup"""
-        self._deal_notes[startup_id] = notes
+        self._storage.save_deal_notes(startup_id, notes)
         return notes
     
     def get_deal_notes(self, startup_id: str) -> Optional[Dict[str, Any]]:
         """Get deal notes for a startup"""
-        return self._deal_notes.get(startup_id)
+        return self._storage.get_deal_notes(startup_id)
     
     # Document management
     def add_ingested_document(self, startup_id: str, document: Dict[str, Any]) -> Dict[str, Any]:
         """Add an ingested document for a startup"""
-        if startup_id not in self._ingested_documents:
-            self._ingested_documents[startup_id] = []
-        self._ingested_documents[startup_id].append(document)
+        self._storage.add_ingested_document(startup_id, document)
         return document
     
     def get_ingested_documents(self, startup_id: str) -> List[Dict[str, Any]]:
         """Get all ingested documents for a startup"""
-        return self._ingested_documents.get(startup_id, [])
+        return self._storage.get_ingested_documents(startup_id)
+    
+    def find_ingested_document(self, startup_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """An ingested document of the startup with the given content hash, if any"""
+        return self._storage.find_ingested_document(startup_id, content_hash)
 
 
 # Singleton instance
@@ -0,0 +1,83 @@
+"""
+Background watcher that reloads changed Data/*.json files
+"""
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class DataFileWatcher:
+    """
+    Polls the modification time of JSON files in a directory and reports changed files.
+
+    The poll interval starts at `interval` and doubles (up to `max_interval`) while
+    nothing changes, dropping back to `interval` as soon as a change is seen.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        on_change: Callable[[List[str]], None],
+        interval: float = 1.0,
+        max_interval: float = 10.0,
+        pattern: str = "*.json"
+    ):
+        self.directory = Path(directory)
+        self.on_change = on_change
+        self.interval = interval
+        self.max_interval = max_interval
+        self.pattern = pattern
+        self._signatures: Dict[str, Tuple[int, int]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """(mtime_ns, size) of every matching file, keyed by file name"""
+        signatures = {}
+        for path in self.directory.glob(self.pattern):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # Removed between glob and stat
+                continue
+            signatures[path.name] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def poll(self) -> List[str]:
+        """Check once; returns the names of files added or modified since the last check"""
+        signatures = self._scan()
+        changed = [name for name, sig in signatures.items() if self._signatures.get(name) != sig]
+        self._signatures = signatures
+        return changed
+
+    def _run(self):
+        delay = self.interval
+        while not self._stop.wait(delay):
+            try:
+                changed = self.poll()
+                if changed:
+                    self.on_change(changed)
+                    delay = self.interval
+                else:
+                    delay = min(delay * 2, self.max_interval)
+            except Exception:
+                logger.exception("Reloading data files failed")
+                delay = self.interval
+
+    def start(self):
+        """Record the current state of the directory and start polling in a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._signatures = self._scan()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="data-file-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
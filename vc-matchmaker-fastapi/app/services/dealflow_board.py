@@ -0,0 +1,109 @@
+"""
+Materialized dealflow board (pipeline stages with their deals)
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+
+SOURCED_STAGE = "SOURCED"
+
+
+def sourced_startup_to_deal(startup: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a sourced startup to the deal card format used on the board"""
+    return {
+        "id": startup.get("id"),
+        "title": startup.get("name"),
+        "company": startup.get("name"),
+        "stage": startup.get("stage"),
+        "industry": startup.get("industry"),
+        "match": startup.get("match"),
+        "timestamp": startup.get("timestamp"),
+        "fit": 8,  # Default scores
+        "team": 8,
+        "market": 7,
+        "full_data": startup  # Include full startup data
+    }
+
+
+class DealflowBoard:
+    """
+    Dealflow board kept up to date incrementally.
+
+    The published snapshot is never mutated: every update copies only the
+    stages it touches into a new list and swaps it in, so concurrent readers
+    always see a complete board.
+    """
+
+    def __init__(
+        self,
+        static_stages: List[Dict[str, Any]],
+        sourced_startups: List[Dict[str, Any]],
+        stage_overrides: Optional[Dict[str, str]] = None
+    ):
+        self._lock = threading.Lock()
+        self._stages: List[Dict[str, Any]] = [
+            {**stage, "deals": list(stage.get("deals", []))} for stage in static_stages
+        ]
+        self._deal_stage: Dict[str, str] = {
+            deal.get("id"): stage.get("name") for stage in self._stages for deal in stage["deals"]
+        }
+
+        for deal_id, stage_name in (stage_overrides or {}).items():
+            self.move_deal(deal_id, stage_name)
+        for startup in sourced_startups:
+            self.add_deal(sourced_startup_to_deal(startup), startup.get("dealflow_stage", SOURCED_STAGE))
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Current board; treat as read-only"""
+        return self._stages
+
+    def stage_names(self) -> List[str]:
+        return [stage.get("name") for stage in self._stages]
+
+    def _stage_index(self, stages: List[Dict[str, Any]], stage_name: str) -> int:
+        """Index of a stage, creating it if needed (SOURCED goes first, others last)"""
+        for i, stage in enumerate(stages):
+            if stage.get("name") == stage_name:
+                return i
+        new_stage = {"name": stage_name, "count": 0, "deals": []}
+        if stage_name == SOURCED_STAGE:
+            stages.insert(0, new_stage)
+            return 0
+        stages.append(new_stage)
+        return len(stages) - 1
+
+    @staticmethod
+    def _with_deals(stage: Dict[str, Any], deals: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {**stage, "deals": deals, "count": len(deals)}
+
+    def add_deal(self, deal: Dict[str, Any], stage_name: str = SOURCED_STAGE) -> bool:
+        """Add a deal to a stage; returns False if a deal with the same id is already on the board"""
+        with self._lock:
+            if deal.get("id") in self._deal_stage:
+                return False
+            stages = list(self._stages)
+            i = self._stage_index(stages, stage_name)
+            stages[i] = self._with_deals(stages[i], stages[i]["deals"] + [deal])
+            self._deal_stage[deal.get("id")] = stage_name
+            self._stages = stages
+            return True
+
+    def move_deal(self, deal_id: str, stage_name: str, deal: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Move a deal to another stage, optionally replacing its card with `deal`;
+        returns False if the deal is not on the board
+        """
+        with self._lock:
+            current = self._deal_stage.get(deal_id)
+            if current is None:
+                return False
+            stages = list(self._stages)
+            src = self._stage_index(stages, current)
+            if deal is None:
+                deal = next(d for d in stages[src]["deals"] if d.get("id") == deal_id)
+            stages[src] = self._with_deals(stages[src], [d for d in stages[src]["deals"] if d.get("id") != deal_id])
+            dst = self._stage_index(stages, stage_name)
+            stages[dst] = self._with_deals(stages[dst], stages[dst]["deals"] + [deal])
+            self._deal_stage[deal_id] = stage_name
+            self._stages = stages
+            return True
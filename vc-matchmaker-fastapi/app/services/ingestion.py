@@ -0,0 +1,330 @@
+"""
+Streaming ingestion of call transcripts and email threads: incremental chunking,
+per-chunk insight extraction (map) and a bounded-memory summary (reduce)
+"""
+import asyncio
+import codecs
+import hashlib
+import heapq
+import os
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from app.core.config import settings
+
+
+READ_BLOCK_BYTES = 64 * 1024
+
+# Sentences mentioning these carry the substance of a diligence conversation
+KEY_TERMS = frozenset(
+    "revenue arr mrr customers customer growth growing burn runway raise raising round valuation churn "
+    "retention pipeline margin margins pricing contract contracts pilot pilots hire hiring team competitor "
+    "competitors market profitability cac ltv bookings partnership partnerships launch".split()
+)
+POSITIVE_TERMS = frozenset(
+    "strong great excellent growing growth ahead exceeded excited confident profitable signed won "
+    "expanding record improved improving positive".split()
+)
+NEGATIVE_TERMS = frozenset(
+    "concern concerns risk risks delay delayed behind missed churn churned decline declining loss losses "
+    "problem problems issue issues slow slower negative difficult".split()
+)
+FOLLOW_UP_RE = re.compile(
+    r"\b(send|share|follow[ -]up|next steps?|will provide|circle back|get back|schedule|intro(?:duce)?)\b", re.IGNORECASE
+)
+# Sentence ends are ".", "!" or "?" followed by whitespace, so "$2.4M" stays whole
+_SENTENCE_RE = re.compile(r"(?:[^.!?\n]|[.!?](?=[^\s.!?]))+[.!?]*")
+_WORD_RE = re.compile(r"[a-z]+")
+_AMOUNT_RE = re.compile(r"[$₹€£]\s?\d[\d,]*(?:\.\d+)?\s?(?:[kmb]n?\b)?|\b\d+(?:\.\d+)?\s?%", re.IGNORECASE)
+
+# Summary limits (the reduce step keeps only this much, however long the document)
+MAX_KEY_POINTS = 8
+MAX_FOLLOW_UPS = 10
+MAX_METRICS = 20
+
+DOCUMENT_LABELS = {"call_transcript": "Call transcript", "email_thread": "Email thread"}
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds INGEST_MAX_BYTES"""
+
+
+class SpooledUpload(NamedTuple):
+    """An uploaded document written to disk, with the SHA-256 of its content"""
+    path: Path
+    content_hash: str
+    size_bytes: int
+
+
+class TextChunker:
+    """
+    Splits streamed UTF-8 bytes into text chunks of at most `chunk_chars`
+    characters, cut at a paragraph, line or sentence boundary where one falls in
+    the second half of the chunk. Chunks depend only on the text before them, so
+    a thread that grew by a reply re-creates its earlier chunks exactly.
+    """
+
+    SEPARATORS = ("\n\n", "\n", ". ", "? ", "! ")
+
+    def __init__(self, chunk_chars: int):
+        self.chunk_chars = chunk_chars
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+
+    def _cut(self) -> str:
+        window = self._buffer[:self.chunk_chars]
+        cut = self.chunk_chars
+        for separator in self.SEPARATORS:
+            i = window.rfind(separator)
+            if i >= self.chunk_chars // 2:
+                cut = i + len(separator)
+                break
+        chunk, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        return chunk
+
+    def feed(self, data: bytes) -> List[str]:
+        """Chunks completed by `data`"""
+        self._buffer += self._decoder.decode(data)
+        chunks = []
+        while len(self._buffer) > self.chunk_chars:
+            chunks.append(self._cut())
+        return [c for c in chunks if c.strip()]
+
+    def finish(self) -> List[str]:
+        """The remaining chunks at the end of the stream"""
+        self._buffer += self._decoder.decode(b"", final=True)
+        chunks = []
+        while len(self._buffer) > self.chunk_chars:
+            chunks.append(self._cut())
+        chunks.append(self._buffer)
+        self._buffer = ""
+        return [c for c in chunks if c.strip()]
+
+
+def extract_chunk_insights(text: str) -> Dict[str, Any]:
+    """Map step: key sentences, sentiment counts, follow-ups and figures mentioned in one chunk"""
+    key_points: Dict[str, int] = {}
+    follow_ups: Dict[str, None] = {}
+    positive = negative = words = 0
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = " ".join(match.group(0).split())
+        if len(sentence) < 12:
+            continue
+        tokens = _WORD_RE.findall(sentence.lower())
+        words += len(tokens)
+        positive += sum(t in POSITIVE_TERMS for t in tokens)
+        negative += sum(t in NEGATIVE_TERMS for t in tokens)
+        score = sum(t in KEY_TERMS for t in tokens) + len(_AMOUNT_RE.findall(sentence))
+        if score:
+            key_points[sentence] = score
+        if FOLLOW_UP_RE.search(sentence) or sentence.endswith("?"):
+            follow_ups.setdefault(sentence, None)
+    return {
+        "words": words,
+        "key_points": [(score, sentence) for sentence, score in heapq.nlargest(3, key_points.items(), key=lambda item: item[1])],
+        "positive": positive,
+        "negative": negative,
+        "follow_ups": list(follow_ups)[:3],
+        "metrics": list(dict.fromkeys(m.strip() for m in _AMOUNT_RE.findall(text))),
+    }
+
+
+class InsightReducer:
+    """Reduce step: folds chunk insights into one summary, keeping only the top items"""
+
+    def __init__(self):
+        self.chunks = 0
+        self.words = 0
+        self.positive = 0
+        self.negative = 0
+        self._key_points: List[tuple] = []  # min-heap of (score, -position, sentence)
+        # Earliest mentions (text -> chunk position); chunks complete out of order
+        self._follow_ups: Dict[str, int] = {}
+        self._metrics: Dict[str, int] = {}
+
+    @staticmethod
+    def _keep_earliest(items: Dict[str, int], text: str, position: int, limit: int) -> None:
+        if position < items.get(text, position + 1):
+            items[text] = position
+            if len(items) > limit:
+                del items[max(items, key=items.get)]
+
+    def add(self, position: int, insights: Dict[str, Any]) -> None:
+        self.chunks += 1
+        self.words += insights["words"]
+        self.positive += insights["positive"]
+        self.negative += insights["negative"]
+        for score, sentence in insights["key_points"]:
+            item = (score, -position, sentence)
+            duplicate = next((i for i, kept in enumerate(self._key_points) if kept[2] == sentence), None)
+            if duplicate is not None:
+                # Keep the better-scored (then earlier) mention
+                if item > self._key_points[duplicate]:
+                    self._key_points[duplicate] = item
+                    heapq.heapify(self._key_points)
+            elif len(self._key_points) < MAX_KEY_POINTS:
+                heapq.heappush(self._key_points, item)
+            elif item > self._key_points[0]:
+                heapq.heapreplace(self._key_points, item)
+        for sentence in insights["follow_ups"]:
+            self._keep_earliest(self._follow_ups, sentence, position, MAX_FOLLOW_UPS)
+        for metric in insights["metrics"]:
+            self._keep_earliest(self._metrics, metric, position, MAX_METRICS)
+
+    def summary(self, startup: Dict[str, Any], doc_type: str) -> Dict[str, Any]:
+        label = DOCUMENT_LABELS.get(doc_type, "Document")
+        if self.positive > self.negative * 1.5:
+            sentiment = "positive"
+        elif self.negative > self.positive * 1.5:
+            sentiment = "negative"
+        else:
+            sentiment = "neutral"
+        # Key points and follow-ups in the order they appear in the document
+        key_points = [sentence for _, _, sentence in sorted(self._key_points, key=lambda item: -item[1])]
+        follow_ups = sorted(self._follow_ups, key=self._follow_ups.get)
+        return {
+            "summary": f"{label} with {startup.get('name') or startup.get('title')} ({self.words:,} words)",
+            "key_points": key_points,
+            "sentiment": sentiment,
+            "follow_up_required": follow_ups,
+            "metrics_mentioned": sorted(self._metrics, key=self._metrics.get),
+        }
+
+
+class DocumentIngestor:
+    """
+    Ingests documents as streams: bytes are chunked as they arrive, up to
+    `concurrency` chunks are analysed at once (in threads, so a blocking LLM
+    client can be dropped in), and results are reduced as they complete, so
+    memory stays bounded by the chunk size and concurrency, not the document.
+    Chunk insights are cached by the chunk's SHA-256, so re-uploaded or
+    extended documents only analyse chunks that have not been seen.
+    """
+
+    def __init__(self, upload_dir: Path, chunk_chars: int = 4000, concurrency: int = 4, cache_size: int = 16384):
+        self.upload_dir = Path(upload_dir)
+        self.chunk_chars = chunk_chars
+        self.concurrency = concurrency
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
+    async def spool(self, stream: AsyncIterable[bytes], key: str, max_bytes: int) -> SpooledUpload:
+        """
+        Write an upload stream to a file in `upload_dir` while hashing it (one file
+        per `key` and content); raises UploadTooLarge past `max_bytes`
+        """
+        # File I/O runs in a thread so that a slow disk does not stall the event loop
+        await asyncio.to_thread(self.upload_dir.mkdir, parents=True, exist_ok=True)
+        partial = self.upload_dir / f"{uuid.uuid4().hex}.part"
+        digest = hashlib.sha256()
+        size = 0
+        f = await asyncio.to_thread(open, partial, "wb")
+        try:
+            async for block in stream:
+                size += len(block)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"Uploads are limited to {max_bytes} bytes")
+                digest.update(block)
+                await asyncio.to_thread(f.write, block)
+            await asyncio.to_thread(f.close)
+        except BaseException:
+            f.close()
+            partial.unlink(missing_ok=True)
+            raise
+        content_hash = digest.hexdigest()
+        key_hash = hashlib.sha256(key.encode()).hexdigest()[:16]
+        path = self.upload_dir / f"{key_hash}-{content_hash}.txt"
+        await asyncio.to_thread(os.replace, partial, path)
+        return SpooledUpload(path, content_hash, size)
+
+    def _cached(self, chunk_hash: str) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            insights = self._cache.get(chunk_hash)
+            if insights is not None:
+                self._cache.move_to_end(chunk_hash)
+            return insights
+
+    def _remember(self, chunk_hash: str, insights: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            self._cache[chunk_hash] = insights
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    async def _analyse(self, position: int, chunk: str, semaphore: asyncio.Semaphore):
+        chunk_hash = hashlib.sha256(chunk.encode()).hexdigest()
+        insights = self._cached(chunk_hash)
+        if insights is not None:
+            return position, insights, True
+        async with semaphore:
+            insights = await asyncio.to_thread(extract_chunk_insights, chunk)
+        self._remember(chunk_hash, insights)
+        return position, insights, False
+
+    async def ingest(self, blocks: Union[AsyncIterable[bytes], Iterable[bytes]]) -> Dict[str, Any]:
+        """Chunk, analyse and reduce a stream of bytes; returns the reducer and chunk counts"""
+        chunker = TextChunker(self.chunk_chars)
+        reducer = InsightReducer()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = set()
+        reused = 0
+        position = 0
+
+        async def collect(wait_for):
+            nonlocal reused
+            done, still_pending = await asyncio.wait(pending, return_when=wait_for)
+            for task in done:
+                chunk_position, insights, from_cache = task.result()
+                reducer.add(chunk_position, insights)
+                reused += from_cache
+            return still_pending
+
+        async def submit(chunks: List[str]):
+            nonlocal pending, position
+            for chunk in chunks:
+                # Backpressure: stop reading while twice `concurrency` chunks are in flight
+                while len(pending) >= self.concurrency * 2:
+                    pending = await collect(asyncio.FIRST_COMPLETED)
+                pending.add(asyncio.ensure_future(self._analyse(position, chunk, semaphore)))
+                position += 1
+
+        try:
+            if hasattr(blocks, "__aiter__"):
+                async for block in blocks:
+                    await submit(chunker.feed(block))
+            else:
+                for block in blocks:
+                    await submit(chunker.feed(block))
+            await submit(chunker.finish())
+            if pending:
+                pending = await collect(asyncio.ALL_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+        return {"reducer": reducer, "chunks": position, "chunks_reused": reused}
+
+    @staticmethod
+    async def read_blocks(path: Path) -> AsyncIterator[bytes]:
+        """A spooled file in READ_BLOCK_BYTES blocks, for `ingest` (read in a thread, like `spool` writes)"""
+        f = await asyncio.to_thread(open, path, "rb")
+        try:
+            while True:
+                block = await asyncio.to_thread(f.read, READ_BLOCK_BYTES)
+                if not block:
+                    return
+                yield block
+        finally:
+            f.close()
+
+
+# Singleton instance
+document_ingestor = DocumentIngestor(
+    settings.INGEST_UPLOAD_DIR,
+    chunk_chars=settings.INGEST_CHUNK_CHARS,
+    concurrency=settings.INGEST_CONCURRENCY,
+    cache_size=settings.INGEST_CHUNK_CACHE_SIZE
+)
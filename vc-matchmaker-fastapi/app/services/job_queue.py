@@ -0,0 +1,509 @@
+"""
+In-process background jobs: a bounded worker pool with job ids, status lookups,
+deduplication of identical in-flight jobs and optional SQLite persistence
+"""
+import asyncio
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+IN_FLIGHT_STATUSES = ("queued", "running")
+
+# Fields returned by the status endpoint (the payload stays internal)
+PUBLIC_FIELDS = ("id", "kind", "startup_id", "status", "result", "error", "created_at", "started_at", "finished_at")
+
+
+class JobQueueFull(Exception):
+    """Raised when the queue already holds its maximum number of pending jobs"""
+
+
+def dedup_key(kind: str, startup_id: str, payload: Dict[str, Any]) -> str:
+    """Jobs with the same kind, startup and payload are identical"""
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{kind}:{startup_id}:{digest}"
+
+
+def public_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: job.get(field) for field in PUBLIC_FIELDS}
+
+
+class JobStore(ABC):
+    """Where jobs and their results are kept"""
+
+    @abstractmethod
+    def insert(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Add a queued job unless an identical one (same dedup_key) is in flight;
+        returns that in-flight job instead, or None if `job` was added
+        """
+
+    @abstractmethod
+    def claim(self, job_id: str, lease_until: float) -> Optional[Dict[str, Any]]:
+        """
+        Mark a queued job (or a running one whose lease expired) as running;
+        returns it, or None if it is not claimable
+        """
+
+    @abstractmethod
+    def finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        ...
+
+    @abstractmethod
+    def requeue(self, job_ids: List[str]) -> None:
+        """Put running jobs back in the queue (e.g. on shutdown)"""
+
+    @abstractmethod
+    def renew(self, job_ids: List[str], lease_until: float) -> None:
+        """Extend the leases of running jobs that are still being worked on"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def recoverable(self, now: float) -> List[str]:
+        """Ids of queued jobs and of running jobs whose lease expired, oldest first"""
+
+    @abstractmethod
+    def expired(self, now: float) -> List[str]:
+        """Ids of running jobs whose lease expired (their worker stopped or died), oldest first"""
+
+    @abstractmethod
+    def prune(self, finished_before: float) -> None:
+        """Forget finished jobs older than `finished_before`"""
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local job store; jobs are lost on restart"""
+
+    def __init__(self, max_finished: int = 10000):
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._in_flight: Dict[str, str] = {}  # dedup_key -> job id
+        self._max_finished = max_finished
+        self._finished = 0
+
+    def insert(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            existing = self._in_flight.get(job["dedup_key"])
+            if existing is not None:
+                return dict(self._jobs[existing])
+            self._jobs[job["id"]] = dict(job)
+            self._in_flight[job["dedup_key"]] = job["id"]
+            return None
+
+    def claim(self, job_id: str, lease_until: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not (
+                job["status"] == "queued" or (job["status"] == "running" and job["lease_until"] < time.time())
+            ):
+                return None
+            job.update(status="running", started_at=time.time(), lease_until=lease_until)
+            return dict(job)
+
+    def finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(status=status, result=result, error=error, finished_at=time.time())
+            self._in_flight.pop(job["dedup_key"], None)
+            self._finished += 1
+            # Drop the oldest finished jobs once over the limit
+            if self._finished > self._max_finished:
+                for old_id in list(self._jobs):
+                    if self._finished <= self._max_finished:
+                        break
+                    if self._jobs[old_id]["status"] not in IN_FLIGHT_STATUSES:
+                        del self._jobs[old_id]
+                        self._finished -= 1
+
+    def requeue(self, job_ids: List[str]) -> None:
+        with self._lock:
+            for job_id in job_ids:
+                job = self._jobs.get(job_id)
+                if job is not None and job["status"] == "running":
+                    job.update(status="queued", started_at=None, lease_until=None)
+
+    def renew(self, job_ids: List[str], lease_until: float) -> None:
+        with self._lock:
+            for job_id in job_ids:
+                job = self._jobs.get(job_id)
+                if job is not None and job["status"] == "running":
+                    job["lease_until"] = lease_until
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def recoverable(self, now: float) -> List[str]:
+        with self._lock:
+            return [
+                job["id"] for job in self._jobs.values()
+                if job["status"] == "queued" or (job["status"] == "running" and job["lease_until"] < now)
+            ]
+
+    def expired(self, now: float) -> List[str]:
+        with self._lock:
+            return [job["id"] for job in self._jobs.values() if job["status"] == "running" and job["lease_until"] < now]
+
+    def prune(self, finished_before: float) -> None:
+        with self._lock:
+            for job_id, job in list(self._jobs.items()):
+                if job["status"] not in IN_FLIGHT_STATUSES and job["finished_at"] < finished_before:
+                    del self._jobs[job_id]
+                    self._finished -= 1
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Jobs in a local SQLite file, so queued jobs survive restarts. A partial unique
+    index on dedup_key (in-flight jobs only) makes deduplication atomic, also
+    between workers sharing the file.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        kind TEXT NOT NULL,
+        startup_id TEXT NOT NULL,
+        dedup_key TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        status TEXT NOT NULL,
+        result TEXT,
+        error TEXT,
+        created_at REAL NOT NULL,
+        started_at REAL,
+        finished_at REAL,
+        lease_until REAL
+    );
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_in_flight ON jobs (dedup_key) WHERE status IN ('queued', 'running');
+    CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+    """
+
+    COLUMNS = (
+        "id", "kind", "startup_id", "dedup_key", "payload", "status", "result", "error",
+        "created_at", "started_at", "finished_at", "lease_until"
+    )
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        with self._lock, self._conn:
+            self._conn.executescript(self.SCHEMA)
+
+    def _row_to_job(self, row: Optional[Tuple]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(zip(self.COLUMNS, row))
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+        return job
+
+    def _select(self, where: str, params: Tuple) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE {where}", params).fetchone()
+        return self._row_to_job(row)
+
+    def insert(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        values = {**job, "payload": json.dumps(job["payload"]), "result": None}
+        with self._lock, self._conn:
+            try:
+                self._conn.execute(
+                    f"INSERT INTO jobs ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                    tuple(values.get(column) for column in self.COLUMNS)
+                )
+                return None
+            except sqlite3.IntegrityError:
+                # Deduplicated in the same transaction, so the in-flight job still exists
+                return self._select(
+                    "dedup_key = ? AND status IN ('queued', 'running')", (job["dedup_key"],)
+                )
+
+    def claim(self, job_id: str, lease_until: float) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock, self._conn:
+            claimed = self._conn.execute(
+                "UPDATE jobs SET status = 'running', started_at = ?, lease_until = ? "
+                "WHERE id = ? AND (status = 'queued' OR (status = 'running' AND lease_until < ?))",
+                (now, lease_until, job_id, now)
+            ).rowcount
+            return self._select("id = ?", (job_id,)) if claimed else None
+
+    def finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id)
+            )
+
+    def requeue(self, job_ids: List[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, lease_until = NULL "
+                "WHERE id = ? AND status = 'running'",
+                [(job_id,) for job_id in job_ids]
+            )
+
+    def renew(self, job_ids: List[str], lease_until: float) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = 'running'",
+                [(lease_until, job_id) for job_id in job_ids]
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._select("id = ?", (job_id,))
+
+    def recoverable(self, now: float) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' OR (status = 'running' AND lease_until < ?) "
+                "ORDER BY created_at",
+                (now,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def expired(self, now: float) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status = 'running' AND lease_until < ? ORDER BY created_at", (now,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def prune(self, finished_before: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND finished_at < ?", (finished_before,)
+            )
+
+
+def create_job_store(backend: str, sqlite_path: Path) -> JobStore:
+    if backend == "memory":
+        return InMemoryJobStore()
+    if backend == "sqlite":
+        return SQLiteJobStore(sqlite_path)
+    raise ValueError(f"Unknown job store backend: {backend}")
+
+
+class JobQueue:
+    """
+    Runs registered job handlers off the request path.
+
+    Workers are asyncio tasks on the queue's own event loop (in a daemon thread),
+    so jobs keep running independently of the server's loop. Coroutine handlers
+    are awaited there; plain functions run in a thread pool of the same size, so
+    at most `workers` jobs run at once. Handlers are called with the startup id
+    and the job payload and return a JSON-serializable result.
+
+    Running jobs hold a lease that is renewed while they run. A job whose lease
+    expired (its worker process died) is picked up again by the periodic reclaim,
+    so it does not have to wait for a restart.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        workers: int = 4,
+        max_pending: int = 1000,
+        lease_seconds: float = 300.0,
+        retention_seconds: float = 86400.0
+    ):
+        self.store = store
+        self.workers = workers
+        self.max_pending = max_pending
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_seconds
+        self._handlers: Dict[str, Callable[[str, Dict[str, Any]], Any]] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._running: Dict[str, Dict[str, Any]] = {}  # job id -> job, for requeueing on shutdown
+        self._threads: Dict[str, futures.Future] = {}  # job id -> sync handler running in the executor
+
+    def register(self, kind: str, handler: Callable[[str, Dict[str, Any]], Any]) -> None:
+        self._handlers[kind] = handler
+
+    def start(self) -> None:
+        """Start the workers and requeue jobs left over from a previous run (idempotent)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            ready = threading.Event()
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job-worker")
+            self._thread = threading.Thread(target=self._run_loop, args=(ready,), name="job-queue", daemon=True)
+            self._thread.start()
+            ready.wait()
+
+        now = time.time()
+        self.store.prune(now - self.retention_seconds)
+        for job_id in self.store.recoverable(now):
+            self._enqueue(job_id)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the workers; jobs still running go back to the queue for the next start.
+        Sync handlers cannot be interrupted, so those already running get the rest of
+        `timeout` to finish. One still running after that keeps its lease and its
+        outcome is recorded when it returns; it is retried only if it outlives the lease.
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            if thread is None:
+                return
+            self._thread = self._loop = self._queue = self._executor = None
+            self._pending = 0
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        executor.shutdown(wait=False, cancel_futures=True)
+        futures.wait(list(self._threads.values()), timeout=max(0.0, deadline - time.monotonic()))
+
+        requeue = []
+        for job_id in list(self._running):
+            future = self._threads.get(job_id)
+            if future is None or future.cancelled():
+                requeue.append(job_id)
+            else:
+                # Recorded as soon as the handler returns, even after the timeout
+                future.add_done_callback(lambda f, job_id=job_id: self._record(job_id, f))
+        self.store.requeue(requeue)
+        self._running.clear()
+        self._threads.clear()
+
+    def _record(self, job_id: str, future: futures.Future) -> None:
+        """Store the outcome of a sync handler that was still running when the queue stopped"""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self.store.finish(job_id, "failed", error=str(future.exception()))
+        else:
+            self.store.finish(job_id, "succeeded", result=future.result())
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        for _ in range(self.workers):
+            loop.create_task(self._worker())
+        loop.create_task(self._reclaim())
+        ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
+
+    def _enqueue(self, job_id: str) -> None:
+        with self._lock:
+            self._pending += 1
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, job_id)
+
+    def submit(self, kind: str, startup_id: str, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Queue a job; returns (job, created). If an identical job is already queued
+        or running, that job is returned with created=False instead.
+        Raises JobQueueFull when `max_pending` jobs are waiting.
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        self.start()
+        if self._pending >= self.max_pending:
+            raise JobQueueFull(f"{self._pending} jobs are already waiting")
+
+        job = {
+            "id": uuid.uuid4().hex,
+            "kind": kind,
+            "startup_id": startup_id,
+            "dedup_key": dedup_key(kind, startup_id, payload),
+            "payload": payload,
+            "status": "queued",
+            "created_at": time.time(),
+        }
+        existing = self.store.insert(job)
+        if existing is not None:
+            return public_job(existing), False
+        self._enqueue(job["id"])
+        return public_job(job), True
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.store.get(job_id)
+        return public_job(job) if job is not None else None
+
+    async def _reclaim(self) -> None:
+        """Renew the leases of this queue's running jobs and requeue jobs whose lease expired"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            now = time.time()
+            self.store.renew(list(self._running), now + self.lease_seconds)
+            for job_id in self.store.expired(now):
+                self._enqueue(job_id)
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            with self._lock:
+                self._pending -= 1
+            job = self.store.claim(job_id, time.time() + self.lease_seconds)
+            if job is None:
+                # Finished, or claimed by another worker process sharing the store
+                continue
+            handler = self._handlers.get(job["kind"])
+            if handler is None:
+                self.store.finish(job_id, "failed", error=f"No handler for job kind: {job['kind']}")
+                continue
+
+            self._running[job_id] = job
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    result = await handler(job["startup_id"], job["payload"])
+                else:
+                    future = self._executor.submit(handler, job["startup_id"], job["payload"])
+                    self._threads[job_id] = future
+                    result = await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                # Left in _running so that stop() requeues it (or records the sync handler's outcome)
+                raise
+            except Exception as e:
+                self.store.finish(job_id, "failed", error=str(e))
+            else:
+                self.store.finish(job_id, "succeeded", result=result)
+            self._running.pop(job_id, None)
+            self._threads.pop(job_id, None)
+
+
+# Singleton instance
+job_queue = JobQueue(
+    create_job_store(settings.JOBS_BACKEND, settings.JOBS_SQLITE_PATH),
+    workers=settings.JOBS_WORKERS,
+    max_pending=settings.JOBS_MAX_PENDING,
+    lease_seconds=settings.JOBS_LEASE_SECONDS,
+    retention_seconds=settings.JOBS_RETENTION_SECONDS
+)
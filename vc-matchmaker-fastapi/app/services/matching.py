@@ -0,0 +1,175 @@
+"""
+Founder-to-VC matching: TF-IDF over VC theses with an inverted index and top-k ranking
+"""
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.services.metrics_parser import parse_metric
+
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it of on or our the their to we with across all".split()
+)
+
+# Weights of the match components (each scored 0..1)
+MATCH_WEIGHTS = {"thesis": 0.5, "stage": 0.25, "checkSize": 0.15, "region": 0.1}
+
+# Cosine similarity at which the thesis component counts as a perfect match;
+# short theses rarely overlap a founder's description by much more than this
+THESIS_SIMILARITY_FOR_FULL_SCORE = 0.5
+
+FIT_LABELS = ((85, "Strong fit"), (75, "Good fit"), (60, "Moderate fit"), (0, "Potential fit"))
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _vc_text(vc: Dict[str, Any]) -> str:
+    parts = [vc.get("investmentThesis", ""), " ".join(vc.get("sectors", []) or [])]
+    return " ".join(p for p in parts if p)
+
+
+def founder_text(profile: Dict[str, Any]) -> str:
+    """The parts of a founder profile that describe what the company does"""
+    fields = (
+        "industry", "tagline", "description", "pitch", "productType",
+        "targetMarket", "businessModel", "techStack", "competitiveAdvantage"
+    )
+    return " ".join(str(profile[f]) for f in fields if profile.get(f))
+
+
+class VCMatcher:
+    """
+    Ranks VCs for a founder profile.
+
+    Built once per data version: each VC's thesis becomes an L2-normalized TF-IDF
+    vector stored as postings in an inverted index (term -> VC positions and
+    weights), and stage lists, check-size ranges and regions become arrays. A
+    query touches only the postings of its own terms, scores every component
+    with vector operations, and keeps the top k with a heap.
+    """
+
+    def __init__(self, vcs: List[Dict[str, Any]], stage_order: Optional[List[str]] = None):
+        self.vcs = vcs
+        self.stage_order = [s.lower() for s in (stage_order or [])]
+        n = len(vcs)
+
+        documents = [Counter(tokenize(_vc_text(vc))) for vc in vcs]
+        document_frequency = Counter(term for doc in documents for term in doc)
+        self.idf = {term: math.log((1 + n) / (1 + df)) + 1 for term, df in document_frequency.items()}
+
+        postings: Dict[str, List[tuple]] = {}
+        for position, doc in enumerate(documents):
+            weights = {term: (1 + math.log(tf)) * self.idf[term] for term, tf in doc.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term, weight in weights.items():
+                postings.setdefault(term, []).append((position, weight / norm))
+        self.index = {
+            term: (np.array([p for p, _ in entries], dtype=np.int64), np.array([w for _, w in entries]))
+            for term, entries in postings.items()
+        }
+
+        self._stage_sets = [{str(s).lower() for s in (vc.get("stage") or [])} for vc in vcs]
+        checks = [parse_metric(vc.get("checkSize")) for vc in vcs]
+        self.check_low = np.array([np.nan if c.low is None else c.low for c in checks])
+        self.check_high = np.array([np.nan if c.high is None else c.high for c in checks])
+        self._regions = [[str(r).lower() for r in (vc.get("regions") or [])] for vc in vcs]
+
+    def _thesis_scores(self, text: str) -> np.ndarray:
+        scores = np.zeros(len(self.vcs))
+        query = Counter(t for t in tokenize(text) if t in self.index)
+        weights = {term: (1 + math.log(tf)) * self.idf[term] for term, tf in query.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        for term, weight in weights.items():
+            positions, doc_weights = self.index[term]
+            scores[positions] += (weight / norm) * doc_weights
+        return scores
+
+    def _stage_scores(self, stage: Optional[str]) -> np.ndarray:
+        """1 if the VC invests at the founder's stage, 0.5 at an adjacent stage, else 0"""
+        if not stage:
+            return np.full(len(self.vcs), 0.5)
+        stage = stage.lower()
+        adjacent = set()
+        if stage in self.stage_order:
+            i = self.stage_order.index(stage)
+            adjacent = set(self.stage_order[max(0, i - 1):i]) | set(self.stage_order[i + 1:i + 2])
+        return np.array([
+            1.0 if stage in stages else 0.5 if stages & adjacent else 0.0
+            for stages in self._stage_sets
+        ])
+
+    def _check_size_scores(self, amount: Optional[float]) -> np.ndarray:
+        """1 inside the VC's check range, decaying with the log distance outside it"""
+        if amount is None or amount <= 0:
+            return np.full(len(self.vcs), 0.5)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            below = np.log10(self.check_low / amount)
+            above = np.log10(amount / self.check_high)
+            distance = np.fmax(np.fmax(below, above), 0)
+            scores = np.clip(1 - distance, 0, 1)
+        # fmax ignores a missing bound; with neither bound the check size is unknown
+        unknown = np.isnan(self.check_low) & np.isnan(self.check_high)
+        return np.where(unknown, 0.5, scores)
+
+    def _region_scores(self, location: Optional[str]) -> np.ndarray:
+        """1 if the VC lists no regions or one that appears in the founder's location"""
+        location = (location or "").lower()
+        return np.array([
+            1.0 if not regions or any(r in location for r in regions) else 0.0
+            for regions in self._regions
+        ])
+
+    def rank(self, profile: Dict[str, Any], k: int = 10) -> List[Dict[str, Any]]:
+        """Top `k` VCs for a founder profile, best first, with matchScore and reasoning"""
+        if not self.vcs or k <= 0:
+            return []
+        components = {
+            "thesis": np.minimum(self._thesis_scores(founder_text(profile)) / THESIS_SIMILARITY_FOR_FULL_SCORE, 1.0),
+            "stage": self._stage_scores(profile.get("stage")),
+            "checkSize": self._check_size_scores(
+                parse_metric(profile.get("fundingSought") or profile.get("fundingGoal")).value
+            ),
+            "region": self._region_scores(profile.get("location")),
+        }
+        total = sum(MATCH_WEIGHTS[name] * scores for name, scores in components.items()) * 100
+
+        top = heapq.nlargest(k, zip(total.tolist(), range(len(self.vcs))), key=lambda item: item[0])
+        readiness = profile.get("readinessScore")
+        return [
+            self._match(position, score, {name: float(scores[position]) for name, scores in components.items()}, readiness)
+            for score, position in top
+        ]
+
+    def _match(self, position: int, score: float, breakdown: Dict[str, float], readiness: Optional[float]) -> Dict[str, Any]:
+        vc = self.vcs[position]
+        match_score = int(round(score))
+        reasons = []
+        if breakdown["thesis"] >= 0.5:
+            reasons.append(f"thesis aligns with your product ({vc.get('investmentThesis')})")
+        if breakdown["stage"] == 1.0:
+            reasons.append("invests at your stage")
+        elif breakdown["stage"] == 0.0:
+            reasons.append("does not usually invest at your stage")
+        if breakdown["checkSize"] == 1.0:
+            reasons.append("your raise fits their check size")
+        elif breakdown["checkSize"] < 0.5:
+            reasons.append("your raise is outside their usual check size")
+        label = next(text for threshold, text in FIT_LABELS if match_score >= threshold)
+        return {
+            **vc,
+            "matchScore": match_score,
+            # Founder readiness weighted by how well this VC fits
+            "readinessForThisVC": int(round(readiness * (0.5 + score / 200))) if readiness is not None else match_score,
+            "reasoning": f"{label}: " + ("; ".join(reasons) if reasons else "limited overlap with their focus"),
+            "matchBreakdown": {name: round(value, 3) for name, value in breakdown.items()},
+        }
+
@@ -0,0 +1,150 @@
+"""
+Parsing of display strings for money and metrics ("$1.2M", "₹250,400 (52.28%)", "+35% MoM")
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+
+CURRENCY_SYMBOLS = {"$": "USD", "₹": "INR", "€": "EUR", "£": "GBP"}
+
+SUFFIX_MULTIPLIERS = {
+    "k": 1e3, "thousand": 1e3,
+    "m": 1e6, "mm": 1e6, "mn": 1e6, "million": 1e6,
+    "b": 1e9, "bn": 1e9, "billion": 1e9,
+}
+
+PERIODS = {
+    "month": "month", "mo": "month", "mom": "month", "monthly": "month",
+    "year": "year", "yr": "year", "yoy": "year", "annually": "year", "annual": "year",
+    "quarter": "quarter", "qtr": "quarter", "qoq": "quarter",
+    "week": "week", "wk": "week", "wow": "week",
+}
+
+# The number is an atomic group, so it never backtracks into a shorter number
+# ("3.5x" is 3.5, not 3), and a suffix only counts when no letter follows it
+# ("3 months" has none). Numbers and signs attached to a word ("Q3", "COVID-19")
+# are not amounts.
+_AMOUNT = (
+    r"(?:(?<![a-z\d])(?P<{p}sign>[-+−]))?\s*(?P<{p}cur>[$₹€£])?\s*(?:(?<![a-z\d])(?P<{p}sign2>[-−]))?\s*"
+    r"(?<![a-z\d.,])(?<![a-z][-−])(?P<{p}num>(?>\d[\d,]*(?:\.\d+)?|\.\d+))"
+    r"(?:\s*(?P<{p}suffix>thousand|million|billion|mm|bn|mn|[kmb])(?![a-z]))?\s*(?P<{p}pct>%)?"
+)
+_AMOUNT_RE = re.compile(_AMOUNT.format(p=""), re.IGNORECASE)
+_RANGE_RE = re.compile(
+    _AMOUNT.format(p="a_") + r"\s*(?:-|–|—|to)\s*" + _AMOUNT.format(p="b_"), re.IGNORECASE
+)
+_PAREN_PERCENT_RE = re.compile(r"\(\s*([-+−]?\s*\d[\d,]*(?:\.\d+)?)\s*%\s*\)")
+_PERIOD_RE = re.compile(
+    r"(?:/|\bper\s+)\s*(month|mo|year|yr|quarter|qtr|week|wk)\b|\b(mom|yoy|qoq|wow|monthly|annually|annual)\b",
+    re.IGNORECASE
+)
+
+
+class Metric(NamedTuple):
+    """A parsed display string; fields that do not apply are None"""
+    value: Optional[float]     # The amount (midpoint for ranges), or the percentage for "18.4%"
+    low: Optional[float]       # Range bounds; equal to value when it is not a range
+    high: Optional[float]
+    currency: Optional[str]    # ISO code, e.g. "USD" or "INR"
+    percent: Optional[float]   # "18.4%" -> 18.4; "₹250,400 (52.28%)" -> 52.28
+    period: Optional[str]      # "month", "quarter", "year" or "week" for rates like "$80K/month"
+
+
+EMPTY_METRIC = Metric(None, None, None, None, None, None)
+
+
+def _amount(match: "re.Match", prefix: str = "") -> float:
+    group = lambda name: match.group(prefix + name)
+    amount = float(group("num").replace(",", ""))
+    if group("suffix"):
+        amount *= SUFFIX_MULTIPLIERS[group("suffix").lower()]
+    if group("sign") in ("-", "−") or group("sign2"):
+        amount = -amount
+    return amount
+
+
+@lru_cache(maxsize=65536)
+def _parse_text(text: str) -> Metric:
+    range_match = _RANGE_RE.match(text.strip())
+    match = range_match or _AMOUNT_RE.search(text)
+    if match is None:
+        return EMPTY_METRIC
+
+    if range_match:
+        low = _amount(range_match, "a_")
+        high = _amount(range_match, "b_")
+        if not range_match.group("a_suffix") and range_match.group("b_suffix"):
+            # "$12-15M": the suffix applies to both ends
+            low *= SUFFIX_MULTIPLIERS[range_match.group("b_suffix").lower()]
+        currency_symbol = range_match.group("a_cur") or range_match.group("b_cur")
+        is_percent = bool(range_match.group("b_pct") or range_match.group("a_pct"))
+        value = (low + high) / 2
+    else:
+        value = _amount(match)
+        low = high = value
+        currency_symbol = match.group("cur")
+        is_percent = bool(match.group("pct"))
+
+    percent = value if is_percent else None
+    paren = _PAREN_PERCENT_RE.search(text)
+    if paren and not is_percent:
+        percent = float(re.sub(r"[\s,]", "", paren.group(1)).replace("−", "-"))
+
+    period_match = _PERIOD_RE.search(text)
+    period = PERIODS[(period_match.group(1) or period_match.group(2)).lower()] if period_match else None
+
+    return Metric(
+        value=value,
+        low=low,
+        high=high,
+        currency=CURRENCY_SYMBOLS.get(currency_symbol) if currency_symbol else None,
+        percent=percent,
+        period=period
+    )
+
+
+def parse_metric(value: Any) -> Metric:
+    """
+    Parse a money or metric display string: currency symbols, thousands separators,
+    K/M/MM/B suffixes (and "thousand", "million", "billion"), percentages (bare or in parentheses), ranges ("$10M - $20M")
+    and rates ("$80K/month", "+35% MoM"). Numbers pass through; anything without
+    a number gives EMPTY_METRIC. Results are memoized per string.
+    """
+    if isinstance(value, bool) or value is None:
+        return EMPTY_METRIC
+    if isinstance(value, (int, float)):
+        return Metric(float(value), float(value), float(value), None, None, None)
+    if not isinstance(value, str):
+        return EMPTY_METRIC
+    return _parse_text(value)
+
+
+def parse_amount(value: Any, currency: Optional[str] = None) -> float:
+    """Parsed amount as a float, NaN if missing or (when `currency` is given) in another currency"""
+    metric = parse_metric(value)
+    if metric.value is None or (currency is not None and metric.currency != currency):
+        return np.nan
+    return metric.value
+
+
+def numeric_columns(records: Iterable[Dict[str, Any]], fields: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Float columns for `fields` of `records` (NaN where a value does not parse), plus
+    a `<field>Percent` column for each field that carries a percentage
+    """
+    parsed = {field: [] for field in fields}
+    for record in records:
+        for field in fields:
+            parsed[field].append(parse_metric(record.get(field)))
+
+    columns: Dict[str, np.ndarray] = {}
+    for field, metrics in parsed.items():
+        columns[field] = np.array([np.nan if m.value is None else m.value for m in metrics], dtype=float)
+        if any(m.percent is not None for m in metrics):
+            columns[field + "Percent"] = np.array(
+                [np.nan if m.percent is None else m.percent for m in metrics], dtype=float
+            )
+    return columns
@@ -0,0 +1,114 @@
+"""
+Array-backed portfolio P&L over holdingsData
+"""
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.services.metrics_parser import CURRENCY_SYMBOLS, parse_metric
+
+
+_SYMBOLS = {code: symbol for symbol, code in CURRENCY_SYMBOLS.items()}
+
+
+def format_money(amount: float, symbol: str, decimals: int = 0) -> str:
+    """"₹250,400" style (sign after the symbol, as in holdingsData)"""
+    return f"{symbol}{amount:,.{decimals}f}"
+
+
+def format_millions(amount: float, symbol: str) -> str:
+    """"₹2.7M" style, as in portfolioSummary"""
+    return f"{symbol}{amount / 1e6:.1f}M"
+
+
+class PortfolioEngine:
+    """
+    Holdings as NumPy columns (qty, avg cost, price) with per-holding cost, market
+    value and P&L, plus running portfolio totals.
+
+    A price tick updates one holding's value and adjusts the totals by the
+    difference, so it costs O(1); weights depend on the total and are recomputed
+    (vectorized) on the first read after a change.
+    """
+
+    def __init__(self, holdings: List[Dict[str, Any]], columns: Dict[str, np.ndarray], prices: Optional[Dict[str, float]] = None):
+        self._lock = threading.Lock()
+        self.names: List[str] = [h.get("name") for h in holdings]
+        self._position = {name: i for i, name in enumerate(self.names)}
+        self._symbols = [
+            _SYMBOLS.get(parse_metric(h.get("price")).currency or parse_metric(h.get("avgCost")).currency, "₹")
+            for h in holdings
+        ]
+        self.qty = np.nan_to_num(columns["qty"]).copy()
+        self.avg_cost = np.nan_to_num(columns["avgCost"]).copy()
+        self.price = np.nan_to_num(columns["price"]).copy()
+        for name, price in (prices or {}).items():
+            if name in self._position:
+                self.price[self._position[name]] = price
+
+        self.cost = self.qty * self.avg_cost
+        self.value = self.qty * self.price
+        self.total_cost = float(self.cost.sum())
+        self.total_value = float(self.value.sum())
+        self._rows: Optional[List[Dict[str, Any]]] = None
+
+    def has_holding(self, name: str) -> bool:
+        return name in self._position
+
+    def update_price(self, name: str, price: float) -> bool:
+        """Apply a price tick; returns False if there is no such holding"""
+        with self._lock:
+            i = self._position.get(name)
+            if i is None:
+                return False
+            new_value = self.qty[i] * price
+            self.total_value += float(new_value - self.value[i])
+            self.value[i] = new_value
+            self.price[i] = price
+            self._rows = None
+            return True
+
+    def _format_rows(self) -> List[Dict[str, Any]]:
+        pnl = self.value - self.cost
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl_percent = np.where(self.cost != 0, pnl / self.cost * 100, 0.0)
+            weight = self.value / self.total_value * 100 if self.total_value else np.zeros_like(self.value)
+        return [
+            {
+                "name": name,
+                "qty": int(self.qty[i]) if float(self.qty[i]).is_integer() else float(self.qty[i]),
+                "avgCost": format_money(self.avg_cost[i], self._symbols[i], 2),
+                "price": format_money(self.price[i], self._symbols[i], 2),
+                "pnl": f"{format_money(pnl[i], self._symbols[i])} ({pnl_percent[i]:.2f}%)",
+                "weight": f"{weight[i]:.1f}%",
+            }
+            for i, name in enumerate(self.names)
+        ]
+
+    def holdings(self) -> List[Dict[str, Any]]:
+        """holdingsData rows with P&L and weights computed from qty, avgCost and price"""
+        with self._lock:
+            if self._rows is None:
+                self._rows = self._format_rows()
+            return self._rows
+
+    def holding(self, name: str) -> Optional[Dict[str, Any]]:
+        i = self._position.get(name)
+        return self.holdings()[i] if i is not None else None
+
+    def summary(self, static_summary: Dict[str, Any]) -> Dict[str, Any]:
+        """portfolioSummary with invested, unrealized and TVPI computed from the holdings"""
+        with self._lock:
+            total_cost, total_value = self.total_cost, self.total_value
+        symbol = self._symbols[0] if self._symbols else "₹"
+        tvpi = total_value / total_cost if total_cost else 0.0
+        return {
+            **static_summary,
+            "invested": {**static_summary.get("invested", {"label": "INVESTED"}), "value": format_millions(total_cost, symbol)},
+            "unrealized": {
+                **static_summary.get("unrealized", {"label": "UNREALIZED"}),
+                "value": format_millions(total_value - total_cost, symbol)
+            },
+            "tvpi": {**static_summary.get("tvpi", {"label": "TVPI"}), "value": f"{tvpi:.2f}"},
+        }
@@ -0,0 +1,115 @@
+"""
+Indexed filtering, cursor pagination and field projection over lists of records
+"""
+import base64
+import bisect
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def _normalize(value: Any) -> str:
+    return str(value).strip().lower()
+
+
+def location_terms(location: Any) -> List[str]:
+    """Index terms for a location: the full string and each comma-separated part"""
+    if not location:
+        return []
+    parts = [_normalize(part) for part in str(location).split(",") if part.strip()]
+    return [_normalize(location)] + parts
+
+
+def exact_terms(value: Any) -> List[str]:
+    return [_normalize(value)] if value not in (None, "") else []
+
+
+def encode_cursor(key: Tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"after": list(key)}).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple:
+    """Decode a cursor from `encode_cursor`; raises ValueError if it is malformed"""
+    try:
+        after = json.loads(base64.urlsafe_b64decode(cursor.encode()))["after"]
+        if not isinstance(after, list):
+            raise TypeError("cursor key must be a list")
+        return tuple(after)
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def project(record: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Keep only the requested top-level fields of a record"""
+    if not fields:
+        return record
+    return {field: record[field] for field in fields if field in record}
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated `fields` query parameter"""
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+class RecordIndex:
+    """
+    Inverted indexes from field terms to record positions, built once per list of records.
+
+    Records are ordered by `sort_key`, a stable and unique key such as (stage, id),
+    and a cursor holds the key of the last record served. A page resumes after that
+    key even when the index is rebuilt in between, so records added, removed or
+    moved elsewhere in the list do not make a client skip or repeat the others.
+    """
+
+    def __init__(
+        self,
+        records: List[Dict[str, Any]],
+        indexed_fields: Dict[str, Callable[[Dict[str, Any]], Iterable[str]]],
+        sort_key: Callable[[Dict[str, Any]], Tuple]
+    ):
+        self.records = sorted(records, key=sort_key)
+        self._keys = [tuple(sort_key(record)) for record in self.records]
+        records = self.records
+        self._indexes: Dict[str, Dict[str, List[int]]] = {name: {} for name in indexed_fields}
+        for position, record in enumerate(records):
+            for name, terms in indexed_fields.items():
+                for term in set(terms(record)):
+                    self._indexes[name].setdefault(term, []).append(position)
+
+    def _matching_positions(self, filters: Dict[str, Optional[str]]) -> List[int]:
+        """Positions (ascending) of records matching every given filter"""
+        matches: Optional[set] = None
+        for name, value in filters.items():
+            if value is None:
+                continue
+            positions = set(self._indexes[name].get(_normalize(value), []))
+            matches = positions if matches is None else matches & positions
+        if matches is None:
+            return list(range(len(self.records)))
+        return sorted(matches)
+
+    def query(
+        self,
+        filters: Dict[str, Optional[str]],
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Return `{"items", "next_cursor", "total"}` for one page of matching records"""
+        positions = self._matching_positions(filters)
+        start = 0
+        if cursor:
+            after = decode_cursor(cursor)
+            try:
+                start = bisect.bisect_right(positions, after, key=self._keys.__getitem__)
+            except TypeError as e:
+                raise ValueError(f"Invalid cursor: {cursor}") from e
+        end = len(positions) if limit is None else min(start + limit, len(positions))
+        page = positions[start:end]
+        return {
+            "items": [project(self.records[p], fields) for p in page],
+            "next_cursor": encode_cursor(self._keys[page[-1]]) if page and end < len(positions) else None,
+            "total": len(positions)
+        }
+
@@ -0,0 +1,206 @@
+"""
+Declarative red-flag rules evaluated over the whole pipeline at once
+"""
+import threading
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+from app.services.metrics_parser import parse_amount
+
+
+# Each rule flags the startups for which every `when` condition (column, operator,
+# value) holds. Numeric comparisons are never true for missing or unparseable
+# values (NaN). `detail` is formatted with the startup's raw fields (see `_detail_fields`).
+RED_FLAG_RULES: List[Dict[str, Any]] = [
+    {"when": [("burn", ">", 200000)], "severity": "high",
+     "flag": "High burn rate", "detail": "Burning {burn} may lead to runway issues"},
+    {"when": [("burn", ">", 100000), ("burn", "<=", 200000)], "severity": "medium",
+     "flag": "Elevated burn rate", "detail": "Burn rate of {burn} requires close monitoring"},
+    {"when": [("team_size", ">", 0), ("team_size", "<", 10)], "severity": "medium",
+     "flag": "Small team size", "detail": "Team of {team_size} may face scaling challenges"},
+    {"when": [("team_size", "==", 0)], "severity": "low",
+     "flag": "Team size unknown", "detail": "Limited team information available for assessment"},
+    {"when": [("stage", "==", "Seed"), ("mrr", "<", 50000)], "severity": "medium",
+     "flag": "Low traction for stage", "detail": "MRR of {mrr} may be below expectations for {stage} stage"},
+    {"when": [("location", "contains_any", ("India", "Brazil", "Africa"))], "severity": "low",
+     "flag": "Emerging market risk", "detail": "Consider regulatory, currency, and exit liquidity risks"},
+    {"when": [("fit", "<", 7)], "severity": "high",
+     "flag": "Low thesis fit", "detail": "Fit score of {fit}/10 indicates misalignment with investment thesis"},
+    {"when": [("fit", ">=", 7), ("fit", "<", 8)], "severity": "medium",
+     "flag": "Moderate thesis fit", "detail": "Fit score of {fit}/10 suggests partial alignment with investment criteria"},
+    {"when": [("team", "<", 7)], "severity": "high",
+     "flag": "Team concerns", "detail": "Team score of {team}/10 indicates potential execution risks"},
+    {"when": [("team", ">=", 7), ("team", "<", 8)], "severity": "medium",
+     "flag": "Team assessment needed", "detail": "Team score of {team}/10 warrants deeper founder evaluation"},
+    {"when": [("market", "<", 7)], "severity": "high",
+     "flag": "Market risk", "detail": "Market score of {market}/10 suggests significant market challenges"},
+    {"when": [("market", ">=", 7), ("market", "<", 8)], "severity": "medium",
+     "flag": "Market dynamics unclear", "detail": "Market score of {market}/10 requires deeper market analysis"},
+    {"when": [("total_score", "<", 18)], "severity": "high",
+     "flag": "Overall low scores", "detail": "Combined score of {total_score}/30 indicates high-risk opportunity"},
+    {"when": [("title", "contains_any", ("referral", "cold"))], "severity": "low",
+     "flag": "Source quality", "detail": "Deal sourced via referral - validate relationship strength and alignment"},
+    {"when": [("title", "contains_any", ("pilot", "awaiting"))], "severity": "medium",
+     "flag": "Early stage validation", "detail": "Deal requires further validation before advancing"},
+]
+
+# Reported when no rule matches
+DEFAULT_RED_FLAG = {
+    "severity": "low",
+    "flag": "Standard due diligence required",
+    "detail": "Proceed with standard investment evaluation process"
+}
+
+SEVERITIES = ("high", "medium", "low")
+
+
+def _number(value: Any, default: float) -> float:
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _detail_fields(startup: Dict[str, Any]) -> Dict[str, Any]:
+    """Raw values that rule details may refer to"""
+    metrics = startup.get("metrics") or {}
+    fit, team, market = startup.get("fit", 10), startup.get("team", 10), startup.get("market", 10)
+    try:
+        total_score = fit + team + market
+    except TypeError:
+        total_score = None
+    return {
+        "burn": metrics.get("burn", ""),
+        "mrr": metrics.get("mrr", "$0"),
+        "stage": startup.get("stage", ""),
+        "team_size": startup.get("teamSize", 0),
+        "fit": fit,
+        "team": team,
+        "market": market,
+        "total_score": total_score,
+    }
+
+
+def build_columns(startups: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Columnar view of the fields the rules read: float arrays for numbers, object arrays for text"""
+    metrics = [s.get("metrics") or {} for s in startups]
+    fit = np.array([_number(s.get("fit"), 10) for s in startups], dtype=float)
+    team = np.array([_number(s.get("team"), 10) for s in startups], dtype=float)
+    market = np.array([_number(s.get("market"), 10) for s in startups], dtype=float)
+    return {
+        # Thresholds are in USD; amounts in other currencies are left out (NaN)
+        "burn": np.array([parse_amount(m.get("burn", ""), "USD") for m in metrics], dtype=float),
+        "mrr": np.array([parse_amount(m.get("mrr", "$0"), "USD") for m in metrics], dtype=float),
+        "team_size": np.array([_number(s.get("teamSize"), 0) for s in startups], dtype=float),
+        "fit": fit,
+        "team": team,
+        "market": market,
+        "total_score": fit + team + market,
+        "stage": np.array([s.get("stage") or "" for s in startups], dtype=object),
+        "location": np.array([str(s.get("location") or "") for s in startups], dtype=object),
+        "title": np.array([str(s.get("title") or "").lower() for s in startups], dtype=object),
+    }
+
+
+_COMPARISONS = {
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    "==": np.equal,
+}
+
+
+def _condition_mask(column: np.ndarray, op: str, value: Any) -> np.ndarray:
+    if op in _COMPARISONS:
+        with np.errstate(invalid="ignore"):
+            return np.asarray(_COMPARISONS[op](column, value), dtype=bool)
+    if op == "contains_any":
+        text = column.astype(str)
+        mask = np.zeros(len(column), dtype=bool)
+        for term in value:
+            mask |= np.char.find(text, term) >= 0
+        return mask
+    raise ValueError(f"Unknown red flag rule operator: {op}")
+
+
+def evaluate_rules(columns: Dict[str, np.ndarray], size: int, rules: List[Dict[str, Any]]) -> np.ndarray:
+    """Boolean matrix (rules x startups) of which rules flag which startups"""
+    matches = np.zeros((len(rules), size), dtype=bool)
+    if size == 0:
+        return matches
+    for i, rule in enumerate(rules):
+        mask = np.ones(size, dtype=bool)
+        for column, op, value in rule["when"]:
+            mask &= _condition_mask(columns[column], op, value)
+        matches[i] = mask
+    return matches
+
+
+class RedFlagReport:
+    """Red flags for a fixed set of startups, evaluated in one pass"""
+
+    def __init__(self, startups: List[Dict[str, Any]], rules: List[Dict[str, Any]] = RED_FLAG_RULES):
+        self.rules = rules
+        self.startups = startups
+        self.ids = [s.get("id") for s in startups]
+        self._position = {startup_id: i for i, startup_id in enumerate(self.ids)}
+        self.matches = evaluate_rules(build_columns(startups), len(startups), rules)
+        rule_severities = np.array([rule["severity"] for rule in rules], dtype=object)
+        self._has_severity = {
+            severity: self.matches[rule_severities == severity].any(axis=0) for severity in SEVERITIES
+        }
+        # Startups that no rule flags get DEFAULT_RED_FLAG
+        self._has_severity[DEFAULT_RED_FLAG["severity"]] |= ~self.matches.any(axis=0)
+        self._flags: Dict[int, List[Dict[str, Any]]] = {}
+
+    def flags_at(self, position: int) -> List[Dict[str, Any]]:
+        flags = self._flags.get(position)
+        if flags is None:
+            fields = _detail_fields(self.startups[position])
+            flags = [
+                {"severity": rule["severity"], "flag": rule["flag"], "detail": rule["detail"].format(**fields)}
+                for rule, matched in zip(self.rules, self.matches[:, position])
+                if matched
+            ] or [dict(DEFAULT_RED_FLAG)]
+            self._flags[position] = flags
+        return flags
+
+    def flags_for(self, startup_id: str) -> Optional[List[Dict[str, Any]]]:
+        position = self._position.get(startup_id)
+        return self.flags_at(position) if position is not None else None
+
+    def positions_with_severity(self, severity: str) -> np.ndarray:
+        """Positions of startups with at least one flag of `severity`"""
+        return np.flatnonzero(self._has_severity[severity])
+
+
+def generate_red_flags(startup: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Red flags for a single startup"""
+    return RedFlagReport([startup]).flags_at(0)
+
+
+class RedFlagService:
+    """Red flag report for the current pipeline, rebuilt only when its version changes"""
+
+    def __init__(self):
+        self._report: Optional[RedFlagReport] = None
+        self._version: Optional[Hashable] = None
+        self._lock = threading.Lock()
+
+    def get_report(self, version: Hashable, load_startups) -> RedFlagReport:
+        report = self._report
+        if report is not None and self._version == version:
+            return report
+        with self._lock:
+            if self._report is None or self._version != version:
+                self._report = RedFlagReport(load_startups())
+                self._version = version
+            return self._report
+
+
+# Singleton instance
+red_flag_service = RedFlagService()
@@ -0,0 +1,104 @@
+"""
+Pre-serialized, pre-compressed JSON responses with ETag support
+"""
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; responses fall back to gzip
+    brotli = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; bodies fall back to the standard library encoder
+    orjson = None
+
+
+def encode_json(content: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class CachedBody:
+    """A JSON body serialized once, with its ETag and compressed variants"""
+
+    def __init__(self, content: Any):
+        self.body = encode_json(content)
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+        self.gzip = gzip.compress(self.body, compresslevel=6)
+        self.br = brotli.compress(self.body) if brotli is not None else None
+
+
+class ResponseCache:
+    """
+    Cache of serialized responses, keyed on a route key and rebuilt only when
+    the data version for that key changes
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (version, CachedBody)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Hashable, build: Callable[[], Any]) -> CachedBody:
+        """Get the cached body for `key`, building it with `build()` if the version changed"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        cached = CachedBody(build())
+        with self._lock:
+            self._entries[key] = (version, cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def cached_json_response(request: Request, cached: CachedBody) -> Response:
+    """
+    Serve a cached body: 304 if the client already has this version, otherwise
+    the smallest encoding the client accepts
+    """
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    if _etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+
+    accept_encoding = request.headers.get("accept-encoding", "").lower()
+    if cached.br is not None and "br" in accept_encoding:
+        body, headers["Content-Encoding"] = cached.br, "br"
+    elif "gzip" in accept_encoding:
+        body, headers["Content-Encoding"] = cached.gzip, "gzip"
+    else:
+        body = cached.body
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Singleton instances - per-user responses get their own cache so that many
+# signed-in users cannot evict the shared dashboard entries
+response_cache = ResponseCache()
+user_response_cache = ResponseCache(max_entries=1024)
@@ -0,0 +1,453 @@
+"""
+Storage backends for data that changes at runtime: sourced startups and dealflow
+stages, holding prices, deal notes, ingested documents, settings (investment
+thesis, model weights) and valuation scores
+"""
+import json
+import queue
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class SettingsStore(ABC):
+    """Named JSON settings with a revision counter"""
+
+    @abstractmethod
+    def set_setting(self, name: str, value: Any) -> int:
+        """Store a JSON-serializable setting (e.g. the investment thesis); returns the new settings revision"""
+
+    @abstractmethod
+    def get_settings(self) -> Dict[str, Any]:
+        """Every stored setting"""
+
+    @abstractmethod
+    def get_settings_revision(self) -> int:
+        """Counter bumped on every settings change"""
+
+
+class ValuationScoreStore(ABC):
+    """Per-factor valuation scores of each startup with a revision counter"""
+
+    @abstractmethod
+    def save_valuation_scores(self, startup_id: str, scores: Dict[str, Dict[str, float]]) -> int:
+        """
+        Store a startup's per-factor valuation scores ({model: {factor: score}}),
+        replacing earlier ones; returns the new valuations revision
+        """
+
+    @abstractmethod
+    def get_valuation_scores(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Stored valuation scores of every startup (startup_id -> {model: {factor: score}})"""
+
+    @abstractmethod
+    def get_valuations_revision(self) -> int:
+        """Counter bumped every time valuation scores are stored"""
+
+
+class StorageBackend(SettingsStore, ValuationScoreStore):
+    """
+    Interface for persisting data that changes at runtime: dealflow, holdings,
+    deal notes and documents, plus the settings and valuation score stores
+    """
+
+    @abstractmethod
+    def add_sourced_startup(self, startup: Dict[str, Any]) -> Optional[int]:
+        """
+        Store a sourced startup; returns the new dealflow revision, or None if
+        a startup with the same id already exists
+        """
+
+    @abstractmethod
+    def move_deal(self, startup_id: str, stage: str) -> int:
+        """
+        Record that a deal moved to another dealflow stage (updating the sourced
+        startup if there is one); returns the new dealflow revision
+        """
+
+    @abstractmethod
+    def get_stage_overrides(self) -> Dict[str, str]:
+        """Get the dealflow stage of every moved deal that is not a sourced startup"""
+
+    @abstractmethod
+    def get_dealflow_revision(self) -> int:
+        """Counter bumped on every change to sourced startups or deal stages"""
+
+    @abstractmethod
+    def get_sourced_startups(self, stage: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get sourced startups in insertion order, optionally only those in a dealflow stage"""
+
+    @abstractmethod
+    def get_sourced_startup(self, startup_id: str) -> Optional[Dict[str, Any]]:
+        """Get a sourced startup by id"""
+
+    @abstractmethod
+    def set_holding_price(self, name: str, price: float) -> int:
+        """Record the latest price of a portfolio holding; returns the new holdings revision"""
+    
+    @abstractmethod
+    def get_holding_prices(self) -> Dict[str, float]:
+        """Latest recorded price of every holding that has had a price update"""
+    
+    @abstractmethod
+    def get_holdings_revision(self) -> int:
+        """Counter bumped on every holding price update"""
+    
+    @abstractmethod
+    def save_deal_notes(self, startup_id: str, notes: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    def get_deal_notes(self, startup_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def add_ingested_document(self, startup_id: str, document: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    def get_ingested_documents(self, startup_id: str) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def find_ingested_document(self, startup_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """The first ingested document of a startup with the given content hash (indexed lookup)"""
+
+
+class InMemoryStorage(StorageBackend):
+    """Process-local storage; data is lost on restart and not shared between workers"""
+
+    def __init__(self):
+        self._sourced_startups: List[Dict[str, Any]] = []
+        self._sourced_by_id: Dict[str, Dict[str, Any]] = {}  # id -> startup, for constant-time lookups
+        self._stage_overrides: Dict[str, str] = {}  # startup_id -> stage, for non-sourced deals
+        self._revision = 0
+        self._holding_prices: Dict[str, float] = {}
+        self._holdings_revision = 0
+        self._settings: Dict[str, Any] = {}
+        self._settings_revision = 0
+        self._valuation_scores: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._valuations_revision = 0
+        self._deal_notes: Dict[str, Dict[str, Any]] = {}  # startup_id -> notes
+        self._ingested_documents: Dict[str, List[Dict[str, Any]]] = {}  # startup_id -> documents
+        self._ingested_by_hash: Dict[tuple, Dict[str, Any]] = {}  # (startup_id, content_hash) -> document
+
+    def add_sourced_startup(self, startup: Dict[str, Any]) -> Optional[int]:
+        if startup.get("id") in self._sourced_by_id:
+            return None
+        self._sourced_startups.append(startup)
+        self._sourced_by_id[startup.get("id")] = startup
+        self._revision += 1
+        return self._revision
+
+    def move_deal(self, startup_id: str, stage: str) -> int:
+        if startup_id in self._sourced_by_id:
+            updated = {**self._sourced_by_id[startup_id], "dealflow_stage": stage}
+            self._sourced_startups = [updated if s.get("id") == startup_id else s for s in self._sourced_startups]
+            self._sourced_by_id[startup_id] = updated
+        else:
+            self._stage_overrides[startup_id] = stage
+        self._revision += 1
+        return self._revision
+
+    def get_stage_overrides(self) -> Dict[str, str]:
+        return dict(self._stage_overrides)
+
+    def get_dealflow_revision(self) -> int:
+        return self._revision
+
+    def get_sourced_startups(self, stage: Optional[str] = None) -> List[Dict[str, Any]]:
+        if stage is None:
+            return list(self._sourced_startups)
+        return [s for s in self._sourced_startups if s.get("dealflow_stage", "SOURCED") == stage]
+
+    def get_sourced_startup(self, startup_id: str) -> Optional[Dict[str, Any]]:
+        return self._sourced_by_id.get(startup_id)
+
+    def set_holding_price(self, name: str, price: float) -> int:
+        self._holding_prices[name] = price
+        self._holdings_revision += 1
+        return self._holdings_revision
+    
+    def get_holding_prices(self) -> Dict[str, float]:
+        return dict(self._holding_prices)
+    
+    def get_holdings_revision(self) -> int:
+        return self._holdings_revision
+    
+    def set_setting(self, name: str, value: Any) -> int:
+        self._settings[name] = value
+        self._settings_revision += 1
+        return self._settings_revision
+    
+    def get_settings(self) -> Dict[str, Any]:
+        return dict(self._settings)
+    
+    def get_settings_revision(self) -> int:
+        return self._settings_revision
+    
+    def save_valuation_scores(self, startup_id: str, scores: Dict[str, Dict[str, float]]) -> int:
+        self._valuation_scores[startup_id] = scores
+        self._valuations_revision += 1
+        return self._valuations_revision
+    
+    def get_valuation_scores(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        return dict(self._valuation_scores)
+    
+    def get_valuations_revision(self) -> int:
+        return self._valuations_revision
+    
+    def save_deal_notes(self, startup_id: str, notes: Dict[str, Any]) -> None:
+        self._deal_notes[startup_id] = notes
+
+    def get_deal_notes(self, startup_id: str) -> Optional[Dict[str, Any]]:
+        return self._deal_notes.get(startup_id)
+
+    def add_ingested_document(self, startup_id: str, document: Dict[str, Any]) -> None:
+        self._ingested_documents.setdefault(startup_id, []).append(document)
+        if document.get("content_hash"):
+            self._ingested_by_hash.setdefault((startup_id, document["content_hash"]), document)
+
+    def get_ingested_documents(self, startup_id: str) -> List[Dict[str, Any]]:
+        return list(self._ingested_documents.get(startup_id, []))
+
+    def find_ingested_document(self, startup_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        return self._ingested_by_hash.get((startup_id, content_hash))
+
+
+class SQLiteStorage(StorageBackend):
+    """
+    SQLite storage in WAL mode, shared by every worker process that points at the same file.
+    Records are stored as JSON with indexed id, dealflow stage, startup id and content hash columns.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS sourced_startups (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        id TEXT NOT NULL UNIQUE,
+        dealflow_stage TEXT NOT NULL,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_sourced_startups_stage ON sourced_startups (dealflow_stage);
+    CREATE TABLE IF NOT EXISTS deal_notes (
+        startup_id TEXT PRIMARY KEY,
+        data TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS ingested_documents (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        startup_id TEXT NOT NULL,
+        content_hash TEXT,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_ingested_documents_startup ON ingested_documents (startup_id);
+    CREATE TABLE IF NOT EXISTS deal_stage_overrides (
+        startup_id TEXT PRIMARY KEY,
+        stage TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS holding_prices (
+        name TEXT PRIMARY KEY,
+        price REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS settings (
+        name TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS valuation_scores (
+        startup_id TEXT PRIMARY KEY,
+        scores TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS counters (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO counters (name, value) VALUES ('dealflow_revision', 0);
+    INSERT OR IGNORE INTO counters (name, value) VALUES ('holdings_revision', 0);
+    INSERT OR IGNORE INTO counters (name, value) VALUES ('settings_revision', 0);
+    INSERT OR IGNORE INTO counters (name, value) VALUES ('valuations_revision', 0);
+    """
+
+    def __init__(self, path: Path, pool_size: int = 4):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self._connection() as conn:
+            conn.executescript(self.SCHEMA)
+            self._migrate(conn)
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Bring files created by earlier versions up to the current schema"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(ingested_documents)")}
+        if "content_hash" not in columns:
+            try:
+                conn.execute("ALTER TABLE ingested_documents ADD COLUMN content_hash TEXT")
+            except sqlite3.OperationalError:
+                pass  # added by another worker starting at the same time
+            conn.execute("UPDATE ingested_documents SET content_hash = json_extract(data, '$.content_hash')")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ingested_documents_hash ON ingested_documents (startup_id, content_hash)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection and commit (or roll back) when done"""
+        conn = self._pool.get()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
+    @staticmethod
+    def _bump_counter(conn: sqlite3.Connection, name: str) -> int:
+        conn.execute("UPDATE counters SET value = value + 1 WHERE name = ?", (name,))
+        return conn.execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()[0]
+    
+    def _get_counter(self, name: str) -> int:
+        with self._connection() as conn:
+            return conn.execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()[0]
+
+    def add_sourced_startup(self, startup: Dict[str, Any]) -> Optional[int]:
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO sourced_startups (id, dealflow_stage, data) VALUES (?, ?, ?)",
+                (str(startup.get("id")), startup.get("dealflow_stage", "SOURCED"), json.dumps(startup))
+            )
+            if cursor.rowcount != 1:
+                return None
+            return self._bump_counter(conn, 'dealflow_revision')
+
+    def move_deal(self, startup_id: str, stage: str) -> int:
+        with self._connection() as conn:
+            row = conn.execute("SELECT data FROM sourced_startups WHERE id = ?", (str(startup_id),)).fetchone()
+            if row:
+                startup = json.loads(row[0])
+                startup["dealflow_stage"] = stage
+                conn.execute(
+                    "UPDATE sourced_startups SET dealflow_stage = ?, data = ? WHERE id = ?",
+                    (stage, json.dumps(startup), str(startup_id))
+                )
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO deal_stage_overrides (startup_id, stage) VALUES (?, ?)",
+                    (startup_id, stage)
+                )
+            return self._bump_counter(conn, 'dealflow_revision')
+
+    def get_stage_overrides(self) -> Dict[str, str]:
+        with self._connection() as conn:
+            rows = conn.execute("SELECT startup_id, stage FROM deal_stage_overrides").fetchall()
+        return dict(rows)
+
+    def get_dealflow_revision(self) -> int:
+        return self._get_counter('dealflow_revision')
+
+    def get_sourced_startups(self, stage: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._connection() as conn:
+            if stage is None:
+                rows = conn.execute("SELECT data FROM sourced_startups ORDER BY seq").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT data FROM sourced_startups WHERE dealflow_stage = ? ORDER BY seq", (stage,)
+                ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_sourced_startup(self, startup_id: str) -> Optional[Dict[str, Any]]:
+        with self._connection() as conn:
+            row = conn.execute("SELECT data FROM sourced_startups WHERE id = ?", (str(startup_id),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_holding_price(self, name: str, price: float) -> int:
+        with self._connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO holding_prices (name, price) VALUES (?, ?)", (name, price))
+            return self._bump_counter(conn, 'holdings_revision')
+    
+    def get_holding_prices(self) -> Dict[str, float]:
+        with self._connection() as conn:
+            return dict(conn.execute("SELECT name, price FROM holding_prices").fetchall())
+    
+    def get_holdings_revision(self) -> int:
+        return self._get_counter('holdings_revision')
+    
+    def set_setting(self, name: str, value: Any) -> int:
+        with self._connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO settings (name, value) VALUES (?, ?)", (name, json.dumps(value)))
+            return self._bump_counter(conn, 'settings_revision')
+    
+    def get_settings(self) -> Dict[str, Any]:
+        with self._connection() as conn:
+            rows = conn.execute("SELECT name, value FROM settings").fetchall()
+        return {name: json.loads(value) for name, value in rows}
+    
+    def get_settings_revision(self) -> int:
+        return self._get_counter('settings_revision')
+    
+    def save_valuation_scores(self, startup_id: str, scores: Dict[str, Dict[str, float]]) -> int:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO valuation_scores (startup_id, scores) VALUES (?, ?)",
+                (startup_id, json.dumps(scores))
+            )
+            return self._bump_counter(conn, 'valuations_revision')
+    
+    def get_valuation_scores(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        with self._connection() as conn:
+            rows = conn.execute("SELECT startup_id, scores FROM valuation_scores").fetchall()
+        return {startup_id: json.loads(scores) for startup_id, scores in rows}
+    
+    def get_valuations_revision(self) -> int:
+        return self._get_counter('valuations_revision')
+    
+    def save_deal_notes(self, startup_id: str, notes: Dict[str, Any]) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO deal_notes (startup_id, data) VALUES (?, ?)",
+                (startup_id, json.dumps(notes))
+            )
+
+    def get_deal_notes(self, startup_id: str) -> Optional[Dict[str, Any]]:
+        with self._connection() as conn:
+            row = conn.execute("SELECT data FROM deal_notes WHERE startup_id = ?", (startup_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def add_ingested_document(self, startup_id: str, document: Dict[str, Any]) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO ingested_documents (startup_id, content_hash, data) VALUES (?, ?, ?)",
+                (startup_id, document.get("content_hash"), json.dumps(document))
+            )
+
+    def get_ingested_documents(self, startup_id: str) -> List[Dict[str, Any]]:
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT data FROM ingested_documents WHERE startup_id = ? ORDER BY seq", (startup_id,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def find_ingested_document(self, startup_id: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT data FROM ingested_documents WHERE startup_id = ? AND content_hash = ? ORDER BY seq LIMIT 1",
+                (startup_id, content_hash)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+
+def create_storage(backend: str, sqlite_path: Path, pool_size: int = 4) -> StorageBackend:
+    """Create the storage backend selected in settings"""
+    if backend == "sqlite":
+        return SQLiteStorage(sqlite_path, pool_size=pool_size)
+    if backend == "memory":
+        return InMemoryStorage()
+    raise ValueError(f"Unknown storage backend: {backend}")
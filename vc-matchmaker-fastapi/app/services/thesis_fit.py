@@ -0,0 +1,190 @@
+"""
+Thesis-fit scoring of the whole pipeline over an inverted index of startup text
+"""
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.services.matching import tokenize
+
+
+# Weight of thesis text similarity and of being in one of the thesis stages
+TEXT_WEIGHT = 0.8
+STAGE_WEIGHT = 0.2
+
+# Cosine similarity at which the text component counts as a perfect match
+TEXT_SIMILARITY_FOR_FULL_SCORE = 0.5
+
+TEXT_FIELDS = ("name", "title", "tagline", "description", "industry", "pitch", "highlights")
+
+
+def startup_text(startup: Dict[str, Any]) -> str:
+    parts = []
+    for field in TEXT_FIELDS:
+        value = startup.get(field)
+        if isinstance(value, list):
+            parts.extend(str(v) for v in value)
+        elif value:
+            parts.append(str(value))
+    return " ".join(parts)
+
+
+def thesis_stages(thesis: str, stage_order: List[str]) -> List[str]:
+    """Stages named in a thesis; "Seed to Series B" covers every stage in between"""
+    text = thesis.lower()
+    lowered = [s.lower() for s in stage_order]
+    for low, high in re.findall(r"([a-z][a-z0-9+ -]*?)\s+(?:to|through|-)\s+([a-z][a-z0-9+ -]*)", text):
+        start = next((i for i, s in enumerate(lowered) if low.endswith(s)), None)
+        end = next((i for i, s in enumerate(lowered) if high.startswith(s)), None)
+        if start is not None and end is not None and start <= end:
+            return stage_order[start:end + 1]
+    return [stage for stage in stage_order if re.search(rf"\b{re.escape(stage.lower())}\b", text)]
+
+
+class ThesisScorer:
+    """
+    Scores startups against an investment thesis.
+
+    Each startup's text is an L2-normalized TF-IDF vector stored as postings in an
+    inverted index (term -> startup positions and weights), like VCMatcher, and its
+    funding stage is kept as a stage index. Scoring the thesis touches only the
+    postings of its own terms; changing the thesis re-scores once and sourcing a
+    startup adds its postings and scores it alone. IDF comes from the startups seen
+    so far, so rows added later keep the weights they were indexed with until the
+    scorer is rebuilt on the next data reload.
+
+    Thesis terms that no startup mentions cannot match anything; they are reported
+    in `unknown_terms` rather than silently dropped. A thesis that names no stage
+    gives no stage credit.
+    """
+
+    def __init__(self, startups: List[Dict[str, Any]], stage_order: List[str]):
+        self._lock = threading.Lock()
+        self.stage_order = list(stage_order)
+        self._stage_position = {stage.lower(): i for i, stage in enumerate(self.stage_order)}
+        # Stage names are scored by the stage component, not as thesis text
+        self._stage_terms = frozenset(t for stage in self.stage_order for t in tokenize(stage))
+
+        self._document_frequency: Counter = Counter()
+        self._postings: Dict[str, tuple] = {}  # term -> ([positions], [weights])
+        self._index: Dict[str, tuple] = {}  # term -> (positions, weights) arrays, built on demand
+        self.startups: List[Dict[str, Any]] = []
+        self._position: Dict[Any, int] = {}
+        self._stages: List[int] = []  # stage index per startup, -1 if not in stage_order
+
+        documents = [Counter(tokenize(startup_text(s))) for s in startups]
+        self._document_frequency.update(term for doc in documents for term in doc)
+        self._documents = len(documents)
+        for startup, doc in zip(startups, documents):
+            self._append(startup, doc)
+
+        self.thesis: Optional[str] = None
+        self.unknown_terms: List[str] = []
+        self._query: Dict[str, float] = {}
+        self._thesis_stages: List[int] = []
+        self._scores = np.zeros(len(self.startups), dtype=np.float32)
+        self._order = np.arange(len(self.startups), dtype=np.int64)
+
+    def _idf(self, term: str) -> float:
+        return math.log((1 + self._documents) / (1 + self._document_frequency[term])) + 1
+
+    def _weights(self, doc: Counter) -> Dict[str, float]:
+        """L2-normalized TF-IDF weights of a bag of terms"""
+        weights = {term: (1 + math.log(tf)) * self._idf(term) for term, tf in doc.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        return {term: w / norm for term, w in weights.items()} if norm else {}
+
+    def _append(self, startup: Dict[str, Any], doc: Counter) -> Dict[str, float]:
+        position = len(self.startups)
+        weights = self._weights(doc)
+        for term, weight in weights.items():
+            positions, values = self._postings.setdefault(term, ([], []))
+            positions.append(position)
+            values.append(weight)
+            self._index.pop(term, None)
+        self.startups.append(startup)
+        self._position[startup.get("id")] = position
+        self._stages.append(self._stage_position.get(str(startup.get("stage") or "").lower(), -1))
+        return weights
+
+    def _postings_array(self, term: str) -> tuple:
+        entry = self._index.get(term)
+        if entry is None:
+            positions, values = self._postings[term]
+            entry = self._index[term] = (np.array(positions, dtype=np.int64), np.array(values, dtype=np.float32))
+        return entry
+
+    def _score(self, weights: Dict[str, float], stage: int) -> float:
+        """Thesis fit (0-1) of one startup's text weights and stage index"""
+        similarity = sum(w * self._query.get(term, 0.0) for term, w in weights.items())
+        text = min(similarity / TEXT_SIMILARITY_FOR_FULL_SCORE, 1.0) * TEXT_WEIGHT
+        return text + (STAGE_WEIGHT if stage in self._thesis_stages else 0.0)
+
+    def _rescore(self):
+        similarity = np.zeros(len(self.startups), dtype=np.float32)
+        for term, weight in self._query.items():
+            positions, values = self._postings_array(term)
+            similarity[positions] += weight * values
+        text = np.minimum(similarity / TEXT_SIMILARITY_FOR_FULL_SCORE, 1.0) * TEXT_WEIGHT
+        in_stage = np.isin(np.array(self._stages, dtype=np.int64), self._thesis_stages)
+        self._scores = (text + STAGE_WEIGHT * in_stage).astype(np.float32)
+        self._order = np.argsort(-self._scores, kind="stable")
+
+    def set_thesis(self, thesis: str):
+        """Re-rank the pipeline against a thesis (no-op if it has not changed)"""
+        with self._lock:
+            if thesis == self.thesis:
+                return
+            self._apply_thesis(thesis)
+
+    def _apply_thesis(self, thesis: str):
+        terms = Counter(t for t in tokenize(thesis) if t not in self._stage_terms)
+        self.unknown_terms = sorted(t for t in terms if t not in self._postings)
+        self._query = self._weights(Counter({t: tf for t, tf in terms.items() if t in self._postings}))
+        self._thesis_stages = [self._stage_position[s.lower()] for s in thesis_stages(thesis, self.stage_order)]
+        self.thesis = thesis
+        self._rescore()
+
+    def add_startups(self, startups: List[Dict[str, Any]]) -> int:
+        """Score startups that are not in the pipeline yet; returns how many were added"""
+        added = []
+        new_terms = set()
+        with self._lock:
+            for startup in startups:
+                if startup.get("id") in self._position:
+                    continue
+                doc = Counter(tokenize(startup_text(startup)))
+                self._document_frequency.update(doc.keys())
+                self._documents += 1
+                new_terms.update(doc.keys())
+                weights = self._append(startup, doc)
+                added.append(self._score(weights, self._stages[-1]))
+            if not added:
+                return 0
+            if self.thesis is not None and new_terms.intersection(self.unknown_terms):
+                # A thesis term that matched nothing before now has postings
+                self._apply_thesis(self.thesis)
+            else:
+                self._scores = np.append(self._scores, np.array(added, dtype=np.float32))
+                self._order = np.argsort(-self._scores, kind="stable")
+        return len(added)
+
+    def ranking(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Pipeline startups, best thesis fit first"""
+        with self._lock:
+            order, scores, startups = self._order, self._scores, self.startups
+        positions = order if limit is None else order[:limit]
+        return [
+            {
+                "id": startups[p].get("id"),
+                "name": startups[p].get("name") or startups[p].get("title"),
+                "stage": startups[p].get("stage"),
+                "industry": startups[p].get("industry"),
+                "thesisFit": int(round(float(scores[p]) * 100)),
+            }
+            for p in positions
+        ]
@@ -0,0 +1,48 @@
+"""
+Indexed, read-only view of users.json
+"""
+from typing import Any, Dict, List, Optional
+from app.core.security import DUMMY_VERIFIER, PasswordVerifier
+
+
+SECRET_FIELDS = ("password", "passwordHash")
+
+
+class UserRecord:
+    """A user with its password-free projection and password verifier, built once"""
+
+    __slots__ = ("user", "public", "verifier")
+
+    def __init__(self, user: Dict[str, Any]):
+        self.user = user
+        self.public = {key: value for key, value in user.items() if key not in SECRET_FIELDS}
+        self.verifier = PasswordVerifier.from_user(user)
+
+
+class UserStore:
+    """Users indexed by username and by email"""
+
+    def __init__(self, users: List[Dict[str, Any]]):
+        self._by_username: Dict[str, UserRecord] = {}
+        self._by_email: Dict[str, UserRecord] = {}
+        # The first user with a given username or email wins, as with the old linear scan
+        for user in users:
+            record = UserRecord(user)
+            if user.get("username") is not None:
+                self._by_username.setdefault(user["username"], record)
+            if user.get("email") is not None:
+                self._by_email.setdefault(user["email"], record)
+
+    def get_by_username(self, username: str) -> Optional[UserRecord]:
+        return self._by_username.get(username)
+
+    def get_by_username_or_email(self, username_or_email: str) -> Optional[UserRecord]:
+        return self._by_username.get(username_or_email) or self._by_email.get(username_or_email)
+
+    def authenticate(self, username_or_email: str, password: str) -> Optional[Dict[str, Any]]:
+        """Password-free user if the password matches, otherwise None"""
+        record = self.get_by_username_or_email(username_or_email)
+        if record is None:
+            DUMMY_VERIFIER.verify(password)
+            return None
+        return record.public if record.verifier.verify(password) else None
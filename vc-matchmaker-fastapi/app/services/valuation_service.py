@@ -0,0 +1,65 @@
+"""
+Valuation service wrapping the Berkus and Bill Payne analysts
+"""
+import json
+import sys
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.core.config import settings
+from app.services.composite_valuation import MODEL_ALIASES
+from app.services.data_service import data_service
+
+
+class ValuationService:
+    """Service for running startup valuations with the multi-agent analysts"""
+    
+    def __init__(self):
+        self._pipeline = None
+    
+    def _load_pipeline(self):
+        """Import the analysts on first use so the API starts without the agent dependencies"""
+        if self._pipeline is None:
+            agents_path = str(settings.MULTI_AGENT_PATH)
+            if agents_path not in sys.path:
+                sys.path.append(agents_path)
+            from multi_agent.agent import FullStartupData, stream_valuation
+            from multi_agent.sub_agents.berkus_analyst.agent import berkus_analyst
+            from multi_agent.sub_agents.bill_payne_analyst.agent import payne_analyst
+            self._pipeline = (FullStartupData, stream_valuation, berkus_analyst, payne_analyst)
+        return self._pipeline
+    
+    async def stream_valuation_events(
+        self, startup_data: Dict[str, Any], startup_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a full valuation as Server-Sent Events: one `factor_score` event per
+        factor as soon as it resolves, then a `complete` event with the combined
+        report and scores (same shape as `run_full_valuation`). With a `startup_id`,
+        the factor scores are stored for the startup's composite valuation once
+        every factor has resolved.
+        """
+        try:
+            FullStartupData, stream_valuation, berkus_analyst, payne_analyst = self._load_pipeline()
+            data = FullStartupData(**startup_data)
+            factor_scores: Dict[str, Dict[str, float]] = {}
+            async for event in stream_valuation(data, berkus_analyst, payne_analyst):
+                if event["type"] == "complete":
+                    if startup_id is not None:
+                        data_service.save_valuation_scores(startup_id, factor_scores)
+                    yield self._format_event("complete", event["result"])
+                else:
+                    if event["type"] == "factor_score":
+                        model = MODEL_ALIASES.get(event["model"], event["model"])
+                        factor_scores.setdefault(model, {})[event["factor"]] = event["score"]
+                    yield self._format_event(event["type"], event)
+        except Exception as e:
+            yield self._format_event("error", {"detail": str(e)})
+    
+    @staticmethod
+    def _format_event(event: str, data: Dict[str, Any]) -> str:
+        """Format a single Server-Sent Event"""
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+# Singleton instance
+valuation_service = ValuationService()
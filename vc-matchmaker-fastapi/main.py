@@ -1,10 +1,15 @@
 """
 VC Matchmaker FastAPI Application - Main Entry Point
 """
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import settings
+from app.core.config import DEFAULT_SECRET_KEY, settings
 from app.api import api_router
+from app.services.data_service import data_service
+from app.services.job_queue import job_queue
+
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -25,6 +30,40 @@ app.add_middleware(
 # Include all API routes
 app.include_router(api_router, prefix="/api")
 
+# Reload Data/*.json in the background when the files change
+data_watcher = data_service.create_watcher()
+
+
+@app.on_event("startup")
+async def check_secret_key():
+    if settings.SECRET_KEY != DEFAULT_SECRET_KEY:
+        return
+    if settings.ENVIRONMENT == "production":
+        raise RuntimeError("SECRET_KEY is the placeholder value; set SECRET_KEY before starting in production")
+    logger.error("SECRET_KEY is the placeholder value; access tokens can be forged. Set SECRET_KEY in the environment.")
+
+
+@app.on_event("startup")
+async def start_data_watcher():
+    if settings.DATA_RELOAD_ENABLED:
+        data_watcher.start()
+
+
+@app.on_event("startup")
+async def start_job_queue():
+    # Also resumes jobs queued before the last shutdown
+    job_queue.start()
+
+
+@app.on_event("shutdown")
+async def stop_data_watcher():
+    data_watcher.stop()
+
+
+@app.on_event("shutdown")
+async def stop_job_queue():
+    job_queue.stop()
+
 
 @app.get("/")
 async def read_root():
@@ -36,7 +75,8 @@ async def read_root():
             "auth": "/api/auth/login",
             "vc_dashboard": "/api/vc/dashboard",
             "founder_dashboard": "/api/founder/dashboard",
-            "categories": "/api/categories"
+            "categories": "/api/categories",
+            "valuation_stream": "/api/valuation/stream"
         }
     }
 
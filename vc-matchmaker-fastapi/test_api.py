@@ -6,13 +6,14 @@ import json
 
 BASE_URL = "http://127.0.0.1:8001"
 
-def test_endpoint(name, url, method="GET", data=None):
+def test_endpoint(name, url, method="GET", data=None, token=None):
     """Test a single endpoint"""
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
     try:
         if method == "GET":
-            response = requests.get(url)
+            response = requests.get(url, headers=headers)
         elif method == "POST":
-            response = requests.post(url, json=data)
+            response = requests.post(url, json=data, headers=headers)
         
         print(f"\n{'='*60}")
         print(f"Testing: {name}")
@@ -22,13 +23,23 @@ def test_endpoint(name, url, method="GET", data=None):
         if response.ok:
             result = response.json()
             print(f"Response: {json.dumps(result, indent=2)[:200]}...")
-            return True
+            return result
         else:
             print(f"Error: {response.text}")
-            return False
+            return None
     except Exception as e:
         print(f"Exception: {str(e)}")
-        return False
+        return None
+
+def login(name, username, password):
+    """Log in and return the access token (None if login failed)"""
+    result = test_endpoint(
+        name,
+        f"{BASE_URL}/api/auth/login",
+        "POST",
+        {"username": username, "password": password}
+    )
+    return result.get("token") if result else None
 
 # Test endpoints
 print("Testing Modular FastAPI Backend")
@@ -41,21 +52,17 @@ test_endpoint("Health Check", f"{BASE_URL}/health")
 test_endpoint("Root Endpoint", f"{BASE_URL}/")
 
 # Test auth login
-test_endpoint(
-    "Auth Login (VC)", 
-    f"{BASE_URL}/api/auth/login",
-    "POST",
-    {"username": "admin", "password": "auth"}
-)
+vc_token = login("Auth Login (VC)", "admin", "auth")
+founder_token = login("Auth Login (Founder)", "founder", "founder")
 
 # Test VC dashboard
-test_endpoint("VC Dashboard", f"{BASE_URL}/api/vc/dashboard")
+test_endpoint("VC Dashboard", f"{BASE_URL}/api/vc/dashboard", token=vc_token)
 
 # Test VC metrics
-test_endpoint("VC Metrics", f"{BASE_URL}/api/vc/metrics")
+test_endpoint("VC Metrics", f"{BASE_URL}/api/vc/metrics", token=vc_token)
 
 # Test Founder dashboard
-test_endpoint("Founder Dashboard", f"{BASE_URL}/api/founder/dashboard")
+test_endpoint("Founder Dashboard", f"{BASE_URL}/api/founder/dashboard", token=founder_token)
 
 # Test Categories
 test_endpoint("Categories", f"{BASE_URL}/api/categories/all")
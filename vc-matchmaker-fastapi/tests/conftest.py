@@ -0,0 +1,38 @@
+"""
+Shared fixtures. The app is configured before it is imported: in-memory storage
+and jobs, no data-file watcher, and uploads spooled to a temporary directory.
+"""
+import os
+import tempfile
+
+import pytest
+
+os.environ.setdefault("STORAGE_BACKEND", "memory")
+os.environ.setdefault("JOBS_BACKEND", "memory")
+os.environ.setdefault("DATA_RELOAD_ENABLED", "false")
+os.environ.setdefault("INGEST_UPLOAD_DIR", tempfile.mkdtemp(prefix="vc-matchmaker-uploads-"))
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    from main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _login(client, username: str, password: str) -> dict:
+    response = client.post("/api/auth/login", json={"username": username, "password": password})
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+@pytest.fixture(scope="session")
+def vc_headers(client):
+    return _login(client, "admin", "auth")
+
+
+@pytest.fixture(scope="session")
+def founder_headers(client):
+    return _login(client, "founder", "founder")
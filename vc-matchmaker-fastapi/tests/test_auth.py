@@ -0,0 +1,89 @@
+import base64
+import time
+
+import pytest
+
+from app.core.security import TokenError, TokenVerifier, create_access_token, decode_access_token
+
+
+def test_login_returns_a_token_and_user(client):
+    response = client.post("/api/auth/login", json={"username": "admin", "password": "auth"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["token"]
+    assert body["user"]["username"] == "admin"
+    assert "password" not in body["user"] and "passwordHash" not in body["user"]
+
+
+def test_login_rejects_bad_credentials(client):
+    assert client.post("/api/auth/login", json={"username": "admin", "password": "wrong"}).status_code == 401
+    assert client.post("/api/auth/login", json={"username": "nobody", "password": "auth"}).status_code == 401
+
+
+@pytest.mark.parametrize("method, path", [
+    ("get", "/api/vc/dashboard"),
+    ("get", "/api/vc/metrics"),
+    ("get", "/api/founder/dashboard"),
+    ("get", "/api/jobs/unknown"),
+    ("post", "/api/valuation/stream"),
+])
+def test_protected_routes_require_a_token(client, method, path):
+    response = getattr(client, method)(path)
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+
+
+def test_protected_routes_accept_a_valid_token(client, vc_headers, founder_headers):
+    assert client.get("/api/vc/dashboard", headers=vc_headers).status_code == 200
+    assert client.get("/api/vc/metrics", headers=vc_headers).status_code == 200
+    assert client.get("/api/founder/dashboard", headers=founder_headers).status_code == 200
+
+
+def test_forged_token_is_rejected(client, vc_headers):
+    forged = {"Authorization": vc_headers["Authorization"][:-2] + "xx"}
+    assert client.get("/api/vc/dashboard", headers=forged).status_code == 401
+
+
+def test_tokens_signed_with_another_key_are_rejected():
+    token = create_access_token({"sub": "u1"}, "other-key", 5)
+    with pytest.raises(TokenError):
+        decode_access_token(token, "secret-key")
+
+
+def test_tokens_use_the_configured_algorithm():
+    verifier = TokenVerifier("secret-key", "HS512")
+    token = verifier.create({"sub": "u1"}, 5)
+    assert verifier.verify(token)["sub"] == "u1"
+    # A token is only accepted under the algorithm it was signed with
+    with pytest.raises(TokenError):
+        decode_access_token(token, "secret-key", "HS256")
+    with pytest.raises(TokenError):
+        TokenVerifier("secret-key", "HS384").verify(token)
+
+
+def test_unsigned_tokens_are_rejected():
+    token = create_access_token({"sub": "u1"}, "secret-key", 5)
+    header = base64.urlsafe_b64encode(b'{"alg":"none","typ":"JWT"}').rstrip(b"=").decode()
+    unsigned = header + "." + token.split(".")[1] + "."
+    with pytest.raises(TokenError):
+        decode_access_token(unsigned, "secret-key")
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "none", "hs256"])
+def test_non_hmac_algorithms_are_refused(algorithm):
+    with pytest.raises(ValueError):
+        TokenVerifier("secret-key", algorithm)
+    with pytest.raises(ValueError):
+        create_access_token({"sub": "u1"}, "secret-key", 5, algorithm)
+
+
+def test_expired_tokens_are_rejected_even_when_cached():
+    verifier = TokenVerifier("secret-key")
+    token = verifier.create({"sub": "u1"}, 5)
+    assert verifier.verify(token)["sub"] == "u1"
+
+    verifier._verified[token]["exp"] = time.time() - 1
+    with pytest.raises(TokenError):
+        verifier.verify(token)
+    with pytest.raises(TokenError):
+        decode_access_token(create_access_token({"sub": "u1"}, "secret-key", -1), "secret-key")
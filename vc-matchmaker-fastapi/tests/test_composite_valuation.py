@@ -0,0 +1,123 @@
+import pytest
+
+from app.services.composite_valuation import MODEL_FACTORS, CompositeValuation, normalize_scores
+from app.services.data_service import DataService
+from app.services.storage import InMemoryStorage
+
+
+def _scores(berkus=None, payne=None):
+    """Every factor of a model at the same score, so the model total is easy to read"""
+    scores = {}
+    if berkus is not None:
+        scores["berkus"] = {factor: berkus for factor in MODEL_FACTORS["berkus"]}
+    if payne is not None:
+        scores["billatyne"] = {factor: payne for factor in MODEL_FACTORS["billatyne"]}
+    return scores
+
+
+def _ids(valuation):
+    return [row["id"] for row in valuation.ranking()]
+
+
+def test_normalize_scores_accepts_analyst_model_names():
+    assert normalize_scores({"berkus_model": {"Prototype": 12}}) == {"berkus": {"Prototype": 12.0}}
+
+
+@pytest.mark.parametrize("scores", [
+    {"vcmethod": {}},
+    {"berkus": {"Moat": 5}},
+    {"berkus": {"Prototype": 21}},
+    {"billatyne": {"Management Team": True}},
+    {"billatyne": [50]},
+])
+def test_normalize_scores_rejects_invalid_scores(scores):
+    with pytest.raises(ValueError):
+        normalize_scores(scores)
+
+
+def test_reweighting_reranks_without_new_scores():
+    # Totals: a = berkus 100 / payne 0, b = berkus 0 / payne 95, c = berkus 50 only
+    valuation = CompositeValuation({
+        "a": _scores(berkus=20, payne=0),
+        "b": _scores(berkus=0, payne=100),
+        "c": _scores(berkus=10),
+    })
+    valuation.set_weights({"berkus": 0.75, "billatyne": 0.25, "risk": 0.5})
+    assert _ids(valuation) == ["a", "c", "b"]
+    # Weights of models without scores (risk) are left out of the mean
+    assert valuation.model_scores("a") == {"id": "a", "compositeScore": 75.0, "modelScores": {"berkus": 100.0, "billatyne": 0.0}}
+    assert valuation.model_scores("c")["compositeScore"] == 50.0
+
+    valuation.set_weights({"berkus": 0.25, "billatyne": 0.75})
+    assert _ids(valuation) == ["b", "c", "a"]
+    assert valuation.model_scores("b")["compositeScore"] == 71.2
+    assert valuation.model_scores("a")["compositeScore"] == 25.0
+
+
+def test_startups_without_weighted_totals_are_not_ranked():
+    incomplete = _scores(berkus=20)
+    del incomplete["berkus"]["Prototype"]
+    valuation = CompositeValuation({"a": _scores(berkus=20), "b": _scores(payne=50), "c": incomplete})
+    valuation.set_weights({"berkus": 1.0, "billatyne": 0.0})
+    assert _ids(valuation) == ["a"]
+    assert valuation.model_scores("b") == {"id": "b", "compositeScore": None, "modelScores": {"billatyne": 47.5}}
+    # A model with a missing factor has no total
+    assert valuation.model_scores("c") == {"id": "c", "compositeScore": None, "modelScores": {}}
+    assert valuation.model_scores("missing") is None
+
+
+def test_set_scores_replaces_a_row_and_grows_the_matrix():
+    valuation = CompositeValuation({})
+    valuation.set_weights({"berkus": 1.0})
+    for i in range(40):
+        valuation.set_scores(f"s{i}", _scores(berkus=i % 21))
+    valuation.set_scores("s0", _scores(berkus=20))
+    ranking = valuation.ranking(limit=3)
+    # Ties keep insertion order
+    assert [row["id"] for row in ranking] == ["s0", "s20", "s19"]
+    assert len(valuation.ranking()) == 40
+
+
+def test_data_service_applies_scores_and_weights():
+    storage = InMemoryStorage()
+    service = DataService(storage=storage)
+    service.set_model_weights({"berkus": 1.0, "billatyne": 1.0})
+    service.save_valuation_scores("a", _scores(berkus=10, payne=100))
+    service.save_valuation_scores("b", _scores(berkus=20, payne=0))
+    assert [row["id"] for row in service.get_valuation_ranking()] == ["a", "b"]
+
+    service.set_model_weights({"berkus": 1.0, "billatyne": 0.0})
+    assert [row["id"] for row in service.get_valuation_ranking()] == ["b", "a"]
+
+    # Scores stored by another worker sharing the storage
+    storage.save_valuation_scores("c", _scores(berkus=15, payne=100))
+    assert [row["id"] for row in service.get_valuation_ranking()] == ["b", "c", "a"]
+
+
+def test_valuation_routes(client, vc_headers):
+    weights = client.get("/api/vc/model-weights", headers=vc_headers).json()
+    high_berkus = {"berkus": {f: 20 for f in MODEL_FACTORS["berkus"]}, "billatyne": {f: 10 for f in MODEL_FACTORS["billatyne"]}}
+    high_payne = {"berkus": {f: 2 for f in MODEL_FACTORS["berkus"]}, "bill_payne_model": {f: 100 for f in MODEL_FACTORS["billatyne"]}}
+    try:
+        saved = client.put("/api/vc/valuations/test-val-a/scores", json=high_berkus, headers=vc_headers).json()
+        assert saved["success"] and saved["modelScores"] == {"berkus": 100.0, "billatyne": 9.5}
+        client.put("/api/vc/valuations/test-val-b/scores", json=high_payne, headers=vc_headers)
+
+        def order():
+            items = client.get("/api/vc/valuations", headers=vc_headers).json()["items"]
+            return [item["id"] for item in items if item["id"].startswith("test-val-")]
+
+        client.post("/api/vc/model-weights", json={"berkus": 1, "billatyne": 0}, headers=vc_headers)
+        assert order() == ["test-val-a", "test-val-b"]
+        response = client.post("/api/vc/model-weights", json={"berkus": 0, "billatyne": 1}, headers=vc_headers).json()
+        assert response["weights"]["billatyne"] == 1.0
+        assert order() == ["test-val-b", "test-val-a"]
+        assert client.get("/api/vc/valuations/test-val-b", headers=vc_headers).json()["compositeScore"] == 95.0
+    finally:
+        client.post("/api/vc/model-weights", json=weights, headers=vc_headers)
+
+    assert client.put("/api/vc/valuations/x/scores", json={"berkus": {"Moat": 1}}, headers=vc_headers).json() == {
+        "error": "Unknown berkus factor: Moat"
+    }
+    assert "error" in client.post("/api/vc/model-weights", json={"alpha": 1}, headers=vc_headers).json()
+    assert "error" in client.get("/api/vc/valuations/not-scored", headers=vc_headers).json()
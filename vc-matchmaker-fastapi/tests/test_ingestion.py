@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import time
+
+import pytest
+
+from app.api.routes.vc import _ingest_upload_job
+from app.services.ingestion import (
+    DocumentIngestor, InsightReducer, TextChunker, UploadTooLarge, extract_chunk_insights
+)
+
+
+async def stream(*blocks: bytes):
+    for block in blocks:
+        yield block
+
+
+def transcript(lines: int) -> bytes:
+    return b"".join(
+        f"In quarter {i} the team closed $2.4M in ARR with 120% net revenue retention. "
+        f"Follow up on churn for cohort {i}.\n".encode()
+        for i in range(lines)
+    )
+
+
+def test_chunker_keeps_all_text_and_cuts_at_boundaries():
+    text = ("First sentence here. " * 50 + "\n\n") * 20 + "é" * 10
+    data = text.encode()
+    chunker = TextChunker(500)
+    chunks = []
+    # Split a multi-byte character across feeds
+    for i in range(0, len(data), 333):
+        chunks.extend(chunker.feed(data[i:i + 333]))
+    chunks.extend(chunker.finish())
+
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    assert all(chunk.endswith((". ", "\n")) for chunk in chunks[:-1])
+
+
+def test_chunk_insights_keep_amounts_whole():
+    insights = extract_chunk_insights("Revenue grew to $2.4M last year. Can you send the cap table?")
+    assert "$2.4M" in insights["metrics"]
+    assert any("$2.4M" in sentence for _, sentence in insights["key_points"])
+    assert insights["follow_ups"] == ["Can you send the cap table?"]
+
+
+def test_reducer_deduplicates_and_orders_by_position():
+    reducer = InsightReducer()
+    point = "Revenue reached $1M ARR with strong growth."
+    reducer.add(1, {"words": 5, "key_points": [(2, point)], "positive": 1, "negative": 0,
+                    "follow_ups": ["Send the model?"], "metrics": ["$1M"]})
+    reducer.add(0, {"words": 5, "key_points": [(2, point)], "positive": 1, "negative": 0,
+                    "follow_ups": ["Send the model?"], "metrics": ["$1M"]})
+    summary = reducer.summary({"name": "Acme"}, "call_transcript")
+    assert summary["key_points"] == [point]
+    assert summary["follow_up_required"] == ["Send the model?"]
+    assert summary["metrics_mentioned"] == ["$1M"]
+    assert summary["sentiment"] == "positive"
+
+
+def test_spool_writes_and_hashes_the_upload(tmp_path):
+    ingestor = DocumentIngestor(tmp_path)
+    upload = asyncio.run(ingestor.spool(stream(b"hello ", b"world"), "s1:transcript", max_bytes=100))
+    assert upload.path.read_bytes() == b"hello world"
+    assert upload.content_hash == hashlib.sha256(b"hello world").hexdigest()
+    assert upload.size_bytes == 11
+
+
+def test_spool_rejects_oversized_uploads_and_cleans_up(tmp_path):
+    ingestor = DocumentIngestor(tmp_path)
+    with pytest.raises(UploadTooLarge):
+        asyncio.run(ingestor.spool(stream(b"x" * 60, b"x" * 60), "s1", max_bytes=100))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_ingest_reuses_chunks_it_has_seen(tmp_path):
+    ingestor = DocumentIngestor(tmp_path, chunk_chars=1000, concurrency=2)
+    document = transcript(200)
+    first = asyncio.run(ingestor.ingest([document]))
+    assert first["chunks"] > 10 and first["chunks_reused"] == 0
+
+    path = tmp_path / "doc.txt"
+    path.write_bytes(document + transcript(5))
+    extended = asyncio.run(ingestor.ingest(ingestor.read_blocks(path)))
+    assert extended["chunks_reused"] >= first["chunks"] - 1
+    summary = extended["reducer"].summary({"name": "Acme"}, "call_transcript")
+    assert "$2.4M" in summary["metrics_mentioned"]
+
+
+def _spooled(tmp_path, content: bytes) -> dict:
+    path = tmp_path / "upload.txt"
+    path.write_bytes(content)
+    return {
+        "path": str(path), "type": "call_transcript", "filename": "call.txt",
+        "content_hash": hashlib.sha256(content).hexdigest(), "size_bytes": len(content),
+    }
+
+
+def test_upload_job_removes_the_file_when_it_fails(tmp_path):
+    upload = _spooled(tmp_path, b"some text")
+    with pytest.raises(ValueError):
+        asyncio.run(_ingest_upload_job("no-such-startup", upload))
+    assert not (tmp_path / "upload.txt").exists()
+
+
+def test_upload_job_keeps_the_file_when_cancelled(tmp_path, monkeypatch):
+    upload = _spooled(tmp_path, b"some text")
+
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr("app.api.routes.vc._ingest_content", hang)
+
+    async def run_and_cancel():
+        task = asyncio.create_task(_ingest_upload_job("s1", upload))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run_and_cancel())
+    assert (tmp_path / "upload.txt").exists()
+
+
+def test_upload_route_ingests_once(client, vc_headers):
+    startup_id = client.get("/api/vc/dashboard", headers=vc_headers).json()["dealflowStages"][0]["deals"][0]["id"]
+    url = f"/api/vc/dealflow/startup/{startup_id}/documents/upload?type=call_transcript"
+    headers = {**vc_headers, "Content-Type": "text/plain"}
+    body = transcript(300)
+
+    response = client.post(url, content=body, headers=headers)
+    assert response.status_code == 202
+    status_url = response.json()["status_url"]
+    deadline = time.monotonic() + 10
+    while (job := client.get(status_url, headers=vc_headers).json())["status"] not in ("succeeded", "failed"):
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    assert job["status"] == "succeeded"
+    assert job["result"]["document"]["content_hash"] == hashlib.sha256(body).hexdigest()
+
+    again = client.post(url, content=body, headers=headers)
+    assert again.json()["skipped"] is True
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.job_queue import InMemoryJobStore, JobQueue, JobQueueFull, JobStore, SQLiteJobStore
+
+
+def wait_for(queue: JobQueue, job_id: str, timeout: float = 5.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish: {queue.get(job_id)}")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryJobStore()
+    return SQLiteJobStore(tmp_path / "jobs.db")
+
+
+@pytest.fixture
+def queue(store):
+    job_queue = JobQueue(store, workers=2, max_pending=10, lease_seconds=0.6)
+    yield job_queue
+    job_queue.stop(timeout=1)
+
+
+def test_store_is_abstract():
+    with pytest.raises(TypeError):
+        JobStore()
+
+
+def test_sync_and_async_handlers_run(queue):
+    async def double(startup_id, payload):
+        await asyncio.sleep(0)
+        return {"value": payload["n"] * 2}
+
+    queue.register("sync", lambda startup_id, payload: {"startup": startup_id})
+    queue.register("async", double)
+    sync_job, created = queue.submit("sync", "s1", {})
+    async_job, _ = queue.submit("async", "s1", {"n": 21})
+
+    assert created
+    assert wait_for(queue, sync_job["id"])["result"] == {"startup": "s1"}
+    assert wait_for(queue, async_job["id"])["result"] == {"value": 42}
+
+
+def test_failures_are_reported(queue):
+    def fail(startup_id, payload):
+        raise ValueError("Startup not found")
+
+    queue.register("fail", fail)
+    job, _ = queue.submit("fail", "s1", {})
+    finished = wait_for(queue, job["id"])
+    assert finished["status"] == "failed"
+    assert finished["error"] == "Startup not found"
+
+
+def test_identical_in_flight_jobs_are_deduplicated(queue):
+    release = threading.Event()
+    queue.register("slow", lambda startup_id, payload: release.wait(5))
+    first, created = queue.submit("slow", "s1", {"a": 1})
+    duplicate, duplicate_created = queue.submit("slow", "s1", {"a": 1})
+    other, other_created = queue.submit("slow", "s1", {"a": 2})
+
+    assert created and other_created and not duplicate_created
+    assert duplicate["id"] == first["id"] != other["id"]
+    release.set()
+    wait_for(queue, first["id"])
+    _, created_again = queue.submit("slow", "s1", {"a": 1})
+    assert created_again
+
+
+def test_unknown_kinds_and_full_queue_are_rejected(store):
+    queue = JobQueue(store, workers=1, max_pending=2)
+    release = threading.Event()
+    queue.register("slow", lambda startup_id, payload: release.wait(5))
+    try:
+        with pytest.raises(ValueError):
+            queue.submit("missing", "s1", {})
+        queue.submit("slow", "s1", {"n": 0})
+        time.sleep(0.1)  # the only worker picks up the first job
+        queue.submit("slow", "s1", {"n": 1})
+        queue.submit("slow", "s1", {"n": 2})
+        with pytest.raises(JobQueueFull):
+            queue.submit("slow", "s1", {"n": 3})
+    finally:
+        release.set()
+        queue.stop(timeout=1)
+
+
+def test_stop_lets_running_sync_handlers_finish_without_rerunning_them(store):
+    calls = []
+
+    def handler(startup_id, payload):
+        calls.append(startup_id)
+        time.sleep(0.3)
+        return {"done": True}
+
+    queue = JobQueue(store, workers=1)
+    queue.register("work", handler)
+    job, _ = queue.submit("work", "s1", {})
+    time.sleep(0.1)
+    queue.stop(timeout=2)
+    assert queue.get(job["id"])["status"] == "succeeded"
+
+    queue.start()
+    time.sleep(0.3)
+    queue.stop(timeout=1)
+    assert calls == ["s1"]
+
+
+def test_stop_requeues_cancelled_async_jobs(tmp_path):
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    started = threading.Event()
+
+    async def slow(startup_id, payload):
+        started.set()
+        await asyncio.sleep(10)
+
+    queue = JobQueue(store, workers=1)
+    queue.register("slow", slow)
+    job, _ = queue.submit("slow", "s1", {})
+    assert started.wait(2)
+    queue.stop(timeout=1)
+    assert queue.get(job["id"])["status"] == "queued"
+
+    # A new process over the same file resumes the job
+    restarted = JobQueue(SQLiteJobStore(tmp_path / "jobs.db"), workers=1)
+    restarted.register("slow", lambda startup_id, payload: {"resumed": True})
+    restarted.start()
+    try:
+        assert wait_for(restarted, job["id"])["result"] == {"resumed": True}
+    finally:
+        restarted.stop(timeout=1)
+
+
+def test_expired_leases_are_reclaimed_while_running(tmp_path):
+    store = SQLiteJobStore(tmp_path / "jobs.db")
+    queue = JobQueue(store, workers=1, lease_seconds=0.3)
+    queue.register("work", lambda startup_id, payload: {"reclaimed": True})
+    queue.start()
+    try:
+        # Claimed by a worker process that then died
+        store.insert({
+            "id": "orphan", "kind": "work", "startup_id": "s1", "dedup_key": "orphan",
+            "payload": {}, "status": "queued", "created_at": time.time(),
+        })
+        store.claim("orphan", time.time() + 0.1)
+        assert wait_for(queue, "orphan")["result"] == {"reclaimed": True}
+    finally:
+        queue.stop(timeout=1)
+
+
+def test_long_jobs_renew_their_lease(queue):
+    calls = []
+
+    def handler(startup_id, payload):
+        calls.append(startup_id)
+        time.sleep(1.2)  # twice the lease
+        return {}
+
+    queue.register("long", handler)
+    job, _ = queue.submit("long", "s1", {})
+    assert wait_for(queue, job["id"])["status"] == "succeeded"
+    assert calls == ["s1"]
+
+
+def test_job_status_route(client, vc_headers):
+    assert client.get("/api/jobs/unknown", headers=vc_headers).status_code == 404
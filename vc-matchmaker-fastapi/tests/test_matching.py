@@ -0,0 +1,94 @@
+import pytest
+
+from app.services.data_service import data_service
+from app.services.matching import VCMatcher, tokenize
+
+
+VCS = [
+    {"name": "Ledger Capital", "investmentThesis": "Fintech payments and banking infrastructure",
+     "sectors": ["Fintech"], "stage": ["Seed", "Series A"], "checkSize": "$1M - $3M", "regions": ["India"]},
+    {"name": "Cure Ventures", "investmentThesis": "Healthcare AI diagnostics and clinical software",
+     "sectors": ["HealthTech"], "stage": ["Series A", "Series B"], "checkSize": "$5M - $10M", "regions": []},
+    {"name": "Grid Partners", "investmentThesis": "Climate energy storage and grid software",
+     "sectors": ["Climate"], "stage": ["Pre-Seed"], "checkSize": "$250K - $500K", "regions": ["Europe"]},
+    {"name": "Generalist Fund", "investmentThesis": "Software companies",
+     "sectors": [], "stage": ["Seed"], "checkSize": "", "regions": []},
+]
+STAGES = ["Pre-Seed", "Seed", "Series A", "Series B"]
+
+FINTECH_FOUNDER = {
+    "industry": "Fintech", "description": "Payments infrastructure for neo banking",
+    "stage": "Seed", "fundingSought": "$2M", "location": "Bengaluru, India"
+}
+
+
+def _names(matches):
+    return [m["name"] for m in matches]
+
+
+def test_tokenize_drops_stopwords_and_single_characters():
+    assert tokenize("The AI-first platform for a B2B market") == ["ai", "first", "platform", "b2b", "market"]
+
+
+def test_top_k_is_the_head_of_the_full_ranking():
+    matcher = VCMatcher(VCS, STAGES)
+    everything = matcher.rank(FINTECH_FOUNDER, k=len(VCS))
+    scores = [m["matchScore"] for m in everything]
+    assert scores == sorted(scores, reverse=True)
+    for k in range(1, len(VCS) + 1):
+        assert _names(matcher.rank(FINTECH_FOUNDER, k=k)) == _names(everything[:k])
+    assert _names(matcher.rank(FINTECH_FOUNDER, k=100)) == _names(everything)
+
+
+@pytest.mark.parametrize("k", [0, -1])
+def test_non_positive_k_returns_nothing(k):
+    assert VCMatcher(VCS, STAGES).rank(FINTECH_FOUNDER, k=k) == []
+
+
+def test_empty_matcher_returns_nothing():
+    assert VCMatcher([]).rank(FINTECH_FOUNDER) == []
+
+
+def test_best_match_fits_thesis_stage_check_size_and_region():
+    best = VCMatcher(VCS, STAGES).rank(FINTECH_FOUNDER, k=1)[0]
+    assert best["name"] == "Ledger Capital"
+    assert best["matchBreakdown"] == {"thesis": 1.0, "stage": 1.0, "checkSize": 1.0, "region": 1.0}
+    assert best["matchScore"] == 100
+    assert best["reasoning"].startswith("Strong fit: thesis aligns")
+
+
+def test_component_scores():
+    matcher = VCMatcher(VCS, STAGES)
+    breakdown = {m["name"]: m["matchBreakdown"] for m in matcher.rank(FINTECH_FOUNDER, k=len(VCS))}
+    # Adjacent stage (Pre-Seed next to Seed), other stages score 0
+    assert breakdown["Grid Partners"]["stage"] == 0.5
+    assert breakdown["Cure Ventures"]["stage"] == 0.5
+    # $2M is 0.6 decades above a $500K ceiling; no parseable range scores 0.5
+    assert breakdown["Grid Partners"]["checkSize"] == pytest.approx(1 - 0.602, abs=1e-3)
+    assert breakdown["Generalist Fund"]["checkSize"] == 0.5
+    # No listed regions matches everywhere
+    assert breakdown["Grid Partners"]["region"] == 0.0
+    assert breakdown["Generalist Fund"]["region"] == 1.0
+
+
+def test_founder_without_details_gets_neutral_components():
+    matches = VCMatcher(VCS, STAGES).rank({}, k=len(VCS))
+    for match in matches:
+        assert match["matchBreakdown"]["thesis"] == 0.0
+        assert match["matchBreakdown"]["stage"] == 0.5
+        assert match["matchBreakdown"]["checkSize"] == 0.5
+
+
+def test_readiness_is_scaled_by_the_match():
+    match = VCMatcher(VCS, STAGES).rank({**FINTECH_FOUNDER, "readinessScore": 80}, k=1)[0]
+    assert match["readinessForThisVC"] == 80
+
+
+def test_matches_route_ranks_the_recommended_vcs(client, founder_headers):
+    vcs = data_service.get_founder_dashboard_data()["recommendedVCs"]
+    response = client.post("/api/founder/matches", params={"k": 2}, json=FINTECH_FOUNDER, headers=founder_headers)
+    assert response.status_code == 200
+    matches = response.json()["matches"]
+    assert len(matches) == min(2, len(vcs))
+    assert matches == data_service.get_vc_matcher().rank(FINTECH_FOUNDER, k=2)
+    assert client.post("/api/founder/matches", params={"k": 0}, json={}, headers=founder_headers).status_code == 422
@@ -0,0 +1,59 @@
+import math
+
+import pytest
+
+from app.services.metrics_parser import EMPTY_METRIC, numeric_columns, parse_amount, parse_metric
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("$1.2M", 1.2e6),
+    ("$500K", 5e5),
+    ("2,500,000", 2.5e6),
+    (".5M", 5e5),
+    ("-$2.5M", -2.5e6),
+    ("−4.2%", -4.2),
+    ("3.5x", 3.5),
+    ("10x faster drug discovery", 10.0),
+    ("$1.2MM", 1.2e6),
+    ("$3 billion", 3e9),
+    ("$4.5 million", 4.5e6),
+    ("5 thousand", 5e3),
+    ("$2Bn", 2e9),
+    ("12 months", 12.0),
+    ("COVID-19 impact $5M", 5e6),
+    ("Q3 revenue $2M", 2e6),
+])
+def test_parse_amount(text, expected):
+    assert parse_amount(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text", ["B2B SaaS", "Q3 portfolio review", "s1", "martin@a16z.com", "N/A", ""])
+def test_numbers_attached_to_words_are_not_amounts(text):
+    assert parse_metric(text) == EMPTY_METRIC
+    assert math.isnan(parse_amount(text))
+
+
+def test_currency_percent_and_period():
+    metric = parse_metric("₹250,400 (52.28%)")
+    assert (metric.value, metric.currency, metric.percent) == (250400.0, "INR", 52.28)
+    assert parse_metric("+35% MoM").period == "month"
+    assert parse_metric("$80K/month").period == "month"
+    assert math.isnan(parse_amount("₹250,400", currency="USD"))
+
+
+@pytest.mark.parametrize("text, low, high", [
+    ("$10M - $20M", 10e6, 20e6),
+    ("$12-15M", 12e6, 15e6),
+    ("10-20%", 10.0, 20.0),
+    ("$1 million to $3 million", 1e6, 3e6),
+])
+def test_ranges(text, low, high):
+    metric = parse_metric(text)
+    assert (metric.low, metric.high) == (pytest.approx(low), pytest.approx(high))
+    assert metric.value == pytest.approx((low + high) / 2)
+
+
+def test_numeric_columns():
+    columns = numeric_columns([{"mrr": "$80K/month", "growth": "+35%"}, {"mrr": "n/a"}], ["mrr", "growth"])
+    assert columns["mrr"][0] == 8e4 and math.isnan(columns["mrr"][1])
+    assert columns["growthPercent"][0] == 35.0
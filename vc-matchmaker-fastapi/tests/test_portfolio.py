@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from app.services.data_service import DataService
+from app.services.metrics_parser import numeric_columns
+from app.services.portfolio import PortfolioEngine
+from app.services.storage import InMemoryStorage
+
+
+HOLDINGS = [
+    {"name": "ALPHA", "qty": 100, "avgCost": "₹10.00", "price": "₹15.00"},
+    {"name": "BETA", "qty": 50, "avgCost": "₹20.00", "price": "₹10.00"},
+]
+
+
+def _engine(holdings=HOLDINGS, prices=None) -> PortfolioEngine:
+    return PortfolioEngine(holdings, numeric_columns(holdings, ["qty", "avgCost", "price"]), prices)
+
+
+def test_rows_and_totals_are_computed_from_qty_cost_and_price():
+    engine = _engine()
+    assert engine.total_cost == 2000.0
+    assert engine.total_value == 2000.0
+    assert engine.holdings() == [
+        {"name": "ALPHA", "qty": 100, "avgCost": "₹10.00", "price": "₹15.00", "pnl": "₹500 (50.00%)", "weight": "75.0%"},
+        {"name": "BETA", "qty": 50, "avgCost": "₹20.00", "price": "₹10.00", "pnl": "₹-500 (-50.00%)", "weight": "25.0%"},
+    ]
+
+    summary = engine.summary({"tvpi": {"label": "TVPI", "value": "9.99"}, "grossIRR": {"value": "28%"}})
+    assert summary["invested"]["value"] == "₹0.0M"
+    assert summary["tvpi"] == {"label": "TVPI", "value": "1.00"}
+    assert summary["grossIRR"] == {"value": "28%"}
+
+
+def test_price_ticks_match_a_full_rebuild():
+    engine = _engine()
+    before = engine.holdings()
+    ticks = [("ALPHA", 12.5), ("BETA", 30.0), ("ALPHA", 18.0)]
+    for name, price in ticks:
+        assert engine.update_price(name, price)
+
+    rebuilt = _engine(prices=dict(ticks))
+    assert engine.total_value == pytest.approx(rebuilt.total_value)
+    assert engine.holdings() == rebuilt.holdings()
+    assert engine.holding("ALPHA")["price"] == "₹18.00"
+    assert engine.holdings() is not before
+
+
+def test_unknown_holdings_are_not_ticked():
+    engine = _engine()
+    assert not engine.update_price("GAMMA", 1.0)
+    assert engine.holding("GAMMA") is None
+    assert engine.total_value == 2000.0
+
+
+def test_recorded_prices_override_the_static_prices():
+    engine = _engine(prices={"BETA": 40.0, "GAMMA": 1.0})
+    assert np.array_equal(engine.price, [15.0, 40.0])
+    assert engine.total_value == 3500.0
+
+
+def test_data_service_applies_ticks_and_picks_up_other_workers_prices():
+    storage = InMemoryStorage()
+    service = DataService(storage=storage)
+    name = service.get_portfolio().names[0]
+
+    assert service.update_holding_price(name, 99.0)
+    assert service.get_holdings_revision() == storage.get_holdings_revision() == 1
+    assert service.get_portfolio().holding(name)["price"].endswith("99.00")
+    assert not service.update_holding_price("NO SUCH HOLDING", 1.0)
+
+    # Another worker sharing the storage records a price
+    storage.set_holding_price(name, 42.0)
+    assert service.get_portfolio().holding(name)["price"].endswith("42.00")
+    assert service.get_holdings_revision() == 2
+
+
+def test_price_route_updates_holdings_and_summary(client, vc_headers):
+    rows = client.get("/api/vc/portfolio/holdings-data", headers=vc_headers).json()
+    name, original = rows[0]["name"], float(rows[0]["price"].lstrip("₹$€£").replace(",", ""))
+    summary = client.get("/api/vc/portfolio", headers=vc_headers).json()
+
+    try:
+        response = client.post(f"/api/vc/portfolio/holdings/{name}/price", json={"price": original * 2}, headers=vc_headers)
+        body = response.json()
+        assert body["success"] and body["holding"]["price"].endswith(f"{original * 2:,.2f}")
+
+        assert client.get("/api/vc/portfolio/holdings-data", headers=vc_headers).json()[0] == body["holding"]
+        assert client.get("/api/vc/portfolio", headers=vc_headers).json()["tvpi"] != summary["tvpi"]
+    finally:
+        client.post(f"/api/vc/portfolio/holdings/{name}/price", json={"price": original}, headers=vc_headers)
+
+    assert client.get("/api/vc/portfolio", headers=vc_headers).json() == summary
+
+
+@pytest.mark.parametrize("price", [-1, "12", True, None])
+def test_price_route_rejects_invalid_prices(client, vc_headers, price):
+    response = client.post("/api/vc/portfolio/holdings/FINTECH/price", json={"price": price}, headers=vc_headers)
+    assert response.json() == {"error": "price must be a non-negative number"}
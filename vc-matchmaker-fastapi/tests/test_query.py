@@ -0,0 +1,58 @@
+import pytest
+
+from app.services.query import RecordIndex, exact_terms
+
+
+def _index(records):
+    return RecordIndex(records, {"stage": lambda r: exact_terms(r.get("stage"))}, sort_key=lambda r: (r["id"],))
+
+
+def test_pages_resume_after_the_last_key_across_rebuilds():
+    records = [{"id": f"d{i}", "stage": "seed" if i % 2 else "series a"} for i in range(10)]
+    page = _index(records).query({}, limit=3)
+    assert [r["id"] for r in page["items"]] == ["d0", "d1", "d2"]
+
+    # d1 is removed and d25 added before the next request
+    rebuilt = _index([r for r in records if r["id"] != "d1"] + [{"id": "d25", "stage": "seed"}])
+    next_page = rebuilt.query({}, cursor=page["next_cursor"], limit=3)
+    assert [r["id"] for r in next_page["items"]] == ["d25", "d3", "d4"]
+
+    filtered = rebuilt.query({"stage": "seed"}, cursor=page["next_cursor"])
+    assert [r["id"] for r in filtered["items"]] == ["d25", "d3", "d5", "d7", "d9"]
+    assert filtered["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "eyJhZnRlciI6IDN9"])  # the second is {"after": 3}
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError):
+        _index([{"id": "d1"}]).query({}, cursor=cursor)
+
+
+def test_dealflow_pages_while_a_deal_is_moved(client, vc_headers):
+    board = client.get("/api/vc/dealflow", headers=vc_headers).json()
+    all_ids = [deal["id"] for stage in board for deal in stage["deals"]]
+    stages = [stage["name"] for stage in board]
+    moved_id, original_stage = board[-1]["deals"][0]["id"], stages[-1]
+
+    seen, cursor, moved = [], None, False
+    try:
+        while True:
+            params = {"limit": 2, "fields": "id"} | ({"cursor": cursor} if cursor else {})
+            page = client.get("/api/vc/dealflow", params=params, headers=vc_headers).json()
+            seen.extend(deal["id"] for deal in page["items"])
+            if not moved:
+                # Move a deal from the last stage to the first, ahead of the pages already served
+                response = client.post(
+                    f"/api/vc/dealflow/startup/{moved_id}/move", json={"stage": stages[0]}, headers=vc_headers
+                )
+                assert response.json()["success"]
+                moved = True
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+    finally:
+        client.post(f"/api/vc/dealflow/startup/{moved_id}/move", json={"stage": original_stage}, headers=vc_headers)
+
+    others = [deal_id for deal_id in all_ids if deal_id != moved_id]
+    assert sorted(deal_id for deal_id in seen if deal_id != moved_id) == sorted(others)
+    assert len(seen) == len(set(seen))
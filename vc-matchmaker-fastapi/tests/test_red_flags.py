@@ -0,0 +1,113 @@
+import pytest
+
+from app.services.data_service import data_service
+from app.services.red_flags import DEFAULT_RED_FLAG, RedFlagReport, generate_red_flags
+
+
+def _baseline_red_flags(startup: dict) -> list:
+    """The imperative checks RED_FLAG_RULES replaced, kept as the reference behaviour"""
+    flags = []
+
+    def flag(severity, name, detail):
+        flags.append({"severity": severity, "flag": name, "detail": detail})
+
+    burn = startup.get("metrics", {}).get("burn", "")
+    if burn and "$" in burn:
+        try:
+            burn_amount = int(burn.replace("$", "").replace("K", "000").replace("/month", "").replace(",", ""))
+            if burn_amount > 200000:
+                flag("high", "High burn rate", f"Burning {burn} may lead to runway issues")
+            elif burn_amount > 100000:
+                flag("medium", "Elevated burn rate", f"Burn rate of {burn} requires close monitoring")
+        except ValueError:
+            pass
+
+    team_size = startup.get("teamSize", 0)
+    if 0 < team_size < 10:
+        flag("medium", "Small team size", f"Team of {team_size} may face scaling challenges")
+    elif team_size == 0:
+        flag("low", "Team size unknown", "Limited team information available for assessment")
+
+    stage = startup.get("stage", "")
+    mrr = startup.get("metrics", {}).get("mrr", "$0")
+    if stage == "Seed" and mrr and "$" in mrr:
+        try:
+            if int(mrr.replace("$", "").replace("K", "000").replace(",", "")) < 50000:
+                flag("medium", "Low traction for stage", f"MRR of {mrr} may be below expectations for {stage} stage")
+        except ValueError:
+            pass
+
+    location = startup.get("location", "")
+    if "India" in location or "Brazil" in location or "Africa" in location:
+        flag("low", "Emerging market risk", "Consider regulatory, currency, and exit liquidity risks")
+
+    fit, team, market = startup.get("fit", 10), startup.get("team", 10), startup.get("market", 10)
+    if fit < 7:
+        flag("high", "Low thesis fit", f"Fit score of {fit}/10 indicates misalignment with investment thesis")
+    elif fit < 8:
+        flag("medium", "Moderate thesis fit", f"Fit score of {fit}/10 suggests partial alignment with investment criteria")
+    if team < 7:
+        flag("high", "Team concerns", f"Team score of {team}/10 indicates potential execution risks")
+    elif team < 8:
+        flag("medium", "Team assessment needed", f"Team score of {team}/10 warrants deeper founder evaluation")
+    if market < 7:
+        flag("high", "Market risk", f"Market score of {market}/10 suggests significant market challenges")
+    elif market < 8:
+        flag("medium", "Market dynamics unclear", f"Market score of {market}/10 requires deeper market analysis")
+    if fit + team + market < 18:
+        flag("high", "Overall low scores", f"Combined score of {fit + team + market}/30 indicates high-risk opportunity")
+
+    title = startup.get("title", "").lower()
+    if "referral" in title or "cold" in title:
+        flag("low", "Source quality", "Deal sourced via referral - validate relationship strength and alignment")
+    if "pilot" in title or "awaiting" in title:
+        flag("medium", "Early stage validation", "Deal requires further validation before advancing")
+
+    return flags or [dict(DEFAULT_RED_FLAG)]
+
+
+def _pipeline():
+    startups = data_service.get_pipeline_startups()
+    assert startups
+    return startups
+
+
+def test_rule_table_matches_the_baseline_for_every_pipeline_startup():
+    startups = _pipeline()
+    report = RedFlagReport(startups)
+    for position, startup in enumerate(startups):
+        expected = _baseline_red_flags(startup)
+        assert report.flags_at(position) == expected, startup.get("id")
+        assert generate_red_flags(startup) == expected, startup.get("id")
+
+
+@pytest.mark.parametrize("startup, flags", [
+    ({"metrics": {"burn": "$250K/month"}, "teamSize": 20}, ["High burn rate"]),
+    ({"metrics": {"burn": "$150,000"}, "teamSize": 20}, ["Elevated burn rate"]),
+    ({"teamSize": 5, "stage": "Seed", "metrics": {"mrr": "$20K"}}, ["Small team size", "Low traction for stage"]),
+    ({"teamSize": 20, "fit": 6, "team": 7.5, "market": 4}, [
+        "Low thesis fit", "Team assessment needed", "Market risk", "Overall low scores"
+    ]),
+    ({"teamSize": 20, "title": "Cold intro, awaiting pilot"}, ["Source quality", "Early stage validation"]),
+    ({"teamSize": 20, "location": "Lagos, Africa"}, ["Emerging market risk"]),
+    ({"teamSize": 20}, ["Standard due diligence required"]),
+])
+def test_rules_agree_with_the_baseline_on_edge_cases(startup, flags):
+    assert [f["flag"] for f in generate_red_flags(startup)] == flags
+    assert generate_red_flags(startup) == _baseline_red_flags(startup)
+
+
+def test_severity_positions_cover_default_flags():
+    report = RedFlagReport([{"teamSize": 20}, {"teamSize": 20, "fit": 5}])
+    assert list(report.positions_with_severity("low")) == [0]
+    assert list(report.positions_with_severity("high")) == [1]
+    assert list(report.positions_with_severity("medium")) == []
+
+
+def test_scan_route_filters_by_severity(client, vc_headers):
+    everything = client.get("/api/vc/dealflow/red-flags", headers=vc_headers).json()
+    assert everything["total"] == len(_pipeline())
+
+    high = client.get("/api/vc/dealflow/red-flags", params={"severity": "high"}, headers=vc_headers).json()
+    expected = {s["id"] for s in _pipeline() if any(f["severity"] == "high" for f in _baseline_red_flags(s))}
+    assert {item["id"] for item in high["items"]} == expected
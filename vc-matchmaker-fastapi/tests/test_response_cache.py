@@ -0,0 +1,195 @@
+import json
+import shutil
+
+import pytest
+
+from app.services.data_service import data_service
+from app.services.response_cache import ResponseCache, _etag_matches, user_response_cache
+
+
+@pytest.fixture
+def data_copy(tmp_path, monkeypatch):
+    """Point data_service at a copy of Data/ and reload the real files afterwards"""
+    original_dir = data_service.data_dir
+    shutil.copytree(original_dir, tmp_path / "Data", ignore=shutil.ignore_patterns("uploads", "*.db*"))
+    monkeypatch.setattr(data_service, "data_dir", tmp_path / "Data")
+    yield tmp_path / "Data"
+    monkeypatch.undo()
+    data_service.reload_files([p.name for p in original_dir.glob("*.json")])
+
+
+def _edit(data_dir, filename, change):
+    path = data_dir / filename
+    data = json.loads(path.read_text(encoding="utf-8"))
+    change(data)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert data_service.reload_files([filename]) == [filename]
+
+
+def _assert_conditional_get(client, url, headers=None):
+    """Fresh 200 with an ETag, then 304 for If-None-Match; returns the ETag"""
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+    assert "Accept-Encoding" in first.headers["vary"]
+
+    not_modified = client.get(url, headers={**(headers or {}), "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert client.get(url, headers={**(headers or {}), "If-None-Match": f'W/{etag}, "other"'}).status_code == 304
+    assert client.get(url, headers={**(headers or {}), "If-None-Match": '"stale"'}).status_code == 200
+    return etag
+
+
+def _assert_encodings(client, url, headers=None):
+    identity = client.get(url, headers={**(headers or {}), "Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+
+    compressed = client.get(url, headers={**(headers or {}), "Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == identity.headers["etag"]
+    # The client decodes the body; fewer bytes went over the wire
+    assert compressed.json() == identity.json()
+    assert compressed.num_bytes_downloaded < identity.num_bytes_downloaded
+
+
+def test_cache_rebuilds_only_when_the_version_changes():
+    cache = ResponseCache(max_entries=2)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"n": len(builds)}
+
+    first = cache.get("key", 1, build)
+    assert cache.get("key", 1, build) is first
+    assert cache.get("key", 2, build) is not first
+    assert len(builds) == 2
+
+    cache.get("other", 1, build)
+    cache.get("third", 1, build)
+    # "key" was the least recently used entry and was evicted
+    cache.get("key", 2, build)
+    assert len(builds) == 5
+
+
+@pytest.mark.parametrize("header, matches", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"x", "abc"', True),
+    ("*", True),
+    ('"abcd"', False),
+])
+def test_etag_matching(header, matches):
+    assert _etag_matches(header, '"abc"') is matches
+
+
+def test_vc_dashboard_conditional_get_and_encoding(client, vc_headers):
+    url = "/api/vc/dashboard?sections=keyMetrics,dealflowStages&fields=id,name"
+    _assert_conditional_get(client, url, vc_headers)
+    _assert_encodings(client, url, vc_headers)
+    body = client.get(url, headers=vc_headers).json()
+    assert set(body) == {"keyMetrics", "dealflowStages"}
+
+
+def test_vc_dashboard_etag_changes_with_a_storage_revision(client, vc_headers):
+    url = "/api/vc/dashboard?sections=dealflowStages&fields=id"
+    etag = _assert_conditional_get(client, url, vc_headers)
+    board = client.get(url, headers=vc_headers).json()["dealflowStages"]
+    deal_id, stage = board[-1]["deals"][0]["id"], board[-1]["name"]
+
+    move = f"/api/vc/dealflow/startup/{deal_id}/move"
+    assert client.post(move, json={"stage": board[0]["name"]}, headers=vc_headers).json()["success"]
+    try:
+        moved = client.get(url, headers={**vc_headers, "If-None-Match": etag})
+        assert moved.status_code == 200
+        assert moved.headers["etag"] != etag
+    finally:
+        client.post(move, json={"stage": stage}, headers=vc_headers)
+    _assert_conditional_get(client, url, vc_headers)
+
+
+def test_vc_dashboard_etag_changes_after_a_data_reload(client, vc_headers, data_copy):
+    url = "/api/vc/dashboard?sections=keyMetrics"
+    etag = _assert_conditional_get(client, url, vc_headers)
+
+    # A reload that does not change the content keeps the ETag valid
+    assert data_service.reload_files(["vc_dashboard.json"]) == ["vc_dashboard.json"]
+    assert client.get(url, headers={**vc_headers, "If-None-Match": etag}).status_code == 304
+
+    _edit(data_copy, "vc_dashboard.json", lambda d: d.update(keyMetrics={"reloaded": True}))
+    response = client.get(url, headers={**vc_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json() == {"keyMetrics": {"reloaded": True}}
+
+
+def test_founder_dashboard_is_cached_per_user(client, founder_headers, vc_headers):
+    url = "/api/founder/dashboard"
+    founder_etag = _assert_conditional_get(client, url, founder_headers)
+    _assert_encodings(client, url, founder_headers)
+    admin_etag = _assert_conditional_get(client, url, vc_headers)
+
+    assert founder_etag != admin_etag
+    assert client.get(url, headers={**vc_headers, "If-None-Match": founder_etag}).status_code == 200
+    keys = {key for key in user_response_cache._entries if key[0] == "founder_dashboard"}
+    assert {("founder_dashboard", "founder"), ("founder_dashboard", "admin")} <= keys
+
+
+def test_founder_dashboard_etag_changes_after_a_data_reload(client, founder_headers, data_copy):
+    url = "/api/founder/dashboard"
+    etag = _assert_conditional_get(client, url, founder_headers)
+
+    _edit(data_copy, "founder_dashboard.json", lambda d: d.update(formSteps=["reloaded"]))
+    response = client.get(url, headers={**founder_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["formSteps"] == ["reloaded"]
+
+
+def test_categories_conditional_get_and_encoding(client):
+    url = "/api/categories/all"
+    _assert_conditional_get(client, url)
+    _assert_encodings(client, url)
+    assert client.get(url).json() == data_service.get_categories()
+
+
+def test_categories_etag_changes_after_a_data_reload(client, data_copy):
+    url = "/api/categories/all"
+    etag = _assert_conditional_get(client, url)
+
+    _edit(data_copy, "categories.json", lambda d: d.update(regions=["Reloaded"]))
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["regions"] == ["Reloaded"]
+    assert client.get("/api/categories/regions").json() == ["Reloaded"]
+
+
+@pytest.mark.parametrize("url, section", [
+    ("/api/vc/metrics", "keyMetrics"),
+    ("/api/vc/models", "weightedModels"),
+    ("/api/vc/portfolio/holdings", "portfolioHoldings"),
+])
+def test_vc_sections_are_served_from_the_cache(client, vc_headers, url, section):
+    _assert_conditional_get(client, url, vc_headers)
+    _assert_encodings(client, url, vc_headers)
+    assert client.get(url, headers=vc_headers).json() == data_service.get_vc_dashboard_data()[section]
+
+
+def test_investment_thesis_etag_changes_with_the_settings_revision(client, vc_headers):
+    url = "/api/vc/investment-thesis"
+    etag = _assert_conditional_get(client, url, vc_headers)
+    original = client.get(url, headers=vc_headers).json()["thesis"]
+    try:
+        client.post(url, json={"thesis": "Cached thesis check"}, headers=vc_headers)
+        response = client.get(url, headers={**vc_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json() == {"thesis": "Cached thesis check"}
+    finally:
+        client.post(url, json={"thesis": original}, headers=vc_headers)
+    assert client.get(url, headers={**vc_headers, "If-None-Match": etag}).status_code == 304
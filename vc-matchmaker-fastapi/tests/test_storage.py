@@ -0,0 +1,102 @@
+import json
+import sqlite3
+
+import pytest
+
+from app.services.storage import InMemoryStorage, SettingsStore, SQLiteStorage, StorageBackend, ValuationScoreStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def storage(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryStorage()
+    return SQLiteStorage(tmp_path / "storage.db", pool_size=2)
+
+
+def test_backend_is_abstract():
+    with pytest.raises(TypeError):
+        StorageBackend()
+
+
+def test_backends_provide_the_settings_and_score_stores(storage):
+    assert isinstance(storage, SettingsStore)
+    assert isinstance(storage, ValuationScoreStore)
+
+
+def test_sourced_startups_are_unique_and_bump_the_revision(storage):
+    assert storage.get_dealflow_revision() == 0
+    assert storage.add_sourced_startup({"id": "s1", "name": "One", "dealflow_stage": "sourced"}) == 1
+    assert storage.add_sourced_startup({"id": "s1", "name": "Duplicate"}) is None
+    assert storage.add_sourced_startup({"id": "s2", "name": "Two", "dealflow_stage": "screening"}) == 2
+    assert [s["id"] for s in storage.get_sourced_startups()] == ["s1", "s2"]
+    assert storage.get_sourced_startup("s1")["name"] == "One"
+    assert storage.get_sourced_startup("missing") is None
+
+
+def test_move_deal_updates_sourced_startups_and_overrides(storage):
+    storage.add_sourced_startup({"id": "s1", "dealflow_stage": "sourced"})
+    revision = storage.move_deal("s1", "diligence")
+    assert revision == storage.get_dealflow_revision() == 2
+    assert [s["id"] for s in storage.get_sourced_startups(stage="diligence")] == ["s1"]
+    assert storage.get_sourced_startups(stage="sourced") == []
+
+    storage.move_deal("static-deal", "term_sheet")
+    assert storage.get_stage_overrides() == {"static-deal": "term_sheet"}
+
+
+def test_deal_notes_and_ingested_documents(storage):
+    assert storage.get_deal_notes("s1") is None
+    storage.save_deal_notes("s1", {"summary": "first"})
+    storage.save_deal_notes("s1", {"summary": "second"})
+    assert storage.get_deal_notes("s1") == {"summary": "second"}
+
+    storage.add_ingested_document("s1", {"id": "d1", "content_hash": "aaa"})
+    storage.add_ingested_document("s1", {"id": "d2"})
+    storage.add_ingested_document("s2", {"id": "d3", "content_hash": "bbb"})
+    assert [d["id"] for d in storage.get_ingested_documents("s1")] == ["d1", "d2"]
+    assert storage.find_ingested_document("s1", "aaa")["id"] == "d1"
+    assert storage.find_ingested_document("s1", "bbb") is None
+    assert storage.find_ingested_document("s2", "bbb")["id"] == "d3"
+
+
+def test_settings_holdings_and_valuations(storage):
+    assert storage.set_setting("investmentThesis", "AI infrastructure") == 1
+    assert storage.get_settings() == {"investmentThesis": "AI infrastructure"}
+    assert storage.get_settings_revision() == 1
+
+    storage.set_holding_price("Acme", 12.5)
+    assert storage.get_holding_prices() == {"Acme": 12.5}
+    assert storage.get_holdings_revision() == 1
+
+    scores = {"berkus": {"Sound Idea": 15.0}}
+    assert storage.save_valuation_scores("s1", scores) == 1
+    assert storage.get_valuation_scores() == {"s1": scores}
+
+
+def test_sqlite_storage_is_shared_and_survives_restarts(tmp_path):
+    path = tmp_path / "storage.db"
+    first = SQLiteStorage(path, pool_size=1)
+    second = SQLiteStorage(path, pool_size=1)
+    first.add_sourced_startup({"id": "s1", "dealflow_stage": "sourced"})
+    first.add_ingested_document("s1", {"id": "d1", "content_hash": "aaa"})
+
+    assert second.get_dealflow_revision() == 1
+    assert second.get_sourced_startup("s1") is not None
+    assert SQLiteStorage(path, pool_size=1).find_ingested_document("s1", "aaa")["id"] == "d1"
+
+
+def test_sqlite_storage_migrates_documents_without_a_hash_column(tmp_path):
+    path = tmp_path / "old.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE ingested_documents (seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "startup_id TEXT NOT NULL, data TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO ingested_documents (startup_id, data) VALUES (?, ?)",
+            ("s1", json.dumps({"id": "d1", "content_hash": "aaa"}))
+        )
+    conn.close()
+
+    storage = SQLiteStorage(path, pool_size=1)
+    assert storage.find_ingested_document("s1", "aaa")["id"] == "d1"
@@ -0,0 +1,112 @@
+import pytest
+
+from app.services.thesis_fit import ThesisScorer, startup_text, thesis_stages
+
+
+STAGES = ["Pre-Seed", "Seed", "Series A", "Series B", "Series C"]
+
+STARTUPS = [
+    {"id": "pay", "name": "PayRail", "industry": "Fintech", "stage": "Seed",
+     "description": "Payments infrastructure for small banks"},
+    {"id": "med", "name": "ScanMed", "industry": "HealthTech", "stage": "Series A",
+     "description": "AI diagnostics for radiology"},
+    {"id": "sun", "name": "SunGrid", "industry": "Climate", "stage": "Series C",
+     "description": "Grid scale solar storage", "highlights": ["utility contracts"]},
+]
+
+
+def _ranked_ids(scorer, limit=None):
+    return [item["id"] for item in scorer.ranking(limit=limit)]
+
+
+@pytest.mark.parametrize("thesis, stages", [
+    ("Seed to Series B fintech", ["Seed", "Series A", "Series B"]),
+    ("pre-seed through seed", ["Pre-Seed", "Seed"]),
+    ("We back Series A and Series C climate companies", ["Series A", "Series C"]),
+    # A reversed range falls back to the stages named
+    ("Series B to Seed", ["Seed", "Series B"]),
+    ("Any great software company", []),
+])
+def test_thesis_stages(thesis, stages):
+    assert thesis_stages(thesis, STAGES) == stages
+
+
+def test_startup_text_joins_text_fields_and_lists():
+    assert startup_text(STARTUPS[2]) == "SunGrid Grid scale solar storage Climate utility contracts"
+
+
+def test_ranking_follows_the_thesis_text_and_stages():
+    scorer = ThesisScorer(STARTUPS, STAGES)
+    scorer.set_thesis("Fintech payments infrastructure at Seed")
+    ranking = scorer.ranking()
+    assert [item["id"] for item in ranking] == ["pay", "med", "sun"]
+    assert ranking[0]["thesisFit"] == 100
+    assert ranking[1]["thesisFit"] == 0
+
+    scorer.set_thesis("Climate solar storage, Series A to Series C")
+    assert _ranked_ids(scorer, limit=2) == ["sun", "med"]
+    # med only gets the stage credit
+    assert scorer.ranking()[1]["thesisFit"] == 20
+
+
+def test_a_thesis_without_stages_gives_no_stage_credit():
+    scorer = ThesisScorer(STARTUPS, STAGES)
+    scorer.set_thesis("radiology")
+    fits = [item["thesisFit"] for item in scorer.ranking()]
+    assert 0 < fits[0] <= 80
+    assert fits[1:] == [0, 0]
+
+
+def test_unknown_terms_are_reported_and_picked_up_when_a_startup_mentions_them():
+    scorer = ThesisScorer(STARTUPS, STAGES)
+    scorer.set_thesis("Robotics and fintech at Seed")
+    # Stage names are not thesis text; "and"/"at" are stopwords
+    assert scorer.unknown_terms == ["robotics"]
+    assert _ranked_ids(scorer)[0] == "pay"
+
+    robot = {"id": "bot", "name": "ArmWorks", "industry": "Robotics", "stage": "Series B"}
+    assert scorer.add_startups([robot, STARTUPS[0]]) == 1
+    assert scorer.unknown_terms == []
+    assert set(_ranked_ids(scorer)[:2]) == {"pay", "bot"}
+    assert scorer.add_startups([robot]) == 0
+
+
+def test_added_startups_are_scored_without_a_rebuild():
+    scorer = ThesisScorer(STARTUPS, STAGES)
+    scorer.set_thesis("diagnostics")
+    scorer.add_startups([{"id": "lab", "name": "LabLens", "description": "Diagnostics", "stage": "Seed"}])
+    ranking = scorer.ranking()
+    assert {item["id"] for item in ranking[:2]} == {"med", "lab"}
+    assert ranking[1]["thesisFit"] > 0
+    assert [item["thesisFit"] for item in ranking[2:]] == [0, 0]
+
+
+def test_setting_the_same_thesis_keeps_the_scores():
+    scorer = ThesisScorer(STARTUPS, STAGES)
+    scorer.set_thesis("solar")
+    before = scorer.ranking()
+    scorer.set_thesis("solar")
+    assert scorer.ranking() == before
+
+
+def test_thesis_routes_report_unknown_terms(client, vc_headers):
+    original = client.get("/api/vc/investment-thesis", headers=vc_headers).json()["thesis"]
+    try:
+        response = client.post(
+            "/api/vc/investment-thesis", json={"thesis": "  Fintech and zzyzxqq  "}, headers=vc_headers
+        ).json()
+        assert response["thesis"] == "Fintech and zzyzxqq"
+        assert response["unknown_terms"] == ["zzyzxqq"]
+        assert len(response["top_matches"]) <= 10
+
+        fit = client.get("/api/vc/thesis-fit", params={"limit": 3}, headers=vc_headers).json()
+        assert fit["thesis"] == "Fintech and zzyzxqq"
+        assert fit["unknown_terms"] == ["zzyzxqq"]
+        assert fit["items"] == response["top_matches"][:3]
+        assert client.get("/api/vc/investment-thesis", headers=vc_headers).json()["thesis"] == fit["thesis"]
+    finally:
+        client.post("/api/vc/investment-thesis", json={"thesis": original}, headers=vc_headers)
+
+    assert client.post("/api/vc/investment-thesis", json={"thesis": " "}, headers=vc_headers).json() == {
+        "error": "thesis must be a non-empty string"
+    }
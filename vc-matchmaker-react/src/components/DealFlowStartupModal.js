@@ -1,4 +1,5 @@
 import React, { useState } from 'react';
+import apiService from '../services/apiService';
 
 const DealFlowStartupModal = ({ startup, onClose, onRefresh }) => {
   const [loading, setLoading] = useState(false);
@@ -11,11 +12,8 @@ const DealFlowStartupModal = ({ startup, onClose, onRefresh }) => {
   const handleGenerateNotes = async () => {
     setLoading(true);
     try {
-      const response = await fetch(`http://localhost:8000/api/vc/dealflow/startup/${startup.id}/generate-notes`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' }
-      });
-      const notes = await response.json();
+      const job = await apiService.generateDealNotes(startup.id);
+      const notes = await apiService.waitForJob(job);
       setDealNotes(notes);
       setActiveTab('notes');
       alert('✓ Deal notes generated successfully!');
@@ -30,12 +28,8 @@ const DealFlowStartupModal = ({ startup, onClose, onRefresh }) => {
   const handleIngestDocuments = async (docType) => {
     setLoading(true);
     try {
-      const response = await fetch(`http://localhost:8000/api/vc/dealflow/startup/${startup.id}/ingest-documents`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ type: docType })
-      });
-      const result = await response.json();
+      const job = await apiService.ingestDocuments(startup.id, { type: docType });
+      const result = await apiService.waitForJob(job);
       setDocuments(prev => [...prev, result.document]);
       setActiveTab('documents');
       alert(`✓ ${docType.replace('_', ' ')} ingested successfully!`);
@@ -1,4 +1,5 @@
 import React, { useState } from 'react';
+import apiService from '../services/apiService';
 
 const RedFlagsTooltip = ({ startup, children }) => {
   const [isVisible, setIsVisible] = useState(false);
@@ -10,7 +11,12 @@ const RedFlagsTooltip = ({ startup, children }) => {
     
     setLoading(true);
     try {
-      const response = await fetch(`http://localhost:8000/api/vc/dealflow/startup/${startup.id}`);
+      const response = await fetch(`http://localhost:8000/api/vc/dealflow/startup/${startup.id}`, {
+        headers: apiService.authHeaders()
+      });
+      if (response.status === 401) {
+        apiService.handleUnauthorized();
+      }
       const data = await response.json();
       setRedFlags(data.red_flags || []);
     } catch (err) {
@@ -1,4 +1,5 @@
 import React, { createContext, useContext, useEffect, useState } from 'react';
+import apiService from '../services/apiService';
 import { login as apiLogin } from '../services/authService';
 
 const AuthContext = createContext({});
@@ -28,6 +29,13 @@ export const AuthProvider = ({ children }) => {
     setLoading(false);
   }, []);
 
+  // apiService clears the stored session when the backend answers 401
+  useEffect(() => {
+    const handleUnauthorized = () => setUser(null);
+    window.addEventListener('auth:unauthorized', handleUnauthorized);
+    return () => window.removeEventListener('auth:unauthorized', handleUnauthorized);
+  }, []);
+
   // Sign up - Not implemented for demo
   const signUp = async (email, password, userData = {}) => {
     setError('Sign up is not available in demo mode');
@@ -7,18 +7,35 @@ class ApiService {
     this.baseURL = process.env.REACT_APP_API_URL || 'http://localhost:8000';
   }
 
+  // Bearer token from the last login (AuthContext stores 'authToken', authService 'token')
+  authHeaders() {
+    const token = localStorage.getItem('authToken') || localStorage.getItem('token');
+    return token ? { Authorization: `Bearer ${token}` } : {};
+  }
+
+  // The token was rejected (expired or signed with another key): drop the session
+  // and let AuthContext clear the user, so ProtectedRoute sends them back to login
+  handleUnauthorized() {
+    ['authToken', 'token', 'user', 'demoUser'].forEach((key) => localStorage.removeItem(key));
+    window.dispatchEvent(new Event('auth:unauthorized'));
+  }
+
   async request(endpoint, options = {}) {
     const url = `${this.baseURL}${endpoint}`;
     const config = {
+      ...options,
       headers: {
         'Content-Type': 'application/json',
+        ...this.authHeaders(),
         ...options.headers,
       },
-      ...options,
     };
 
     try {
       const response = await fetch(url, config);
+      if (response.status === 401 && config.headers.Authorization) {
+        this.handleUnauthorized();
+      }
       if (!response.ok) {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
@@ -136,6 +153,19 @@ class ApiService {
     return this.post(`/api/vc/dealflow/startup/${startupId}/ingest-documents`, documentData);
   }
 
+  // Poll a background job (as returned by generateDealNotes / ingestDocuments) until it finishes
+  async waitForJob(job, { interval = 500, timeout = 120000 } = {}) {
+    if (job.error) throw new Error(job.error);
+    const deadline = Date.now() + timeout;
+    while (Date.now() < deadline) {
+      const status = await this.get(job.status_url);
+      if (status.status === 'succeeded') return status.result;
+      if (status.status === 'failed') throw new Error(status.error || 'Job failed');
+      await new Promise(resolve => setTimeout(resolve, interval));
+    }
+    throw new Error('Timed out waiting for job');
+  }
+
   // ============================================================================
   // FOUNDER DASHBOARD API CALLS
   // ============================================================================